@@ -6,162 +6,220 @@ management operations including listing, creating, completing, modifying,
 and organizing tasks with projects and tags.
 """
 
+import importlib
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 __version__ = version("taskwarrior-mcp")
 
-# Re-export enums
-from taskwarrior_mcp.enums import Priority, ResponseFormat, TaskStatus
+# Submodules are imported lazily so that, for example, importing one model
+# does not build every input schema and register every tool. Type checkers
+# still see the eager imports below.
+if TYPE_CHECKING:
+    # Re-export enums
+    from taskwarrior_mcp.enums import Priority as Priority, ResponseFormat as ResponseFormat, TaskStatus as TaskStatus
 
-# Re-export models
-from taskwarrior_mcp.models import (
-    AddTaskInput,
-    AnnotateTaskInput,
-    BlockedInput,
-    BlockedTaskInfo,
-    BottleneckInfo,
-    BulkGetTasksInput,
-    CompleteTaskInput,
-    ComputedInsights,
-    ContextInput,
-    DeleteTaskInput,
-    DependenciesInput,
-    GetTaskInput,
-    ListProjectsInput,
-    ListTagsInput,
-    ListTasksInput,
-    ModifyTaskInput,
-    OverviewInput,
-    ProjectSummaryInput,
-    ReadyInput,
-    ResolvedDependency,
-    ScoredTask,
-    StartTaskInput,
-    StopTaskInput,
-    SuggestInput,
-    TaskAnnotation,
-    TaskModel,
-    TriageInput,
-    UndoInput,
-)
+    # Re-export models
+    from taskwarrior_mcp.models import (
+        AddTaskInput as AddTaskInput,
+        AnnotateTaskInput as AnnotateTaskInput,
+        BlockedInput as BlockedInput,
+        BlockedTaskInfo as BlockedTaskInfo,
+        BottleneckInfo as BottleneckInfo,
+        BulkGetTasksInput as BulkGetTasksInput,
+        CompleteTaskInput as CompleteTaskInput,
+        ComputedInsights as ComputedInsights,
+        ContextInput as ContextInput,
+        DeleteTaskInput as DeleteTaskInput,
+        DependenciesInput as DependenciesInput,
+        GetTaskInput as GetTaskInput,
+        ListProjectsInput as ListProjectsInput,
+        ListTagsInput as ListTagsInput,
+        ListTasksInput as ListTasksInput,
+        ModifyTaskInput as ModifyTaskInput,
+        OverviewInput as OverviewInput,
+        ProjectSummaryInput as ProjectSummaryInput,
+        ReadyInput as ReadyInput,
+        ResolvedDependency as ResolvedDependency,
+        ScoredTask as ScoredTask,
+        StartTaskInput as StartTaskInput,
+        StopTaskInput as StopTaskInput,
+        SuggestInput as SuggestInput,
+        TaskAnnotation as TaskAnnotation,
+        TaskModel as TaskModel,
+        TriageInput as TriageInput,
+        UndoInput as UndoInput,
+    )
 
-# Re-export MCP server instance
-from taskwarrior_mcp.server import mcp
+    # Re-export MCP server instance
+    from taskwarrior_mcp.server import mcp as mcp
 
-# Re-export tools
-from taskwarrior_mcp.tools import (
-    taskwarrior_add,
-    taskwarrior_annotate,
-    taskwarrior_blocked,
-    taskwarrior_bulk_get,
-    taskwarrior_complete,
-    taskwarrior_context,
-    taskwarrior_delete,
-    taskwarrior_dependencies,
-    taskwarrior_get,
-    taskwarrior_list,
-    taskwarrior_modify,
-    taskwarrior_overview,
-    taskwarrior_project_summary,
-    taskwarrior_projects,
-    taskwarrior_ready,
-    taskwarrior_start,
-    taskwarrior_stop,
-    taskwarrior_suggest,
-    taskwarrior_summary,
-    taskwarrior_tags,
-    taskwarrior_triage,
-    taskwarrior_undo,
-)
+    # Re-export tools
+    from taskwarrior_mcp.tools import (
+        taskwarrior_add as taskwarrior_add,
+        taskwarrior_annotate as taskwarrior_annotate,
+        taskwarrior_blocked as taskwarrior_blocked,
+        taskwarrior_bulk_get as taskwarrior_bulk_get,
+        taskwarrior_complete as taskwarrior_complete,
+        taskwarrior_context as taskwarrior_context,
+        taskwarrior_delete as taskwarrior_delete,
+        taskwarrior_dependencies as taskwarrior_dependencies,
+        taskwarrior_get as taskwarrior_get,
+        taskwarrior_list as taskwarrior_list,
+        taskwarrior_modify as taskwarrior_modify,
+        taskwarrior_overview as taskwarrior_overview,
+        taskwarrior_project_summary as taskwarrior_project_summary,
+        taskwarrior_projects as taskwarrior_projects,
+        taskwarrior_ready as taskwarrior_ready,
+        taskwarrior_start as taskwarrior_start,
+        taskwarrior_stop as taskwarrior_stop,
+        taskwarrior_suggest as taskwarrior_suggest,
+        taskwarrior_summary as taskwarrior_summary,
+        taskwarrior_tags as taskwarrior_tags,
+        taskwarrior_triage as taskwarrior_triage,
+        taskwarrior_undo as taskwarrior_undo,
+    )
 
-# Re-export utilities (including private functions used by tests)
-from taskwarrior_mcp.utils import (
-    _enrich_task_dependencies,
-    _enrich_tasks_dependencies,
-    _format_task_concise,
-    _format_task_markdown,
-    _format_tasks_concise,
-    _format_tasks_markdown,
-    _get_tasks_json,
-    _parse_task,
-    _parse_tasks,
-    _run_task_command,
-)
+    # Re-export utilities (including private functions used by tests)
+    from taskwarrior_mcp.utils import (
+        _decode_export as _decode_export,
+        _enrich_task_dependencies as _enrich_task_dependencies,
+        _enrich_tasks_dependencies as _enrich_tasks_dependencies,
+        _format_task_concise as _format_task_concise,
+        _format_task_markdown as _format_task_markdown,
+        _format_tasks_concise as _format_tasks_concise,
+        _format_tasks_markdown as _format_tasks_markdown,
+        _get_tasks_cached as _get_tasks_cached,
+        _get_tasks_json as _get_tasks_json,
+        _get_tasks_json_async as _get_tasks_json_async,
+        _invalidate_task_cache as _invalidate_task_cache,
+        _parse_task as _parse_task,
+        _parse_task_fast as _parse_task_fast,
+        _parse_tasks as _parse_tasks,
+        _parse_tasks_async as _parse_tasks_async,
+        _parse_tasks_fast as _parse_tasks_fast,
+        _parse_timestamp as _parse_timestamp,
+        _run_task_command as _run_task_command,
+        _run_task_command_async as _run_task_command_async,
+        _run_task_export as _run_task_export,
+        _run_task_export_async as _run_task_export_async,
+    )
 
-__all__ = [
-    # Version
-    "__version__",
-    # Enums
-    "ResponseFormat",
-    "TaskStatus",
-    "Priority",
-    # Task models
-    "TaskAnnotation",
-    "TaskModel",
-    "ResolvedDependency",
-    # Core input models
-    "ListTasksInput",
-    "AddTaskInput",
-    "CompleteTaskInput",
-    "ModifyTaskInput",
-    "DeleteTaskInput",
-    "AnnotateTaskInput",
-    "GetTaskInput",
-    "BulkGetTasksInput",
-    "ListProjectsInput",
-    "ProjectSummaryInput",
-    "ListTagsInput",
-    "OverviewInput",
-    "StartTaskInput",
-    "StopTaskInput",
-    "UndoInput",
-    # Agent intelligence input models
-    "SuggestInput",
-    "ReadyInput",
-    "BlockedInput",
-    "DependenciesInput",
-    "TriageInput",
-    "ContextInput",
-    # Intelligence output models
-    "ScoredTask",
-    "BlockedTaskInfo",
-    "BottleneckInfo",
-    "ComputedInsights",
-    # Utility functions
-    "_run_task_command",
-    "_get_tasks_json",
-    "_parse_task",
-    "_parse_tasks",
-    "_enrich_task_dependencies",
-    "_enrich_tasks_dependencies",
-    "_format_task_concise",
-    "_format_task_markdown",
-    "_format_tasks_concise",
-    "_format_tasks_markdown",
-    # Core tools
-    "taskwarrior_list",
-    "taskwarrior_add",
-    "taskwarrior_complete",
-    "taskwarrior_modify",
-    "taskwarrior_delete",
-    "taskwarrior_get",
-    "taskwarrior_bulk_get",
-    "taskwarrior_annotate",
-    "taskwarrior_start",
-    "taskwarrior_stop",
-    "taskwarrior_projects",
-    "taskwarrior_project_summary",
-    "taskwarrior_tags",
-    "taskwarrior_undo",
-    "taskwarrior_summary",
-    "taskwarrior_overview",
-    # Intelligence tools
-    "taskwarrior_suggest",
-    "taskwarrior_ready",
-    "taskwarrior_blocked",
-    "taskwarrior_dependencies",
-    "taskwarrior_triage",
-    "taskwarrior_context",
-    # MCP server instance
-    "mcp",
-]
+# Public name -> submodule that defines it, imported on first access (PEP 562)
+_LAZY: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "Priority",
+            "ResponseFormat",
+            "TaskStatus",
+        ),
+        "taskwarrior_mcp.enums",
+    ),
+    **dict.fromkeys(
+        (
+            "AddTaskInput",
+            "AnnotateTaskInput",
+            "BlockedInput",
+            "BlockedTaskInfo",
+            "BottleneckInfo",
+            "BulkGetTasksInput",
+            "CompleteTaskInput",
+            "ComputedInsights",
+            "ContextInput",
+            "DeleteTaskInput",
+            "DependenciesInput",
+            "GetTaskInput",
+            "ListProjectsInput",
+            "ListTagsInput",
+            "ListTasksInput",
+            "ModifyTaskInput",
+            "OverviewInput",
+            "ProjectSummaryInput",
+            "ReadyInput",
+            "ResolvedDependency",
+            "ScoredTask",
+            "StartTaskInput",
+            "StopTaskInput",
+            "SuggestInput",
+            "TaskAnnotation",
+            "TaskModel",
+            "TriageInput",
+            "UndoInput",
+        ),
+        "taskwarrior_mcp.models",
+    ),
+    "mcp": "taskwarrior_mcp.server",
+    **dict.fromkeys(
+        (
+            "taskwarrior_add",
+            "taskwarrior_annotate",
+            "taskwarrior_blocked",
+            "taskwarrior_bulk_get",
+            "taskwarrior_complete",
+            "taskwarrior_context",
+            "taskwarrior_delete",
+            "taskwarrior_dependencies",
+            "taskwarrior_get",
+            "taskwarrior_list",
+            "taskwarrior_modify",
+            "taskwarrior_overview",
+            "taskwarrior_project_summary",
+            "taskwarrior_projects",
+            "taskwarrior_ready",
+            "taskwarrior_start",
+            "taskwarrior_stop",
+            "taskwarrior_suggest",
+            "taskwarrior_summary",
+            "taskwarrior_tags",
+            "taskwarrior_triage",
+            "taskwarrior_undo",
+        ),
+        "taskwarrior_mcp.tools",
+    ),
+    **dict.fromkeys(
+        (
+            "_decode_export",
+            "_enrich_task_dependencies",
+            "_enrich_tasks_dependencies",
+            "_format_task_concise",
+            "_format_task_markdown",
+            "_format_tasks_concise",
+            "_format_tasks_markdown",
+            "_get_tasks_cached",
+            "_get_tasks_json",
+            "_get_tasks_json_async",
+            "_invalidate_task_cache",
+            "_parse_task",
+            "_parse_task_fast",
+            "_parse_tasks",
+            "_parse_tasks_async",
+            "_parse_tasks_fast",
+            "_parse_timestamp",
+            "_run_task_command",
+            "_run_task_command_async",
+            "_run_task_export",
+            "_run_task_export_async",
+        ),
+        "taskwarrior_mcp.utils",
+    ),
+}
+
+__all__ = ["__version__", *_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining `name` on first access and cache the attribute."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name == "mcp":
+        # The server is only useful with its tools registered on it
+        importlib.import_module("taskwarrior_mcp.tools")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily loaded names alongside those already imported."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,19 +1,50 @@
 """Input models for Taskwarrior MCP tools."""
 
+from typing import Annotated, Literal
+
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from taskwarrior_mcp.enums import Priority, ResponseFormat, TaskStatus
 
+# A numeric task ID, or a full UUID or a prefix of one (dashes included, as
+# Taskwarrior matches them) of at least 8 characters. Anything else (ranges,
+# tags, filters, rc overrides) is rejected at validation, before a Taskwarrior
+# process is spawned for it.
+_TASK_ID_PATTERN = (
+    r"^([0-9]+|[0-9A-Fa-f]{8}((-[0-9A-Fa-f]{4}){0,2}-[0-9A-Fa-f]{1,4}|(-[0-9A-Fa-f]{4}){3}-[0-9A-Fa-f]{1,12})?)$"
+)
+
+# Field types shared by several models. Each model still gives its own
+# description (and default, where it has one) with `Field`.
+_TaskId = Annotated[str, Field(min_length=1, pattern=_TASK_ID_PATTERN)]
+_ResponseFormatField = Annotated[
+    ResponseFormat,
+    Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
+    ),
+]
+
+
+class _StrippedInput(BaseModel):
+    """
+    Base for tool input models.
+
+    Strings are stripped of surrounding whitespace, unknown fields are
+    rejected, and instances are immutable once validated.
+    """
+
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
+
+
 # ============================================================================
 # Core Tool Input Models
 # ============================================================================
 
 
-class ListTasksInput(BaseModel):
+class ListTasksInput(_StrippedInput):
     """Input model for listing tasks."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     filter: str | None = Field(
         default=None,
         description="Taskwarrior filter expression (e.g., 'project:work', '+urgent', 'due:today')",
@@ -23,17 +54,12 @@ class ListTasksInput(BaseModel):
         description="Filter by task status: pending, completed, deleted, or all",
     )
     limit: int | None = Field(default=50, description="Maximum number of tasks to return", ge=1, le=500)
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
-    )
+    response_format: _ResponseFormatField
 
 
-class AddTaskInput(BaseModel):
+class AddTaskInput(_StrippedInput):
     """Input model for adding a new task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     description: str = Field(..., description="Task description (required)", min_length=1, max_length=1000)
     project: str | None = Field(default=None, description="Project name to assign the task to")
     priority: Priority | None = Field(default=None, description="Task priority: H (high), M (medium), L (low)")
@@ -46,103 +72,75 @@ class AddTaskInput(BaseModel):
     )
     depends: str | None = Field(default=None, description="Task ID(s) this task depends on (comma-separated)")
 
-    @field_validator("description")
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("Description cannot be empty")
-        return v.strip()
 
-
-class CompleteTaskInput(BaseModel):
+class CompleteTaskInput(_StrippedInput):
     """Input model for completing a task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str = Field(..., description="Task ID or UUID to complete", min_length=1)
+    task_id: _TaskId = Field(..., description="Task ID or UUID to complete")
 
 
-class ModifyTaskInput(BaseModel):
+class ModifyTaskInput(_StrippedInput):
     """Input model for modifying a task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str = Field(..., description="Task ID or UUID to modify", min_length=1)
+    task_id: _TaskId = Field(..., description="Task ID or UUID to modify")
     description: str | None = Field(default=None, description="New task description")
     project: str | None = Field(default=None, description="New project name (use empty string to remove)")
-    priority: str | None = Field(default=None, description="New priority: H, M, L, or empty to remove")
+    priority: Priority | None = Field(default=None, description="New priority: H, M, L, or empty to remove")
     due: str | None = Field(default=None, description="New due date (use empty string to remove)")
     add_tags: list[str] | None = Field(default=None, description="Tags to add (without '+' prefix)")
     remove_tags: list[str] | None = Field(default=None, description="Tags to remove (without '-' prefix)")
 
 
-class DeleteTaskInput(BaseModel):
+class DeleteTaskInput(_StrippedInput):
     """Input model for deleting a task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str = Field(..., description="Task ID or UUID to delete", min_length=1)
+    task_id: _TaskId = Field(..., description="Task ID or UUID to delete")
 
 
-class AnnotateTaskInput(BaseModel):
+class AnnotateTaskInput(_StrippedInput):
     """Input model for adding an annotation to a task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str = Field(..., description="Task ID or UUID to annotate", min_length=1)
+    task_id: _TaskId = Field(..., description="Task ID or UUID to annotate")
     annotation: str = Field(..., description="Annotation text to add", min_length=1, max_length=2000)
 
 
-class GetTaskInput(BaseModel):
+class GetTaskInput(_StrippedInput):
     """Input model for getting a single task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str = Field(..., description="Task ID or UUID to retrieve", min_length=1)
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
-    )
+    task_id: _TaskId = Field(..., description="Task ID or UUID to retrieve")
+    response_format: _ResponseFormatField
 
 
-class BulkGetTasksInput(BaseModel):
+class BulkGetTasksInput(_StrippedInput):
     """Input model for getting multiple tasks at once."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_ids: list[str] = Field(..., description="List of task IDs or UUIDs to retrieve", min_length=1, max_length=50)
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
+    task_ids: list[_TaskId] = Field(
+        ..., description="List of task IDs or UUIDs to retrieve", min_length=1, max_length=50
     )
+    response_format: _ResponseFormatField
 
-    @field_validator("task_ids")
+    @field_validator("task_ids", mode="before")
     @classmethod
-    def validate_task_ids(cls, v: list[str]) -> list[str]:
-        if not v:
-            raise ValueError("At least one task ID is required")
-        cleaned = [tid.strip() for tid in v if tid.strip()]
+    def validate_task_ids(cls, v: object) -> object:
+        # Blank IDs are dropped before each remaining item is stripped and
+        # checked against the task ID pattern
+        if not isinstance(v, list):
+            return v
+        cleaned = [tid for tid in v if not isinstance(tid, str) or tid.strip()]
         if not cleaned:
             raise ValueError("At least one valid task ID is required")
         return cleaned
 
 
-class ListProjectsInput(BaseModel):
+class ListProjectsInput(_StrippedInput):
     """Input model for listing projects."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
-    )
+    response_format: _ResponseFormatField
 
 
-class ProjectSummaryInput(BaseModel):
+class ProjectSummaryInput(_StrippedInput):
     """Input model for project summary."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     project: str | None = Field(
         default=None,
         description="Specific project to summarize, or None for all projects",
@@ -151,28 +149,18 @@ class ProjectSummaryInput(BaseModel):
         default=False,
         description="Include completed task statistics",
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
-    )
+    response_format: _ResponseFormatField
 
 
-class ListTagsInput(BaseModel):
+class ListTagsInput(_StrippedInput):
     """Input model for listing tags."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
-    )
+    response_format: _ResponseFormatField
 
 
-class OverviewInput(BaseModel):
+class OverviewInput(_StrippedInput):
     """Input model for getting a consolidated task overview."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     include_projects: bool = Field(
         default=True,
         description="Include project breakdown",
@@ -181,32 +169,24 @@ class OverviewInput(BaseModel):
         default=True,
         description="Include tag breakdown",
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' or 'json'",
-    )
+    response_format: _ResponseFormatField
 
 
-class StartTaskInput(BaseModel):
+class StartTaskInput(_StrippedInput):
     """Input model for starting a task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str = Field(..., description="Task ID or UUID to start", min_length=1)
+    task_id: _TaskId = Field(..., description="Task ID or UUID to start")
 
 
-class StopTaskInput(BaseModel):
+class StopTaskInput(_StrippedInput):
     """Input model for stopping a task."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    task_id: _TaskId = Field(..., description="Task ID or UUID to stop")
 
-    task_id: str = Field(..., description="Task ID or UUID to stop", min_length=1)
 
-
-class UndoInput(BaseModel):
+class UndoInput(_StrippedInput):
     """Input model for undo operation."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
     # No parameters needed - undo is a global operation
 
 
@@ -215,84 +195,62 @@ class UndoInput(BaseModel):
 # ============================================================================
 
 
-class SuggestInput(BaseModel):
+class SuggestInput(_StrippedInput):
     """Input model for smart task suggestions."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     limit: int = Field(default=5, description="Maximum number of suggestions to return", ge=1, le=20)
     context: str | None = Field(
         default=None,
         description="Context: 'quick_wins', 'blockers', 'deadlines', or None for balanced",
     )
     project: str | None = Field(default=None, description="Filter suggestions to a specific project")
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN, description="Output format: 'markdown' or 'json'"
-    )
+    response_format: _ResponseFormatField
 
 
-class ReadyInput(BaseModel):
+class ReadyInput(_StrippedInput):
     """Input model for listing ready (unblocked) tasks."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     limit: int = Field(default=10, description="Maximum number of tasks to return", ge=1, le=50)
     project: str | None = Field(default=None, description="Filter to a specific project")
-    priority: str | None = Field(default=None, description="Filter by priority: H, M, or L")
+    priority: Priority | None = Field(default=None, description="Filter by priority: H, M, or L")
     include_active: bool = Field(default=True, description="Include tasks that are already started")
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN, description="Output format: 'markdown' or 'json'"
-    )
+    response_format: _ResponseFormatField
 
 
-class BlockedInput(BaseModel):
+class BlockedInput(_StrippedInput):
     """Input model for listing blocked tasks."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     limit: int = Field(default=10, description="Maximum number of blocked tasks to return", ge=1, le=50)
     show_blockers: bool = Field(default=True, description="Show which tasks are blocking each blocked task")
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN, description="Output format: 'markdown' or 'json'"
-    )
+    response_format: _ResponseFormatField
 
 
-class DependenciesInput(BaseModel):
+class DependenciesInput(_StrippedInput):
     """Input model for dependency graph analysis."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str | None = Field(default=None, description="Specific task ID to analyze, or None for overview")
-    direction: str = Field(default="both", description="Direction: 'blocks', 'blocked_by', or 'both'")
-    depth: int = Field(default=3, description="How deep to traverse the dependency tree", ge=1, le=10)
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN, description="Output format: 'markdown' or 'json'"
+    task_id: _TaskId | None = Field(default=None, description="Specific task ID to analyze, or None for overview")
+    direction: Literal["blocks", "blocked_by", "both"] = Field(
+        default="both", description="Direction: 'blocks', 'blocked_by', or 'both'"
     )
+    depth: int = Field(default=3, description="How deep to traverse the dependency tree", ge=1, le=10)
+    response_format: _ResponseFormatField
 
 
-class TriageInput(BaseModel):
+class TriageInput(_StrippedInput):
     """Input model for task triage/review."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     stale_days: int = Field(default=14, description="Number of days before a task is considered stale", ge=1, le=365)
     include_untagged: bool = Field(default=True, description="Include tasks with no tags")
     include_no_project: bool = Field(default=True, description="Include tasks not assigned to a project")
     include_no_due: bool = Field(default=True, description="Include tasks with no due date")
     limit: int = Field(default=20, description="Maximum items per category", ge=1, le=100)
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN, description="Output format: 'markdown' or 'json'"
-    )
+    response_format: _ResponseFormatField
 
 
-class ContextInput(BaseModel):
+class ContextInput(_StrippedInput):
     """Input model for rich task context."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    task_id: str = Field(..., description="Task ID or UUID to get context for", min_length=1)
+    task_id: _TaskId = Field(..., description="Task ID or UUID to get context for")
     include_related: bool = Field(default=True, description="Include related tasks from the same project")
     include_activity: bool = Field(default=True, description="Include recent activity information")
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN, description="Output format: 'markdown' or 'json'"
-    )
+    response_format: _ResponseFormatField
@@ -11,6 +11,8 @@ class ScoredTask(BaseModel):
     task: TaskModel
     score: float
     reasons: list[str]
+    # Bit set mirroring `reasons` for cheap filtering; not part of tool output
+    flags: int = Field(default=0, exclude=True)
 
 
 class BlockedTaskInfo(BaseModel):
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+import sys
+from functools import cached_property
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, SerializerFunctionWrapHandler, field_validator, model_serializer
 
 
 class TaskAnnotation(BaseModel):
@@ -28,7 +32,7 @@ class ResolvedDependency(BaseModel):
 class TaskModel(BaseModel):
     """Model representing a Taskwarrior task with all its attributes."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore")
 
     id: int | None = None
     uuid: str | None = None
@@ -48,3 +52,36 @@ class TaskModel(BaseModel):
     # Resolved dependency fields (populated by enrichment)
     depends_on: list[ResolvedDependency] = Field(default_factory=list)
     blocked_by_pending: int = 0
+
+    # Exported attributes without a field above (recur, wait, UDAs, ...),
+    # filled by the parsers in utils/parsers.py. Serialized back as top-level
+    # keys, as Taskwarrior exports them.
+    extra: dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator("depends", mode="before")
+    @classmethod
+    def validate_depends(cls, v: Any) -> Any:
+        """Accept Taskwarrior 2.6+ array form of depends as a comma-separated string."""
+        if isinstance(v, list):
+            return ",".join(v)
+        return v
+
+    @model_serializer(mode="wrap")
+    def serialize_extra_flat(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        """Serialize `extra` entries as top-level keys, leaving out the empty `extra` key."""
+        data: dict[str, Any] = handler(self)
+        if extra := data.pop("extra", None):
+            data.update(extra)
+        return data
+
+    @cached_property
+    def depends_uuids(self) -> tuple[str, ...]:
+        """
+        Dependency UUIDs parsed from `depends`, computed once per task.
+
+        The UUIDs are interned, like `uuid` on parsed exports, so looking a
+        dependency up in a UUID-keyed mapping matches on identity.
+        """
+        if not self.depends:
+            return ()
+        return tuple(sys.intern(d) for d in (part.strip() for part in self.depends.split(",")) if d)
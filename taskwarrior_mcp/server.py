@@ -8,6 +8,9 @@ mcp = FastMCP("taskwarrior_mcp")
 
 def run() -> None:
     """Run the MCP server."""
+    # Tools register themselves on `mcp` when their modules are imported
+    import taskwarrior_mcp.tools  # noqa: F401
+
     mcp.run()
 
 
@@ -1,7 +1,10 @@
 """Core MCP tool definitions for Taskwarrior."""
 
-import json
-import shlex
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import chain, groupby
+from operator import itemgetter
 
 from mcp.types import ToolAnnotations
 
@@ -23,20 +26,103 @@ from taskwarrior_mcp.models.inputs import (
     StopTaskInput,
     UndoInput,
 )
+from taskwarrior_mcp.models.task import TaskModel
 from taskwarrior_mcp.server import mcp
-from taskwarrior_mcp.utils.cli import _get_tasks_json, _run_task_command
+from taskwarrior_mcp.utils.cache import (
+    _get_task_aggregates,
+    _get_task_index,
+    _get_task_records_cached,
+    _get_tasks_by_uuid,
+    _get_tasks_cached,
+    _invalidate_task_cache,
+)
+from taskwarrior_mcp.utils.cli import _run_task_command_async
 from taskwarrior_mcp.utils.formatters import (
+    _dump_json,
+    _dump_tasks_json,
     _format_task_concise,
     _format_task_markdown,
     _format_tasks_concise,
     _format_tasks_markdown,
 )
+from taskwarrior_mcp.utils.index import _TaskIndex
 from taskwarrior_mcp.utils.parsers import (
+    _enrich_task_dependencies,
     _enrich_tasks_dependencies,
-    _parse_task,
-    _parse_tasks,
+    _parse_task_fast,
+    _parse_tasks_async,
+    _parse_timestamp,
 )
 
+# Per-project counters reported by taskwarrior_project_summary; copied for each
+# project, never modified itself
+_EMPTY_PROJECT_DATA: dict[str, int] = {
+    "pending": 0,
+    "completed": 0,
+    "active": 0,
+    "overdue": 0,
+    "due_today": 0,
+    "due_this_week": 0,
+    "priority_h": 0,
+    "priority_m": 0,
+    "priority_l": 0,
+    "no_priority": 0,
+}
+_PRIORITY_COUNTER = {"H": "priority_h", "M": "priority_m", "L": "priority_l"}
+
+# taskwarrior_list title suffix per status; the default (pending) has none
+_STATUS_SUFFIX = {status: "" if status == TaskStatus.PENDING else f" ({status.value})" for status in TaskStatus}
+
+# Attributes read by the aggregate tools (projects, tags, summaries), which
+# only report counts and never return task records.
+_AGGREGATE_FIELDS = frozenset({"id", "uuid", "status", "project", "priority", "tags", "start", "due"})
+
+
+def _is_numeric_id(task_id: str) -> bool:
+    """Whether `task_id` is a working-set ID; `str.isdigit` alone also accepts digits like "²" that `int` rejects."""
+    return task_id.isascii() and task_id.isdigit()
+
+
+def _id_list(ids: list[int]) -> str:
+    """
+    Taskwarrior ID list for `ids`, with consecutive IDs collapsed into ranges.
+
+    Example: [3, 1, 2, 7] -> "1-3,7"
+    """
+    parts = []
+    for _, run in groupby(enumerate(sorted(set(ids))), key=lambda pair: pair[1] - pair[0]):
+        first, *rest = (task_id for _, task_id in run)
+        parts.append(f"{first}-{rest[-1]}" if rest else str(first))
+    return ",".join(parts)
+
+
+def _format_project_block(name: str, data: dict[str, int], include_completed: bool) -> str:
+    """Markdown section for one project in taskwarrior_project_summary, ending in a blank line."""
+    lines = [f"## {name}", "", f"**Pending Tasks**: {data['pending']}"]
+
+    if include_completed:
+        lines.append(f"**Completed Tasks**: {data['completed']}")
+
+    if data["active"] > 0:
+        lines.append(f"**Active (in progress)**: {data['active']}")
+
+    # Due dates
+    if data["overdue"] > 0 or data["due_today"] > 0 or data["due_this_week"] > 0:
+        lines.extend(("", "**Due Dates**:"))
+        if data["overdue"] > 0:
+            lines.append(f"- ⚠️ Overdue: {data['overdue']}")
+        if data["due_today"] > 0:
+            lines.append(f"- 📅 Due today: {data['due_today']}")
+        if data["due_this_week"] > 0:
+            lines.append(f"- 📆 Due this week: {data['due_this_week']}")
+
+    # Priority breakdown
+    lines.append(
+        f"\n**Priority**:\n- High: {data['priority_h']}\n- Medium: {data['priority_m']}\n"
+        f"- Low: {data['priority_l']}\n- None: {data['no_priority']}\n"
+    )
+    return "\n".join(lines)
+
 
 @mcp.tool(
     name="taskwarrior_list",
@@ -84,35 +170,31 @@ async def taskwarrior_list(params: ListTasksInput) -> str:
         - List tasks due today: params with filter="due:today"
         - List completed tasks: params with status="completed"
     """
-    success, result = _get_tasks_json(params.filter, params.status)
+    # The cached index gives the export and its UUID mapping without copying or
+    # rescanning the full task list on every call
+    success, result = await _get_task_index(params.filter, params.status)
 
-    if not success:
+    if not success or not isinstance(result, _TaskIndex):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    tasks = _parse_tasks(raw_tasks)
-    tasks = _enrich_tasks_dependencies(tasks)  # Resolve dependency UUIDs
-    total_count = len(tasks)
+    all_tasks = result.tasks
+    total_count = len(all_tasks)
 
-    if params.limit and len(tasks) > params.limit:
-        tasks = tasks[: params.limit]
+    # Dependencies resolve against every exported task, but only the page
+    # that is returned gets enriched
+    page = all_tasks[: params.limit] if params.limit else all_tasks
+    tasks = _enrich_tasks_dependencies(page, uuid_to_task=result.uuid_to_task)
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(
-            {"total": total_count, "count": len(tasks), "tasks": [t.model_dump() for t in tasks]},
-            indent=2,
-        )
-
-    title = "Tasks"
-    if params.filter:
-        title = f"Tasks matching '{params.filter}'"
-    if params.status != TaskStatus.PENDING:
-        title += f" ({params.status.value})"
+        # Compact: task lists are the largest responses, and indentation
+        # would roughly double their size
+        return _dump_json({"total": total_count, "count": len(tasks), "tasks": tasks}, indent=None)
 
     if params.response_format == ResponseFormat.CONCISE:
         return _format_tasks_concise(tasks, params.filter)
 
-    return _format_tasks_markdown(tasks, title)
+    title = f"Tasks matching '{params.filter}'" if params.filter else "Tasks"
+    return _format_tasks_markdown(tasks, title + _STATUS_SUFFIX[params.status])
 
 
 @mcp.tool(
@@ -150,27 +232,28 @@ async def taskwarrior_add(params: AddTaskInput) -> str:
         - Task with due date: params with description="Submit report", due="friday"
         - Task with tags: params with description="Call mom", tags=["personal", "important"]
     """
-    args = [shlex.quote(params.description)]
+    args = [params.description]
 
     if params.project:
-        args.append(f"project:{shlex.quote(params.project)}")
+        args.append(f"project:{params.project}")
 
     if params.priority and params.priority.value:
         args.append(f"priority:{params.priority.value}")
 
     if params.due:
-        args.append(f"due:{shlex.quote(params.due)}")
+        args.append(f"due:{params.due}")
 
     if params.tags:
         for tag in params.tags:
-            args.append(f"+{shlex.quote(tag)}")
+            args.append(f"+{tag}")
 
     if params.depends:
-        args.append(f"depends:{shlex.quote(params.depends)}")
+        args.append(f"depends:{params.depends}")
 
     args.append("rc.confirmation=off")
 
-    success, output = _run_task_command(["add"] + args)
+    success, output = await _run_task_command_async(["add"] + args)
+    _invalidate_task_cache()
 
     if success:
         return f"Task created successfully.\n{output}"
@@ -204,7 +287,8 @@ async def taskwarrior_complete(params: CompleteTaskInput) -> str:
         - Complete by UUID: params with task_id="a1b2c3d4"
     """
     args = [params.task_id, "done", "rc.confirmation=off"]
-    success, output = _run_task_command(args)
+    success, output = await _run_task_command_async(args)
+    _invalidate_task_cache()
 
     if success:
         return f"Task {params.task_id} marked as complete.\n{output}"
@@ -254,37 +338,36 @@ async def taskwarrior_modify(params: ModifyTaskInput) -> str:
     args = [params.task_id, "modify"]
 
     if params.description is not None:
-        args.append(shlex.quote(params.description))
+        args.append(params.description)
 
     if params.project is not None:
         if params.project == "":
             args.append("project:")
         else:
-            args.append(f"project:{shlex.quote(params.project)}")
+            args.append(f"project:{params.project}")
 
     if params.priority is not None:
-        if params.priority == "":
-            args.append("priority:")
-        else:
-            args.append(f"priority:{params.priority}")
+        # Priority.NONE is "", which clears the priority
+        args.append(f"priority:{params.priority.value}")
 
     if params.due is not None:
         if params.due == "":
             args.append("due:")
         else:
-            args.append(f"due:{shlex.quote(params.due)}")
+            args.append(f"due:{params.due}")
 
     if params.add_tags:
         for tag in params.add_tags:
-            args.append(f"+{shlex.quote(tag)}")
+            args.append(f"+{tag}")
 
     if params.remove_tags:
         for tag in params.remove_tags:
-            args.append(f"-{shlex.quote(tag)}")
+            args.append(f"-{tag}")
 
     args.append("rc.confirmation=off")
 
-    success, output = _run_task_command(args)
+    success, output = await _run_task_command_async(args)
+    _invalidate_task_cache()
 
     if success:
         return f"Task {params.task_id} modified successfully.\n{output}"
@@ -318,7 +401,8 @@ async def taskwarrior_delete(params: DeleteTaskInput) -> str:
         - Delete task #5: params with task_id="5"
     """
     args = [params.task_id, "delete", "rc.confirmation=off"]
-    success, output = _run_task_command(args)
+    success, output = await _run_task_command_async(args)
+    _invalidate_task_cache()
 
     if success:
         return f"Task {params.task_id} deleted.\n{output}"
@@ -355,19 +439,17 @@ async def taskwarrior_get(params: GetTaskInput) -> str:
         params: GetTaskInput containing task_id and response_format
 
     Returns:
-        Detailed task information (markdown or JSON)
+        Detailed task information in the requested format, with dependencies resolved
 
     Examples:
         - Get task #5: params with task_id="5"
         - Get task as JSON: params with task_id="5", response_format="json"
     """
-    success, output = _run_task_command([params.task_id, "export"])
-
-    if not success:
-        return output
-
     try:
-        tasks = json.loads(output) if output else []
+        success, tasks = await _get_task_records_cached([params.task_id, "export"])
+        if not success or isinstance(tasks, str):
+            return str(tasks)
+
         if not tasks:
             return (
                 f"Error: Task '{params.task_id}' not found.\n"
@@ -375,17 +457,19 @@ async def taskwarrior_get(params: GetTaskInput) -> str:
                 f"or check if the task was completed/deleted."
             )
 
-        task = _parse_task(tasks[0])
+        task = _parse_task_fast(tasks[0])
+        # Resolve blockers in one further export, as bulk_get does
+        task = _enrich_task_dependencies(task, await _get_tasks_by_uuid(list(task.depends_uuids)))
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(task.model_dump(), indent=2)
+            return _dump_json(task)
 
         if params.response_format == ResponseFormat.CONCISE:
             return _format_task_concise(task)
 
         return _format_task_markdown(task)
 
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return f"Error: Failed to parse task data - {str(e)}\nTip: This may indicate a Taskwarrior configuration issue."
 
 
@@ -423,15 +507,15 @@ async def taskwarrior_bulk_get(params: BulkGetTasksInput) -> str:
         - Get tasks #1, #2, #3: params with task_ids=["1", "2", "3"]
         - Get tasks as JSON: params with task_ids=["1", "2"], response_format="json"
     """
-    # Build filter for multiple task IDs using Taskwarrior OR syntax
-    filter_expr = " or ".join(f"id:{tid}" for tid in params.task_ids)
-    success, output = _run_task_command([f"({filter_expr})", "export"])
-
-    if not success:
-        return output
-
+    # Numeric IDs go in one native ID list ("1-3,7"); UUIDs are passed as bare
+    # terms. Taskwarrior ORs leading ID/UUID terms together.
+    ids = [int(tid) for tid in params.task_ids if _is_numeric_id(tid)]
+    uuids = [tid for tid in params.task_ids if not _is_numeric_id(tid)]
+    filter_args = ([_id_list(ids)] if ids else []) + uuids
     try:
-        raw_tasks = json.loads(output) if output else []
+        success, raw_tasks = await _get_task_records_cached([*filter_args, "export"])
+        if not success or isinstance(raw_tasks, str):
+            return str(raw_tasks)
 
         if not raw_tasks:
             return (
@@ -440,31 +524,46 @@ async def taskwarrior_bulk_get(params: BulkGetTasksInput) -> str:
                 f"These tasks may have been completed or deleted."
             )
 
-        tasks = _parse_tasks(raw_tasks)
-        tasks = _enrich_tasks_dependencies(tasks)  # Resolve dependency UUIDs
+        tasks = await _parse_tasks_async(raw_tasks)
+        # Resolve dependency UUIDs, exporting any blockers that were not
+        # requested in one further call
+        uuid_to_task = {t.uuid: t for t in tasks if t.uuid}
+        missing_deps = [d for t in tasks for d in t.depends_uuids if d not in uuid_to_task]
+        uuid_to_task.update(await _get_tasks_by_uuid(missing_deps))
+        tasks = _enrich_tasks_dependencies(tasks, uuid_to_task)
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps([t.model_dump() for t in tasks], indent=2)
+            return _dump_tasks_json(tasks)
 
         if params.response_format == ResponseFormat.CONCISE:
             return _format_tasks_concise(tasks)
 
         # Format as markdown
         lines = [f"# Task Details ({len(tasks)} tasks found)\n"]
-        for task in tasks:
-            lines.append(_format_task_markdown(task))
-            lines.append("")  # Blank line between tasks
+        # Each block carries the blank line that separates it from the next
+        lines.extend(f"{block}\n" for block in map(_format_task_markdown, tasks))
 
         # Note any missing tasks
-        found_ids = {str(t.id) for t in tasks if t.id is not None}
-        found_ids.update({t.uuid[:8] for t in tasks if t.uuid})
-        missing = [tid for tid in params.task_ids if tid not in found_ids]
+        # Requests may name a task by ID, or by a full UUID or any UUID prefix
+        found_ids: set[str] = set()
+        found_uuids: list[str] = []
+        for t in tasks:
+            if t.id is not None:
+                found_ids.add(str(t.id))
+            if t.uuid:
+                found_uuids.append(t.uuid.lower())
+        missing = [
+            tid
+            for tid in params.task_ids
+            if tid not in found_ids
+            and (_is_numeric_id(tid) or not any(uuid.startswith(tid.lower()) for uuid in found_uuids))
+        ]
         if missing:
             lines.append(f"\n**Note:** Tasks not found: {', '.join(missing)}")
 
         return "\n".join(lines)
 
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return f"Error: Failed to parse task data - {str(e)}\nTip: This may indicate a Taskwarrior configuration issue."
 
 
@@ -493,8 +592,9 @@ async def taskwarrior_annotate(params: AnnotateTaskInput) -> str:
     Examples:
         - Add note: params with task_id="5", annotation="Discussed with John, needs review"
     """
-    args = [params.task_id, "annotate", shlex.quote(params.annotation), "rc.confirmation=off"]
-    success, output = _run_task_command(args)
+    args = [params.task_id, "annotate", params.annotation, "rc.confirmation=off"]
+    success, output = await _run_task_command_async(args)
+    _invalidate_task_cache()
 
     if success:
         return f"Annotation added to task {params.task_id}.\n{output}"
@@ -528,7 +628,8 @@ async def taskwarrior_start(params: StartTaskInput) -> str:
         - Start task #5: params with task_id="5"
     """
     args = [params.task_id, "start", "rc.confirmation=off"]
-    success, output = _run_task_command(args)
+    success, output = await _run_task_command_async(args)
+    _invalidate_task_cache()
 
     if success:
         return f"Task {params.task_id} started.\n{output}"
@@ -561,7 +662,8 @@ async def taskwarrior_stop(params: StopTaskInput) -> str:
         - Stop task #5: params with task_id="5"
     """
     args = [params.task_id, "stop", "rc.confirmation=off"]
-    success, output = _run_task_command(args)
+    success, output = await _run_task_command_async(args)
+    _invalidate_task_cache()
 
     if success:
         return f"Task {params.task_id} stopped.\n{output}"
@@ -599,33 +701,23 @@ async def taskwarrior_projects(params: ListProjectsInput) -> str:
     Examples:
         - List projects: params with response_format="markdown"
     """
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
+    success, result = await _get_task_aggregates(status=TaskStatus.PENDING, fields=_AGGREGATE_FIELDS)
 
-    if not success:
+    if not success or isinstance(result, str):
         return str(result)
 
-    # Count tasks per project
-    raw_tasks = result if isinstance(result, list) else []
-    tasks = _parse_tasks(raw_tasks)
-    project_counts: dict[str, int] = {}
-    for task in tasks:
-        project = task.project or "(none)"
-        project_counts[project] = project_counts.get(project, 0) + 1
+    project_counts = result.project_counts
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(
-            {"projects": [{"name": name, "task_count": count} for name, count in sorted(project_counts.items())]},
-            indent=2,
+        return _dump_json(
+            {"projects": [{"name": name, "task_count": count} for name, count in sorted(project_counts.items())]}
         )
 
-    lines = ["# Projects", ""]
     if not project_counts:
-        lines.append("No projects found.")
-    else:
-        for name, count in sorted(project_counts.items()):
-            lines.append(f"- **{name}**: {count} task(s)")
+        return "# Projects\n\nNo projects found."
 
-    return "\n".join(lines)
+    body = "\n".join(f"- **{name}**: {count} task(s)" for name, count in sorted(project_counts.items()))
+    return f"# Projects\n\n{body}"
 
 
 @mcp.tool(
@@ -663,22 +755,21 @@ async def taskwarrior_project_summary(params: ProjectSummaryInput) -> str:
         - Summarize specific project: params with project="work"
         - Include completed stats: params with include_completed=True
     """
-    from datetime import datetime, timezone
-
-    # Get pending tasks
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
-    if not success:
+    # Get pending tasks, and completed tasks if requested, exporting both at once
+    queries = [_get_tasks_cached(status=TaskStatus.PENDING, fields=_AGGREGATE_FIELDS)]
+    if params.include_completed:
+        queries.append(_get_tasks_cached(status=TaskStatus.COMPLETED, fields=_AGGREGATE_FIELDS))
+    (success, result), *completed_results = await asyncio.gather(*queries)
+    if not success or not isinstance(result, list):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    pending_tasks = _parse_tasks(raw_tasks)
+    pending_tasks = result
 
-    # Get completed tasks if requested
-    completed_tasks = []
-    if params.include_completed:
-        success, result = _get_tasks_json(status=TaskStatus.COMPLETED)
+    # A failed completed export only leaves the completed counts at zero
+    completed_tasks: list[TaskModel] = []
+    for success, result in completed_results:
         if success and isinstance(result, list):
-            completed_tasks = _parse_tasks(result)
+            completed_tasks = result
 
     # Filter by project if specified
     if params.project:
@@ -687,41 +778,23 @@ async def taskwarrior_project_summary(params: ProjectSummaryInput) -> str:
 
         if not pending_tasks and not completed_tasks:
             if params.response_format == ResponseFormat.JSON:
-                return json.dumps({"error": f"Project '{params.project}' not found or has no tasks"})
+                return _dump_json({"error": f"Project '{params.project}' not found or has no tasks"}, indent=None)
             return f"Project '{params.project}' not found or has no tasks."
 
-    # Group tasks by project
-    project_data: dict[str, dict[str, int]] = {}
+    # Group tasks by project, in one pass over pending and completed tasks
+    project_data: defaultdict[str, dict[str, int]] = defaultdict(_EMPTY_PROJECT_DATA.copy)
     now = datetime.now(timezone.utc)
 
-    for task in pending_tasks:
-        project_name = task.project or "(none)"
-        if project_name not in project_data:
-            project_data[project_name] = {
-                "pending": 0,
-                "completed": 0,
-                "active": 0,
-                "overdue": 0,
-                "due_today": 0,
-                "due_this_week": 0,
-                "priority_h": 0,
-                "priority_m": 0,
-                "priority_l": 0,
-                "no_priority": 0,
-            }
-
-        data = project_data[project_name]
+    for task in chain(pending_tasks, completed_tasks):
+        data = project_data[task.project or "(none)"]
+        if task.status == "completed":
+            data["completed"] += 1
+            continue
+
         data["pending"] += 1
 
         # Priority breakdown
-        if task.priority == "H":
-            data["priority_h"] += 1
-        elif task.priority == "M":
-            data["priority_m"] += 1
-        elif task.priority == "L":
-            data["priority_l"] += 1
-        else:
-            data["no_priority"] += 1
+        data[_PRIORITY_COUNTER.get(task.priority or "", "no_priority")] += 1
 
         # Active tasks
         if task.start:
@@ -730,9 +803,8 @@ async def taskwarrior_project_summary(params: ProjectSummaryInput) -> str:
         # Due date analysis
         if task.due:
             try:
-                # Parse Taskwarrior date format (YYYYMMDDTHHMMSSZ)
-                due_date = datetime.strptime(task.due, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
-                days_until_due = (due_date - now).days
+                # Taskwarrior's fixed-width date format (YYYYMMDDTHHMMSSZ)
+                days_until_due = (_parse_timestamp(task.due) - now).days
 
                 if days_until_due < 0:
                     data["overdue"] += 1
@@ -740,30 +812,12 @@ async def taskwarrior_project_summary(params: ProjectSummaryInput) -> str:
                     data["due_today"] += 1
                 elif days_until_due <= 7:
                     data["due_this_week"] += 1
-            except (ValueError, AttributeError):
+            except ValueError:
                 pass
 
-    # Add completed counts
-    for task in completed_tasks:
-        project_name = task.project or "(none)"
-        if project_name not in project_data:
-            project_data[project_name] = {
-                "pending": 0,
-                "completed": 0,
-                "active": 0,
-                "overdue": 0,
-                "due_today": 0,
-                "due_this_week": 0,
-                "priority_h": 0,
-                "priority_m": 0,
-                "priority_l": 0,
-                "no_priority": 0,
-            }
-        project_data[project_name]["completed"] += 1
-
     if not project_data:
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps({"projects": [], "message": "No projects found"})
+            return _dump_json({"projects": [], "message": "No projects found"}, indent=None)
         return "# Project Summary\n\nNo projects found."
 
     # Format output
@@ -787,43 +841,13 @@ async def taskwarrior_project_summary(params: ProjectSummaryInput) -> str:
                     },
                 }
             )
-        return json.dumps({"projects": projects_list}, indent=2)
+        return _dump_json({"projects": projects_list})
 
-    # Markdown format
-    lines = ["# Project Summary", ""]
-
-    for name, data in sorted(project_data.items()):
-        lines.append(f"## {name}")
-        lines.append("")
-        lines.append(f"**Pending Tasks**: {data['pending']}")
-
-        if params.include_completed:
-            lines.append(f"**Completed Tasks**: {data['completed']}")
-
-        if data["active"] > 0:
-            lines.append(f"**Active (in progress)**: {data['active']}")
-
-        # Due dates
-        if data["overdue"] > 0 or data["due_today"] > 0 or data["due_this_week"] > 0:
-            lines.append("")
-            lines.append("**Due Dates**:")
-            if data["overdue"] > 0:
-                lines.append(f"- ⚠️ Overdue: {data['overdue']}")
-            if data["due_today"] > 0:
-                lines.append(f"- 📅 Due today: {data['due_today']}")
-            if data["due_this_week"] > 0:
-                lines.append(f"- 📆 Due this week: {data['due_this_week']}")
-
-        # Priority breakdown
-        lines.append("")
-        lines.append("**Priority**:")
-        lines.append(f"- High: {data['priority_h']}")
-        lines.append(f"- Medium: {data['priority_m']}")
-        lines.append(f"- Low: {data['priority_l']}")
-        lines.append(f"- None: {data['no_priority']}")
-        lines.append("")
-
-    return "\n".join(lines)
+    # Markdown format: one block per project
+    blocks = (
+        _format_project_block(name, data, params.include_completed) for name, data in sorted(project_data.items())
+    )
+    return "\n".join(("# Project Summary", "", *blocks))
 
 
 @mcp.tool(
@@ -856,33 +880,21 @@ async def taskwarrior_tags(params: ListTagsInput) -> str:
     Examples:
         - List tags: params with response_format="markdown"
     """
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
+    success, result = await _get_task_aggregates(status=TaskStatus.PENDING, fields=_AGGREGATE_FIELDS)
 
-    if not success:
+    if not success or isinstance(result, str):
         return str(result)
 
-    # Count tasks per tag
-    raw_tasks = result if isinstance(result, list) else []
-    tasks = _parse_tasks(raw_tasks)
-    tag_counts: dict[str, int] = {}
-    for task in tasks:
-        for tag in task.tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    tag_counts = result.tag_counts
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(
-            {"tags": [{"name": name, "task_count": count} for name, count in sorted(tag_counts.items())]},
-            indent=2,
-        )
+        return _dump_json({"tags": [{"name": name, "task_count": count} for name, count in sorted(tag_counts.items())]})
 
-    lines = ["# Tags", ""]
     if not tag_counts:
-        lines.append("No tags found.")
-    else:
-        for name, count in sorted(tag_counts.items()):
-            lines.append(f"- **+{name}**: {count} task(s)")
+        return "# Tags\n\nNo tags found."
 
-    return "\n".join(lines)
+    body = "\n".join(f"- **+{name}**: {count} task(s)" for name, count in sorted(tag_counts.items()))
+    return f"# Tags\n\n{body}"
 
 
 @mcp.tool(
@@ -910,7 +922,8 @@ async def taskwarrior_undo(params: UndoInput) -> str:
     Examples:
         - Undo last action: params with no special values
     """
-    success, output = _run_task_command(["undo", "rc.confirmation=off"])
+    success, output = await _run_task_command_async(["undo", "rc.confirmation=off"])
+    _invalidate_task_cache()
 
     if success:
         return f"Undo successful.\n{output}"
@@ -944,31 +957,18 @@ async def taskwarrior_summary() -> str:
     Returns:
         Summary statistics of tasks
     """
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
+    success, result = await _get_task_aggregates(status=TaskStatus.PENDING, fields=_AGGREGATE_FIELDS)
 
-    if not success:
+    if not success or isinstance(result, str):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    tasks = _parse_tasks(raw_tasks)
-    if not tasks:
+    if not result.total:
         return "# Task Summary\n\nNo pending tasks."
 
-    # Calculate statistics
-    total = len(tasks)
-    by_priority = {"H": 0, "M": 0, "L": 0, "": 0}
-    by_project: dict[str, int] = {}
-    active = 0
-
-    for task in tasks:
-        priority = task.priority or ""
-        by_priority[priority] = by_priority.get(priority, 0) + 1
-
-        project = task.project or "(none)"
-        by_project[project] = by_project.get(project, 0) + 1
-
-        if task.start:
-            active += 1
+    total = result.total
+    active = result.active
+    by_priority = result.by_priority
+    by_project = result.project_counts
 
     lines = [
         "# Task Summary",
@@ -986,9 +986,7 @@ async def taskwarrior_summary() -> str:
     ]
 
     # Show top 5 projects by task count
-    sorted_projects = sorted(by_project.items(), key=lambda x: x[1], reverse=True)[:5]
-    for project, count in sorted_projects:
-        lines.append(f"- {project}: {count}")
+    lines.extend(f"- {project}: {count}" for project, count in by_project.most_common(5))
 
     return "\n".join(lines)
 
@@ -1028,29 +1026,17 @@ async def taskwarrior_overview(params: OverviewInput) -> str:
         - Summary only: params with include_projects=False, include_tags=False
         - JSON format: params with response_format="json"
     """
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
+    success, result = await _get_task_aggregates(status=TaskStatus.PENDING, fields=_AGGREGATE_FIELDS)
 
-    if not success:
+    if not success or isinstance(result, str):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    tasks = _parse_tasks(raw_tasks)
-
-    # Compute all aggregations in a single pass
-    total = len(tasks)
-    by_priority: dict[str, int] = {"H": 0, "M": 0, "L": 0, "": 0}
-    by_project: dict[str, int] = {}
-    tag_counts: dict[str, int] = {}
-    active = 0
-
-    for task in tasks:
-        by_priority[task.priority or ""] += 1
-        project = task.project or "(none)"
-        by_project[project] = by_project.get(project, 0) + 1
-        for tag in task.tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        if task.start:
-            active += 1
+    # Counts are shared with taskwarrior_projects, taskwarrior_tags and taskwarrior_summary
+    total = result.total
+    active = result.active
+    by_priority = result.by_priority
+    by_project = result.project_counts
+    tag_counts = result.tag_counts
 
     if params.response_format == ResponseFormat.JSON:
         data: dict[str, object] = {
@@ -1064,7 +1050,7 @@ async def taskwarrior_overview(params: OverviewInput) -> str:
             data["projects"] = [{"name": n, "count": c} for n, c in sorted(by_project.items())]
         if params.include_tags:
             data["tags"] = [{"name": n, "count": c} for n, c in sorted(tag_counts.items())]
-        return json.dumps(data, indent=2)
+        return _dump_json(data)
 
     # Markdown format
     lines = [
@@ -1076,12 +1062,14 @@ async def taskwarrior_overview(params: OverviewInput) -> str:
 
     if params.include_projects and by_project:
         lines.extend(["", "## Projects"])
-        for name, count in sorted(by_project.items(), key=lambda x: -x[1]):
-            lines.append(f"- {name}: {count}")
+        lines.extend(
+            f"- {name}: {count}" for name, count in sorted(by_project.items(), key=itemgetter(1), reverse=True)
+        )
 
     if params.include_tags and tag_counts:
         lines.extend(["", "## Tags"])
-        for name, count in sorted(tag_counts.items(), key=lambda x: -x[1]):
-            lines.append(f"- +{name}: {count}")
+        lines.extend(
+            f"- +{name}: {count}" for name, count in sorted(tag_counts.items(), key=itemgetter(1), reverse=True)
+        )
 
     return "\n".join(lines)
@@ -1,7 +1,10 @@
 """Agent intelligence MCP tools for Taskwarrior."""
 
-import json
-from datetime import datetime, timezone
+import heapq
+import sys
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter, itemgetter
 
 from mcp.types import ToolAnnotations
 
@@ -22,24 +25,66 @@ from taskwarrior_mcp.models.intelligence import (
 )
 from taskwarrior_mcp.models.task import TaskModel
 from taskwarrior_mcp.server import mcp
-from taskwarrior_mcp.utils.cli import _get_tasks_json, _run_task_command
-from taskwarrior_mcp.utils.formatters import _format_task_concise, _format_tasks_concise
-from taskwarrior_mcp.utils.parsers import _parse_task, _parse_tasks
+from taskwarrior_mcp.utils.cache import _get_task_index, _get_tasks_by_uuid, _get_tasks_cached
+from taskwarrior_mcp.utils.cli import _decode_export, _run_task_export_async
+from taskwarrior_mcp.utils.formatters import (
+    _PRIORITY_LABEL,
+    _dump_json,
+    _format_task_concise,
+    _format_tasks_concise,
+)
+from taskwarrior_mcp.utils.index import _build_task_index, _TaskIndex
+from taskwarrior_mcp.utils.parsers import _parse_task_fast, _parse_timestamp
+
+_UTC = timezone.utc
 
 # ============================================================================
 # Agent Intelligence Helper Functions
 # ============================================================================
 
 
-def _calculate_suggestion_score(task: TaskModel, all_tasks: list[TaskModel]) -> tuple[float, list[str]]:
+# Priority → (score bonus, reason shown to the user)
+_PRIORITY_BONUS: dict[str, tuple[float, str | None]] = {
+    "H": (30.0, "High priority"),
+    "M": (15.0, None),
+}
+
+_READY_TABLE_HEADER = "| ID | Task | Priority | Due | Project |\n|----|------|----------|-----|---------|"
+
+# Suggestion reason flags, set alongside the human-readable reasons
+_OVERDUE = 1
+_DUE_SOON = 2
+_QUICK_WIN = 4
+_BLOCKS = 8
+_ACTIVE = 16
+
+# Flag → indicator shown next to a suggestion; the first match wins
+_INDICATOR_ORDER: tuple[tuple[int, str], ...] = (
+    (_OVERDUE, "⚠️ OVERDUE"),
+    (_DUE_SOON, "📅 DUE SOON"),
+    (_QUICK_WIN, "⚡ QUICK WIN"),
+    (_ACTIVE, "🔄 ACTIVE"),
+)
+# Indicator for every combination of flags
+_SUGGEST_INDICATORS: tuple[str, ...] = tuple(
+    next((label for flag, label in _INDICATOR_ORDER if flags & flag), "") for flags in range(32)
+)
+
+
+def _calculate_suggestion_score(task: TaskModel, index: _TaskIndex) -> tuple[float, list[str], int]:
     """
     Calculate suggestion score for a task and return reasons.
 
+    Args:
+        task: Task to score
+        index: Index of the task list being scored
+
     Returns:
-        Tuple of (score, list_of_reasons)
+        Tuple of (score, list_of_reasons, reason_flags)
     """
     score = 0.0
     reasons: list[str] = []
+    flags = 0
 
     # Base urgency from Taskwarrior
     urgency = task.urgency
@@ -48,99 +93,83 @@ def _calculate_suggestion_score(task: TaskModel, all_tasks: list[TaskModel]) ->
     if urgency > 12:
         score += 100
         reasons.append("Overdue")
+        flags |= _OVERDUE
     elif urgency > 8:
         score += 50
         reasons.append("Due soon")
+        flags |= _DUE_SOON
 
-    # High priority
-    if task.priority == "H":
-        score += 30
-        reasons.append("High priority")
-    elif task.priority == "M":
-        score += 15
+    if task.priority in _PRIORITY_BONUS:
+        bonus, reason = _PRIORITY_BONUS[task.priority]
+        score += bonus
+        if reason:
+            reasons.append(reason)
 
     # Currently active (started)
     if task.start:
         score += 15
         reasons.append("Currently active")
-
-    # Tagged +next
-    if "next" in task.tags:
-        score += 25
-        reasons.append("Tagged +next")
-
-    # Quick wins (tagged quick or low urgency with no dependencies)
-    if "quick" in task.tags:
-        score += 10
-        reasons.append("Quick win")
+        flags |= _ACTIVE
+
+    tags = task.tags
+    if tags:
+        if "next" in tags:
+            score += 25
+            reasons.append("Tagged +next")
+        # Quick wins (tagged quick or low urgency with no dependencies)
+        if "quick" in tags:
+            score += 10
+            reasons.append("Quick win")
+            flags |= _QUICK_WIN
 
     # Blocks other tasks
-    task_uuid = task.uuid or ""
-    blocked_count = 0
-    for t in all_tasks:
-        if t.depends and task_uuid in t.depends:
-            blocked_count += 1
-
+    blocked_count = index.out_degree.get(task.uuid, 0) if task.uuid else 0
     if blocked_count > 0:
         score += 20 * blocked_count
         reasons.append(f"Blocks {blocked_count} task(s)")
+        flags |= _BLOCKS
 
     # Add base urgency
     score += urgency
 
-    return score, reasons
-
+    return score, reasons, flags
 
-def _get_blocked_tasks(tasks: list[TaskModel]) -> list[TaskModel]:
-    """Get tasks that have unresolved dependencies."""
-    # Build a set of pending task UUIDs
-    pending_uuids = {t.uuid for t in tasks if t.status == "pending" and t.uuid}
 
-    blocked: list[TaskModel] = []
-    for task in tasks:
-        if task.status != "pending":
-            continue
-        if task.depends:
-            # Check if any dependency is still pending
-            dep_uuids = [d.strip() for d in task.depends.split(",") if d.strip()]
-            has_pending_dep = any(d in pending_uuids for d in dep_uuids)
-            if has_pending_dep:
-                blocked.append(task)
+def _score_tasks(index: _TaskIndex) -> list[ScoredTask]:
+    """
+    Score every task in the index.
 
-    return blocked
+    The fields are computed here with the right types already, so the
+    results are built with `model_construct` rather than validated.
+    """
+    scored: list[ScoredTask] = []
+    for task in index.tasks:
+        score, reasons, flags = _calculate_suggestion_score(task, index)
+        scored.append(ScoredTask.model_construct(task=task, score=score, reasons=reasons, flags=flags))
+    return scored
 
 
-def _get_ready_tasks(tasks: list[TaskModel]) -> list[TaskModel]:
+def _get_ready_tasks(index: _TaskIndex) -> list[TaskModel]:
     """Get tasks that have no pending dependencies."""
-    pending_uuids = {t.uuid for t in tasks if t.status == "pending" and t.uuid}
-
-    ready: list[TaskModel] = []
-    for task in tasks:
-        if task.status != "pending":
-            continue
-        if not task.depends:
-            ready.append(task)
-        else:
-            # Check if all dependencies are completed
-            dep_uuids = [d.strip() for d in task.depends.split(",") if d.strip()]
-            has_pending_dep = any(d in pending_uuids for d in dep_uuids)
-            if not has_pending_dep:
-                ready.append(task)
+    return list(index.ready_tasks)
+
 
-    return ready
+def _due_cell(task: TaskModel) -> str:
+    """Due date for a table cell, emphasised when the task is overdue."""
+    due = task.due[:10] if task.due else "-"
+    # urgency > 12 typically indicates overdue
+    return f"**{due}** ⚠️" if task.urgency > 12 else due
 
 
-def _get_task_age_str(task: TaskModel) -> str:
-    """Get human-readable age of a task."""
+def _get_task_age_str(task: TaskModel, now: datetime | None = None) -> str:
+    """Get human-readable age of a task, relative to `now` (default: current time)."""
     if not task.entry:
         return "Unknown"
 
     try:
         # Taskwarrior uses ISO format: 20250130T100000Z
-        entry_dt = datetime.strptime(task.entry[:15], "%Y%m%dT%H%M%S")
-        entry_dt = entry_dt.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-        delta = now - entry_dt
+        entry_dt = _parse_timestamp(task.entry)
+        delta = (now or datetime.now(_UTC)) - entry_dt
 
         days = delta.days
         if days == 0:
@@ -159,20 +188,155 @@ def _get_task_age_str(task: TaskModel) -> str:
         return "Unknown"
 
 
-def _is_task_stale(task: TaskModel, stale_days: int) -> bool:
-    """Check if a task is stale (not modified recently)."""
-    modified = task.modified or task.entry
-    if not modified:
-        return True
+def _stale_threshold(stale_days: int, now: datetime | None = None) -> str:
+    """Taskwarrior timestamp at or before which a task counts as stale."""
+    return ((now or datetime.now(_UTC)) - timedelta(days=stale_days)).strftime("%Y%m%dT%H%M%SZ")
 
-    try:
-        mod_dt = datetime.strptime(modified[:15], "%Y%m%dT%H%M%S")
-        mod_dt = mod_dt.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-        delta = now - mod_dt
-        return delta.days >= stale_days
-    except (ValueError, TypeError):
-        return False
+
+def _is_task_stale(task: TaskModel, threshold: str) -> bool:
+    """
+    Check if a task is stale (not modified since `threshold`, see `_stale_threshold`).
+
+    Taskwarrior's fixed-width UTC timestamps sort lexically, so this is a plain
+    string comparison. Tasks with neither a modified nor an entry date are stale.
+    """
+    return (task.modified or task.entry or "") <= threshold
+
+
+# ============================================================================
+# Response Renderers
+#
+# Each renders one response format, so tools only do the work for the format
+# that was requested.
+# ============================================================================
+
+
+def _render_suggestions_json(scored_tasks: list[ScoredTask], total_pending: int) -> str:
+    """Render suggestions as JSON."""
+    return _dump_json({"suggestions": scored_tasks, "total_pending": total_pending})
+
+
+def _render_suggestions_concise(scored_tasks: list[ScoredTask], total_pending: int) -> str:
+    """Render suggestions one per line, with their main reason."""
+    if not scored_tasks:
+        return "0 suggestions"
+    lines = [f"{len(scored_tasks)} suggestion(s)"]
+    for s in scored_tasks:
+        reason_short = s.reasons[0] if s.reasons else ""
+        lines.append(f"{_format_task_concise(s.task)} [{reason_short}]")
+    return "\n".join(lines)
+
+
+def _render_suggestions_markdown(scored_tasks: list[ScoredTask], total_pending: int) -> str:
+    """Render suggestions as markdown with indicators, details and reasons."""
+    if not scored_tasks:
+        return "# Suggestions\n\nNo tasks match your criteria."
+
+    lines = ["# Suggested: What to Work On", ""]
+
+    for i, s in enumerate(scored_tasks, 1):
+        task = s.task
+        task_id = task.id if task.id else "?"
+        desc = task.description or "No description"
+        reasons = s.reasons
+
+        # Add status indicator
+        indicator = _SUGGEST_INDICATORS[s.flags]
+
+        lines.append(f"{i}. **[#{task_id}] {desc}** {indicator}")
+
+        # Details line
+        details = []
+        if task.due:
+            details.append(f"Due: {task.due[:10]}")
+        if task.priority:
+            details.append(f"Priority: {task.priority}")
+        if task.project:
+            details.append(f"Project: {task.project}")
+
+        if details:
+            lines.append(f"   {' | '.join(details)}")
+
+        # Reason line
+        if reasons:
+            lines.append(f"   → Reason: {', '.join(reasons)}")
+
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+# Renderer per response format. The text renderers take `total_pending` only to
+# share the JSON renderer's signature, so a tool picks one with a dict lookup.
+_SUGGEST_RENDERERS: dict[ResponseFormat, Callable[[list[ScoredTask], int], str]] = {
+    ResponseFormat.MARKDOWN: _render_suggestions_markdown,
+    ResponseFormat.JSON: _render_suggestions_json,
+    ResponseFormat.CONCISE: _render_suggestions_concise,
+}
+
+
+def _pending_blockers(task: TaskModel, index: _TaskIndex) -> list[TaskModel]:
+    """Pending tasks that `task` depends on, in `depends` order."""
+    uuid_to_task = index.uuid_to_task
+    blockers: list[TaskModel] = []
+    for dep_uuid in task.depends_uuids:
+        blocker = uuid_to_task.get(dep_uuid)
+        if blocker and blocker.status == "pending":
+            blockers.append(blocker)
+    return blockers
+
+
+def _render_blocked_json(blocked_tasks: list[TaskModel], index: _TaskIndex, show_blockers: bool) -> str:
+    """Render blocked tasks as JSON, optionally with their pending blockers."""
+    blocked_info = [
+        BlockedTaskInfo.model_construct(task=task, blockers=_pending_blockers(task, index) if show_blockers else [])
+        for task in blocked_tasks
+    ]
+    return _dump_json(
+        {
+            "blocked": blocked_info,
+            "count": len(blocked_tasks),
+            "total_pending": len(index.tasks),
+        }
+    )
+
+
+def _render_blocked_markdown(blocked_tasks: list[TaskModel], index: _TaskIndex, show_blockers: bool) -> str:
+    """Render blocked tasks as markdown, optionally listing their pending blockers."""
+    if not blocked_tasks:
+        return "# Blocked Tasks\n\nNo blocked tasks found. All tasks are ready to work on!"
+
+    lines = [f"# Blocked Tasks ({len(blocked_tasks)} waiting)", ""]
+
+    for i, task in enumerate(blocked_tasks, 1):
+        task_id = task.id if task.id else "?"
+        desc = task.description or "No description"
+
+        lines.append(f"{i}. **[#{task_id}] {desc}**")
+
+        if show_blockers:
+            blockers_list = [
+                f"#{blocker.id if blocker.id else '?'} ({blocker.description[:30]})"
+                for blocker in _pending_blockers(task, index)
+            ]
+            if blockers_list:
+                lines.append(f"   Blocked by: {', '.join(blockers_list)}")
+
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _render_blocked_concise(blocked_tasks: list[TaskModel], index: _TaskIndex, show_blockers: bool) -> str:
+    """Render blocked tasks one per line; the blockers themselves are not listed."""
+    return _format_tasks_concise(blocked_tasks, "blocked")
+
+
+_BLOCKED_RENDERERS: dict[ResponseFormat, Callable[[list[TaskModel], _TaskIndex, bool], str]] = {
+    ResponseFormat.MARKDOWN: _render_blocked_markdown,
+    ResponseFormat.JSON: _render_blocked_json,
+    ResponseFormat.CONCISE: _render_blocked_concise,
+}
 
 
 # ============================================================================
@@ -224,98 +388,31 @@ async def taskwarrior_suggest(params: SuggestInput) -> str:
     """
     # Get all pending tasks
     filter_expr = f"project:{params.project}" if params.project else None
-    success, result = _get_tasks_json(filter_expr, TaskStatus.PENDING)
+    success, result = await _get_task_index(filter_expr, TaskStatus.PENDING)
 
-    if not success:
+    if not success or not isinstance(result, _TaskIndex):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    tasks = _parse_tasks(raw_tasks)
+    index = result
+    tasks = index.tasks
     if not tasks:
         return "# Suggestions\n\nNo pending tasks found. Nothing to suggest!"
 
     # Score each task
-    scored_tasks: list[ScoredTask] = []
-    for task in tasks:
-        score, reasons = _calculate_suggestion_score(task, tasks)
-        scored_tasks.append(ScoredTask(task=task, score=score, reasons=reasons))
-
-    # Sort by score descending
-    scored_tasks.sort(key=lambda x: x.score, reverse=True)
+    scored_tasks = _score_tasks(index)
 
-    # Apply context filter if specified
+    # Apply context filter if specified, before ranking
     if params.context == "quick_wins":
-        scored_tasks = [s for s in scored_tasks if "Quick win" in s.reasons or s.task.urgency < 5]
+        scored_tasks = [s for s in scored_tasks if s.flags & _QUICK_WIN or s.task.urgency < 5]
     elif params.context == "blockers":
-        scored_tasks = [s for s in scored_tasks if any("Blocks" in r for r in s.reasons)]
+        scored_tasks = [s for s in scored_tasks if s.flags & _BLOCKS]
     elif params.context == "deadlines":
-        scored_tasks = [s for s in scored_tasks if "Overdue" in s.reasons or "Due soon" in s.reasons]
-
-    # Limit results
-    scored_tasks = scored_tasks[: params.limit]
-
-    if params.response_format == ResponseFormat.JSON:
-        return json.dumps(
-            {
-                "suggestions": [s.model_dump() for s in scored_tasks],
-                "total_pending": len(tasks),
-            },
-            indent=2,
-        )
-
-    if params.response_format == ResponseFormat.CONCISE:
-        if not scored_tasks:
-            return "0 suggestions"
-        lines = [f"{len(scored_tasks)} suggestion(s)"]
-        for s in scored_tasks:
-            reason_short = s.reasons[0] if s.reasons else ""
-            lines.append(f"{_format_task_concise(s.task)} [{reason_short}]")
-        return "\n".join(lines)
-
-    # Markdown format
-    if not scored_tasks:
-        return "# Suggestions\n\nNo tasks match your criteria."
+        scored_tasks = [s for s in scored_tasks if s.flags & (_OVERDUE | _DUE_SOON)]
 
-    lines = ["# Suggested: What to Work On", ""]
-
-    for i, s in enumerate(scored_tasks, 1):
-        task = s.task
-        task_id = task.id if task.id else "?"
-        desc = task.description or "No description"
-        reasons = s.reasons
-
-        # Add status indicator
-        indicator = ""
-        if "Overdue" in reasons:
-            indicator = "⚠️ OVERDUE"
-        elif "Due soon" in reasons:
-            indicator = "📅 DUE SOON"
-        elif "Quick win" in reasons:
-            indicator = "⚡ QUICK WIN"
-        elif "Currently active" in reasons:
-            indicator = "🔄 ACTIVE"
-
-        lines.append(f"{i}. **[#{task_id}] {desc}** {indicator}")
-
-        # Details line
-        details = []
-        if task.due:
-            details.append(f"Due: {task.due[:10]}")
-        if task.priority:
-            details.append(f"Priority: {task.priority}")
-        if task.project:
-            details.append(f"Project: {task.project}")
-
-        if details:
-            lines.append(f"   {' | '.join(details)}")
-
-        # Reason line
-        if reasons:
-            lines.append(f"   → Reason: {', '.join(reasons)}")
-
-        lines.append("")
+    # Top `limit` by score descending; ties keep export order as with a stable sort
+    scored_tasks = heapq.nlargest(params.limit, scored_tasks, key=attrgetter("score"))
 
-    return "\n".join(lines)
+    return _SUGGEST_RENDERERS[params.response_format](scored_tasks, len(tasks))
 
 
 @mcp.tool(
@@ -354,39 +451,38 @@ async def taskwarrior_ready(params: ReadyInput) -> str:
         - High priority only: params with priority="H"
     """
     # Get all pending tasks (need all to check dependencies)
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
+    success, result = await _get_task_index(status=TaskStatus.PENDING)
 
-    if not success:
+    if not success or not isinstance(result, _TaskIndex):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    all_tasks = _parse_tasks(raw_tasks)
-    ready_tasks = _get_ready_tasks(all_tasks)
+    all_tasks = result.tasks
+    ready_tasks = _get_ready_tasks(result)
 
     # Apply filters
+    # Parsed values are interned, so `==` against an interned filter value
+    # usually returns on the identity check before comparing characters
     if params.project:
-        ready_tasks = [t for t in ready_tasks if t.project == params.project]
+        project = sys.intern(params.project)
+        ready_tasks = [t for t in ready_tasks if t.project == project]
 
     if params.priority:
-        ready_tasks = [t for t in ready_tasks if t.priority == params.priority]
+        priority = sys.intern(params.priority.value)
+        ready_tasks = [t for t in ready_tasks if t.priority == priority]
 
     if not params.include_active:
         ready_tasks = [t for t in ready_tasks if not t.start]
 
-    # Sort by urgency descending
-    ready_tasks.sort(key=lambda t: t.urgency, reverse=True)
-
-    # Limit
-    ready_tasks = ready_tasks[: params.limit]
+    # Top `limit` by urgency descending
+    ready_tasks = heapq.nlargest(params.limit, ready_tasks, key=attrgetter("urgency"))
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(
+        return _dump_json(
             {
-                "tasks": [t.model_dump() for t in ready_tasks],
+                "tasks": ready_tasks,
                 "count": len(ready_tasks),
                 "total_pending": len(all_tasks),
-            },
-            indent=2,
+            }
         )
 
     if params.response_format == ResponseFormat.CONCISE:
@@ -396,22 +492,11 @@ async def taskwarrior_ready(params: ReadyInput) -> str:
     if not ready_tasks:
         return "# Ready to Work\n\nNo unblocked tasks found."
 
-    lines = [f"# Ready to Work ({len(ready_tasks)} tasks)", ""]
-    lines.append("| ID | Task | Priority | Due | Project |")
-    lines.append("|----|------|----------|-----|---------|")
-
-    for task in ready_tasks:
-        task_id = task.id if task.id else "?"
-        desc = task.description[:40] if task.description else ""
-        priority = task.priority or "-"
-        due = task.due[:10] if task.due else "-"
-        project = task.project or "-"
-
-        # Mark overdue
-        if task.urgency > 12:
-            due = f"**{due}** ⚠️"
-
-        lines.append(f"| {task_id} | {desc} | {priority} | {due} | {project} |")
+    lines = [f"# Ready to Work ({len(ready_tasks)} tasks)", "", _READY_TABLE_HEADER]
+    lines.extend(
+        f"| {t.id or '?'} | {t.description[:40]} | {t.priority or '-'} | {_due_cell(t)} | {t.project or '-'} |"
+        for t in ready_tasks
+    )
 
     return "\n".join(lines)
 
@@ -451,73 +536,15 @@ async def taskwarrior_blocked(params: BlockedInput) -> str:
         - Without blocker details: params with show_blockers=False
     """
     # Get all pending tasks
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
+    success, result = await _get_task_index(status=TaskStatus.PENDING)
 
-    if not success:
+    if not success or not isinstance(result, _TaskIndex):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    all_tasks = _parse_tasks(raw_tasks)
-    blocked_tasks = _get_blocked_tasks(all_tasks)
-
-    # Limit
-    blocked_tasks = blocked_tasks[: params.limit]
-
-    # Build UUID to task mapping for showing blockers
-    uuid_to_task = {t.uuid: t for t in all_tasks if t.uuid}
-
-    if params.response_format == ResponseFormat.JSON:
-        blocked_info: list[BlockedTaskInfo] = []
-        for task in blocked_tasks:
-            info = BlockedTaskInfo(task=task, blockers=[])
-            if params.show_blockers and task.depends:
-                dep_uuids = [d.strip() for d in task.depends.split(",") if d.strip()]
-                for dep_uuid in dep_uuids:
-                    blocker = uuid_to_task.get(dep_uuid)
-                    if blocker and blocker.status == "pending":
-                        info.blockers.append(blocker)
-            blocked_info.append(info)
-
-        return json.dumps(
-            {
-                "blocked": [b.model_dump() for b in blocked_info],
-                "count": len(blocked_tasks),
-                "total_pending": len(all_tasks),
-            },
-            indent=2,
-        )
-
-    if params.response_format == ResponseFormat.CONCISE:
-        return _format_tasks_concise(blocked_tasks, "blocked")
+    index = result
+    blocked_tasks = index.blocked_tasks[: params.limit]
 
-    # Markdown format
-    if not blocked_tasks:
-        return "# Blocked Tasks\n\nNo blocked tasks found. All tasks are ready to work on!"
-
-    lines = [f"# Blocked Tasks ({len(blocked_tasks)} waiting)", ""]
-
-    for i, task in enumerate(blocked_tasks, 1):
-        task_id = task.id if task.id else "?"
-        desc = task.description or "No description"
-
-        lines.append(f"{i}. **[#{task_id}] {desc}**")
-
-        if params.show_blockers and task.depends:
-            dep_uuids = [d.strip() for d in task.depends.split(",") if d.strip()]
-            blockers_list = []
-            for dep_uuid in dep_uuids:
-                blocker = uuid_to_task.get(dep_uuid)
-                if blocker and blocker.status == "pending":
-                    blocker_id = blocker.id if blocker.id else "?"
-                    blocker_desc = blocker.description[:30] if blocker.description else ""
-                    blockers_list.append(f"#{blocker_id} ({blocker_desc})")
-
-            if blockers_list:
-                lines.append(f"   Blocked by: {', '.join(blockers_list)}")
-
-        lines.append("")
-
-    return "\n".join(lines)
+    return _BLOCKED_RENDERERS[params.response_format](blocked_tasks, index, params.show_blockers)
 
 
 @mcp.tool(
@@ -564,45 +591,34 @@ async def taskwarrior_dependencies(params: DependenciesInput) -> str:
         - Specific task: params with task_id="5"
         - Only what task blocks: params with task_id="5", direction="blocks"
     """
-    # Get all tasks (pending and completed for full picture)
-    success, result = _get_tasks_json(status=TaskStatus.ALL)
+    # Pending tasks are enough to find what blocks what; completed dependencies
+    # of a specific task are looked up separately below
+    success, result = await _get_task_index(status=TaskStatus.PENDING)
 
-    if not success:
+    if not success or not isinstance(result, _TaskIndex):
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    all_tasks = _parse_tasks(raw_tasks)
-    pending_tasks = [t for t in all_tasks if t.status == "pending"]
-
-    # Build UUID to task mapping
-    uuid_to_task = {t.uuid: t for t in all_tasks if t.uuid}
-
-    # Build "blocks" relationships (what each task blocks)
-    blocks_map: dict[str, list[TaskModel]] = {}  # uuid -> list of tasks it blocks
-    for task in pending_tasks:
-        if task.depends:
-            dep_uuids = [d.strip() for d in task.depends.split(",") if d.strip()]
-            for dep_uuid in dep_uuids:
-                if dep_uuid not in blocks_map:
-                    blocks_map[dep_uuid] = []
-                blocks_map[dep_uuid].append(task)
+    index = result
+    pending_tasks = index.pending_tasks
+    uuid_to_task = index.uuid_to_task
+    blocks_map = index.blocks_map  # uuid -> pending tasks it blocks
 
     if params.task_id:
         # Specific task analysis
-        success, output = _run_task_command([params.task_id, "export"])
+        success, output = await _run_task_export_async([params.task_id, "export"])
         if not success:
-            return output
+            return str(output)
 
         try:
-            task_list = json.loads(output) if output else []
+            task_list = _decode_export(output)
             if not task_list:
                 return (
                     f"Error: Task '{params.task_id}' not found.\n"
                     f"Tip: Use taskwarrior_list to find valid task IDs, "
                     f"or check if the task was completed/deleted."
                 )
-            task = _parse_task(task_list[0])
-        except json.JSONDecodeError:
+            task = _parse_task_fast(task_list[0])
+        except ValueError:
             return (
                 f"Error: Could not parse task '{params.task_id}'.\n"
                 f"Tip: This may indicate a Taskwarrior configuration issue."
@@ -616,31 +632,28 @@ async def taskwarrior_dependencies(params: DependenciesInput) -> str:
         blocks = blocks_map.get(task_uuid, [])
 
         # What blocks this task
+        dep_uuids = task.depends_uuids
+        resolved = await _get_tasks_by_uuid([d for d in dep_uuids if d not in uuid_to_task])
         blocked_by: list[TaskModel] = []
-        if task.depends:
-            dep_uuids = [d.strip() for d in task.depends.split(",") if d.strip()]
-            for dep_uuid in dep_uuids:
-                blocker = uuid_to_task.get(dep_uuid)
-                if blocker:
-                    blocked_by.append(blocker)
+        for dep_uuid in dep_uuids:
+            blocker = uuid_to_task.get(dep_uuid) or resolved.get(dep_uuid)
+            if blocker:
+                blocked_by.append(blocker)
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(
+            return _dump_json(
                 {
-                    "task": task.model_dump(),
-                    "blocks": [b.model_dump() for b in blocks] if params.direction in ["both", "blocks"] else [],
-                    "blocked_by": [b.model_dump() for b in blocked_by]
-                    if params.direction in ["both", "blocked_by"]
-                    else [],
+                    "task": task,
+                    "blocks": blocks if params.direction != "blocked_by" else [],
+                    "blocked_by": blocked_by if params.direction != "blocks" else [],
                     "ready": len([b for b in blocked_by if b.status == "pending"]) == 0,
-                },
-                indent=2,
+                }
             )
 
         # Markdown format
         lines = [f"# Dependencies for #{task_id}: {desc}", ""]
 
-        if params.direction in ["both", "blocks"]:
+        if params.direction != "blocked_by":
             lines.append(f"### ⬇️ Blocks ({len(blocks)} task(s) waiting)")
             if blocks:
                 for b in blocks:
@@ -651,7 +664,7 @@ async def taskwarrior_dependencies(params: DependenciesInput) -> str:
                 lines.append("(None)")
             lines.append("")
 
-        if params.direction in ["both", "blocked_by"]:
+        if params.direction != "blocks":
             lines.append(f"### ⬆️ Blocked By ({len(blocked_by)} task(s) required)")
             if blocked_by:
                 for b in blocked_by:
@@ -677,21 +690,25 @@ async def taskwarrior_dependencies(params: DependenciesInput) -> str:
     else:
         # Overview mode
         # Find bottlenecks (tasks that block the most others)
-        bottlenecks: list[BottleneckInfo] = []
-        for uuid, blocked_list in blocks_map.items():
-            bottleneck_task = uuid_to_task.get(uuid)
-            if bottleneck_task is not None and bottleneck_task.status == "pending":
-                bottlenecks.append(BottleneckInfo(task=bottleneck_task, blocks_count=len(blocked_list)))
-
-        bottlenecks.sort(key=lambda x: x.blocks_count, reverse=True)
+        candidates = (
+            (bottleneck_task, count)
+            for uuid, count in index.out_degree.items()
+            if (bottleneck_task := uuid_to_task.get(uuid)) is not None and bottleneck_task.status == "pending"
+        )
+        # Only the top 10 are ever shown, so only those become BottleneckInfo models
+        bottlenecks = [
+            BottleneckInfo.model_construct(task=bottleneck_task, blocks_count=count)
+            for bottleneck_task, count in heapq.nlargest(10, candidates, key=itemgetter(1))
+        ]
 
-        blocked_tasks = _get_blocked_tasks(pending_tasks)
-        ready_tasks = _get_ready_tasks(pending_tasks)
+        # Classified while the index was built; read-only here
+        blocked_tasks = index.blocked_tasks
+        ready_tasks = index.ready_tasks
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(
+            return _dump_json(
                 {
-                    "bottlenecks": [b.model_dump() for b in bottlenecks[:10]],
+                    "bottlenecks": bottlenecks,
                     "blocked": [t.id for t in blocked_tasks[:10]],
                     "ready": [t.id for t in ready_tasks[:10]],
                     "stats": {
@@ -699,8 +716,7 @@ async def taskwarrior_dependencies(params: DependenciesInput) -> str:
                         "blocked_count": len(blocked_tasks),
                         "ready_count": len(ready_tasks),
                     },
-                },
-                indent=2,
+                }
             )
 
         # Markdown format
@@ -719,7 +735,7 @@ async def taskwarrior_dependencies(params: DependenciesInput) -> str:
         if blocked_tasks[:5]:
             for t in blocked_tasks[:5]:
                 t_id = t.id if t.id else "?"
-                desc = t.description[:40] if t.description else ""
+                desc = t.description[:40]
                 lines.append(f"- #{t_id}: {desc}")
         else:
             lines.append("(None)")
@@ -775,52 +791,60 @@ async def taskwarrior_triage(params: TriageInput) -> str:
         - Only stale tasks: params with include_untagged=False, include_no_project=False
         - More aggressive: params with stale_days=7
     """
-    success, result = _get_tasks_json(status=TaskStatus.PENDING)
+    success, result = await _get_tasks_cached(status=TaskStatus.PENDING)
 
     if not success:
         return str(result)
 
-    raw_tasks = result if isinstance(result, list) else []
-    all_tasks = _parse_tasks(raw_tasks)
+    all_tasks = result if isinstance(result, list) else []
 
-    # Categorize tasks
+    # Categorize tasks, keeping at most `limit` per category
     stale: list[TaskModel] = []
     no_project: list[TaskModel] = []
     untagged: list[TaskModel] = []
     no_due: list[TaskModel] = []
 
+    limit = params.limit
+    # Disabled categories never collect anything, so they count as full
+    want_untagged = params.include_untagged
+    want_no_project = params.include_no_project
+    want_no_due = params.include_no_due
+
+    now = datetime.now(_UTC)
+    stale_threshold = _stale_threshold(params.stale_days, now)
     for task in all_tasks:
-        if params.include_untagged and not task.tags:
+        if want_untagged and not task.tags:
             untagged.append(task)
+            want_untagged = len(untagged) < limit
 
-        if params.include_no_project and not task.project:
+        if want_no_project and not task.project:
             no_project.append(task)
+            want_no_project = len(no_project) < limit
 
-        if params.include_no_due and not task.due:
+        if want_no_due and not task.due:
             no_due.append(task)
+            want_no_due = len(no_due) < limit
 
-        if _is_task_stale(task, params.stale_days):
+        want_stale = len(stale) < limit
+        if want_stale and _is_task_stale(task, stale_threshold):
             stale.append(task)
+            want_stale = len(stale) < limit
 
-    # Limit each category
-    stale = stale[: params.limit]
-    no_project = no_project[: params.limit]
-    untagged = untagged[: params.limit]
-    no_due = no_due[: params.limit]
+        if not (want_stale or want_untagged or want_no_project or want_no_due):
+            break
 
     total_items = len(stale) + len(no_project) + len(untagged) + len(no_due)
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(
+        return _dump_json(
             {
-                "stale": [t.model_dump() for t in stale],
-                "no_project": [t.model_dump() for t in no_project],
-                "untagged": [t.model_dump() for t in untagged],
-                "no_due": [t.model_dump() for t in no_due],
+                "stale": stale,
+                "no_project": no_project,
+                "untagged": untagged,
+                "no_due": no_due,
                 "total_items": total_items,
                 "total_pending": len(all_tasks),
-            },
-            indent=2,
+            }
         )
 
     # Markdown format
@@ -830,50 +854,33 @@ async def taskwarrior_triage(params: TriageInput) -> str:
     lines = [f"# Task Triage - {total_items} items need attention", ""]
 
     if stale:
-        stale_header = f"### 🕸️ Stale Tasks (>{params.stale_days} days) - {len(stale)} items"
-        lines.append(stale_header)
-        lines.append("| ID | Task | Age | Last Modified |")
-        lines.append("|----|------|-----|---------------|")
-        for task in stale:
-            task_id = task.id if task.id else "?"
-            desc = task.description[:30] if task.description else ""
-            age = _get_task_age_str(task)
-            modified = (task.modified or task.entry or "")[:10]
-            lines.append(f"| {task_id} | {desc} | {age} | {modified} |")
+        lines.append(f"### 🕸️ Stale Tasks (>{params.stale_days} days) - {len(stale)} items")
+        lines.append("| ID | Task | Age | Last Modified |\n|----|------|-----|---------------|")
+        lines.extend(
+            f"| {t.id or '?'} | {t.description[:30]} | {_get_task_age_str(t, now)} | "
+            f"{(t.modified or t.entry or '')[:10]} |"
+            for t in stale
+        )
         lines.append("")
 
     if no_project:
         lines.append(f"### 📁 No Project Assigned - {len(no_project)} items")
-        lines.append("| ID | Task | Created |")
-        lines.append("|----|------|---------|")
-        for task in no_project:
-            task_id = task.id if task.id else "?"
-            desc = task.description[:40] if task.description else ""
-            created = task.entry[:10] if task.entry else ""
-            lines.append(f"| {task_id} | {desc} | {created} |")
+        lines.append("| ID | Task | Created |\n|----|------|---------|")
+        lines.extend(f"| {t.id or '?'} | {t.description[:40]} | {(t.entry or '')[:10]} |" for t in no_project)
         lines.append("")
 
     if untagged:
         lines.append(f"### 🏷️ Untagged Tasks - {len(untagged)} items")
-        lines.append("| ID | Task | Project |")
-        lines.append("|----|------|---------|")
-        for task in untagged:
-            task_id = task.id if task.id else "?"
-            desc = task.description[:40] if task.description else ""
-            project = task.project or "-"
-            lines.append(f"| {task_id} | {desc} | {project} |")
+        lines.append("| ID | Task | Project |\n|----|------|---------|")
+        lines.extend(f"| {t.id or '?'} | {t.description[:40]} | {t.project or '-'} |" for t in untagged)
         lines.append("")
 
     if no_due:
         lines.append(f"### 📅 No Due Date - {len(no_due)} items")
-        lines.append("| ID | Task | Priority | Project |")
-        lines.append("|----|------|----------|---------|")
-        for task in no_due:
-            task_id = task.id if task.id else "?"
-            desc = task.description[:30] if task.description else ""
-            priority = task.priority or "-"
-            project = task.project or "-"
-            lines.append(f"| {task_id} | {desc} | {priority} | {project} |")
+        lines.append("| ID | Task | Priority | Project |\n|----|------|----------|---------|")
+        lines.extend(
+            f"| {t.id or '?'} | {t.description[:30]} | {t.priority or '-'} | {t.project or '-'} |" for t in no_due
+        )
         lines.append("")
 
     lines.append("### Triage Actions")
@@ -923,45 +930,36 @@ async def taskwarrior_context(params: ContextInput) -> str:
         - Task only: params with task_id="5", include_related=False
     """
     # Get the specific task
-    success, output = _run_task_command([params.task_id, "export"])
+    success, output = await _run_task_export_async([params.task_id, "export"])
 
     if not success:
-        return output
+        return str(output)
 
     try:
-        task_list = json.loads(output) if output else []
+        task_list = _decode_export(output)
         if not task_list:
             return (
                 f"Error: Task '{params.task_id}' not found.\n"
                 f"Tip: Use taskwarrior_list to find valid task IDs, "
                 f"or check if the task was completed/deleted."
             )
-        task = _parse_task(task_list[0])
-    except json.JSONDecodeError as e:
+        task = _parse_task_fast(task_list[0])
+    except ValueError as e:
         return f"Error: Failed to parse task data - {str(e)}\nTip: This may indicate a Taskwarrior configuration issue."
 
     # Get all tasks for dependency and related analysis
-    success, all_result = _get_tasks_json(status=TaskStatus.ALL)
-    raw_all_tasks = all_result if success and isinstance(all_result, list) else []
-    all_tasks = _parse_tasks(raw_all_tasks)
-    pending_tasks = [t for t in all_tasks if t.status == "pending"]
+    success, all_result = await _get_task_index(status=TaskStatus.ALL)
+    index = all_result if success and isinstance(all_result, _TaskIndex) else _build_task_index([])
+    pending_tasks = index.pending_tasks
 
     # Compute additional fields
     task_uuid = task.uuid or ""
-    age = _get_task_age_str(task)
+    now = datetime.now(_UTC)
+    age = _get_task_age_str(task, now)
 
     # Dependency status
-    blocking_count = 0
-    blocked_by_count = 0
-
-    if task.depends:
-        dep_uuids = [d.strip() for d in task.depends.split(",") if d.strip()]
-        uuid_to_task = {t.uuid: t for t in all_tasks if t.uuid}
-        blocked_by_count = sum(1 for d in dep_uuids if uuid_to_task.get(d) and uuid_to_task[d].status == "pending")
-
-    for t in pending_tasks:
-        if t.depends and task_uuid in t.depends:
-            blocking_count += 1
+    blocked_by_count = index.indegree.get(task_uuid, 0)
+    blocking_count = index.out_degree.get(task_uuid, 0)
 
     if blocked_by_count > 0:
         dep_status = f"Blocked by {blocked_by_count} task(s)"
@@ -979,9 +977,7 @@ async def taskwarrior_context(params: ContextInput) -> str:
     last_activity = "Unknown"
     if task.modified:
         try:
-            mod_dt = datetime.strptime(task.modified[:15], "%Y%m%dT%H%M%S")
-            now = datetime.now(timezone.utc)
-            mod_dt = mod_dt.replace(tzinfo=timezone.utc)
+            mod_dt = _parse_timestamp(task.modified)
             delta = now - mod_dt
             if delta.days == 0:
                 hours = delta.seconds // 3600
@@ -1002,13 +998,12 @@ async def taskwarrior_context(params: ContextInput) -> str:
     )
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(
+        return _dump_json(
             {
-                "task": task.model_dump(),
-                "computed": computed.model_dump(),
-                "related_tasks": [t.model_dump() for t in related] if params.include_related else [],
-            },
-            indent=2,
+                "task": task,
+                "computed": computed,
+                "related_tasks": related if params.include_related else [],
+            }
         )
 
     # Markdown format
@@ -1025,8 +1020,7 @@ async def taskwarrior_context(params: ContextInput) -> str:
     if task.project:
         lines.append(f"- **Project**: {task.project}")
     if task.priority:
-        priority_map = {"H": "High", "M": "Medium", "L": "Low"}
-        lines.append(f"- **Priority**: {priority_map.get(task.priority, task.priority)}")
+        lines.append(f"- **Priority**: {_PRIORITY_LABEL.get(task.priority, task.priority)}")
     if task.due:
         lines.append(f"- **Due**: {task.due}")
     if task.tags:
@@ -1057,7 +1051,7 @@ async def taskwarrior_context(params: ContextInput) -> str:
         lines.append(f"### Related Tasks ({len(related)} in same project)")
         for r in related:
             r_id = r.id if r.id else "?"
-            r_desc = r.description[:40] if r.description else ""
+            r_desc = r.description[:40]
             lines.append(f"- #{r_id}: {r_desc}")
 
     return "\n".join(lines)
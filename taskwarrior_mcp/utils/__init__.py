@@ -1,6 +1,15 @@
 """Utility functions for Taskwarrior MCP."""
 
-from taskwarrior_mcp.utils.cli import _get_tasks_json, _run_task_command
+from taskwarrior_mcp.utils.cache import _get_tasks_cached, _invalidate_task_cache
+from taskwarrior_mcp.utils.cli import (
+    _decode_export,
+    _get_tasks_json,
+    _get_tasks_json_async,
+    _run_task_command,
+    _run_task_command_async,
+    _run_task_export,
+    _run_task_export_async,
+)
 from taskwarrior_mcp.utils.formatters import (
     _format_task_concise,
     _format_task_markdown,
@@ -11,14 +20,29 @@ from taskwarrior_mcp.utils.parsers import (
     _enrich_task_dependencies,
     _enrich_tasks_dependencies,
     _parse_task,
+    _parse_task_fast,
     _parse_tasks,
+    _parse_tasks_async,
+    _parse_tasks_fast,
+    _parse_timestamp,
 )
 
 __all__ = [
     "_run_task_command",
+    "_run_task_command_async",
+    "_run_task_export",
+    "_run_task_export_async",
+    "_decode_export",
     "_get_tasks_json",
+    "_get_tasks_json_async",
+    "_get_tasks_cached",
+    "_invalidate_task_cache",
     "_parse_task",
+    "_parse_task_fast",
     "_parse_tasks",
+    "_parse_tasks_async",
+    "_parse_timestamp",
+    "_parse_tasks_fast",
     "_enrich_task_dependencies",
     "_enrich_tasks_dependencies",
     "_format_task_concise",
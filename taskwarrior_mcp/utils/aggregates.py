@@ -0,0 +1,49 @@
+"""Counts over a list of Taskwarrior tasks, shared by the summary tools."""
+
+from collections import Counter
+from dataclasses import dataclass
+from itertools import chain
+
+from taskwarrior_mcp.models.task import TaskModel
+
+# Priority bins reported even when empty, in display order
+_PRIORITY_KEYS = {"H": 0, "M": 0, "L": 0, "": 0}
+
+
+@dataclass(frozen=True)
+class _TaskAggregates:
+    """
+    Counts derived from one task list.
+
+    Built once per cached export (see `_get_task_aggregates`) and shared by
+    every tool reading that export, so treat all containers as read-only.
+    """
+
+    total: int
+    # Tasks that have been started
+    active: int
+    # Priority → task count, always including "H", "M", "L" and "" (none)
+    by_priority: Counter[str]
+    # Project (or "(none)") → task count, in first-seen order
+    project_counts: Counter[str]
+    # Tag → task count, in first-seen order
+    tag_counts: Counter[str]
+
+
+def _compute_aggregates(tasks: list[TaskModel]) -> _TaskAggregates:
+    """
+    Count tasks by priority, project and tag.
+
+    Each count is built by `Counter` from an iterable, which tallies in C,
+    rather than by incrementing counters one task at a time.
+    """
+    by_priority: Counter[str] = Counter(_PRIORITY_KEYS)
+    by_priority.update([task.priority or "" for task in tasks])
+
+    return _TaskAggregates(
+        total=len(tasks),
+        active=sum(1 for task in tasks if task.start),
+        by_priority=by_priority,
+        project_counts=Counter([task.project or "(none)" for task in tasks]),
+        tag_counts=Counter(chain.from_iterable([task.tags for task in tasks])),
+    )
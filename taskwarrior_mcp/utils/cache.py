@@ -0,0 +1,294 @@
+"""In-process cache of parsed Taskwarrior exports."""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from taskwarrior_mcp.enums import TaskStatus
+from taskwarrior_mcp.models.task import TaskModel
+from taskwarrior_mcp.utils.aggregates import _compute_aggregates, _TaskAggregates
+from taskwarrior_mcp.utils.cli import _decode_export, _get_tasks_json_async, _run_task_export_async
+from taskwarrior_mcp.utils.index import _build_task_index, _TaskIndex
+from taskwarrior_mcp.utils.parsers import _CPU_POOL, _parse_task_fast, _parse_tasks_async
+
+# Seconds a cached export stays valid when the data files cannot be checked;
+# write tools invalidate immediately.
+_CACHE_TTL = 2.0
+# Seconds a cached export stays valid while the data files are unchanged.
+# Urgency drifts with time even when no task is modified, so this is bounded.
+_CACHE_MAX_AGE = 60.0
+# Maximum number of cached queries; the least recently used is evicted.
+_CACHE_SIZE = 32
+# Maximum number of cached raw exports for specific task IDs (get/bulk_get).
+_RECORD_CACHE_SIZE = 128
+
+# Files Taskwarrior rewrites on every change: 2.x data files and the 3.x database
+_DATA_FILES = ("pending.data", "completed.data", "taskchampion.sqlite3", "taskchampion.sqlite3-wal")
+
+_CacheKey = tuple[str | None, TaskStatus, frozenset[str] | None]
+# (mtime_ns, size) per data file, None for files that do not exist
+_DataSignature = tuple[tuple[int, int] | None, ...]
+
+
+@lru_cache(maxsize=8)
+def _taskrc_data_location(taskrc: str, mtime_ns: int | None) -> str | None:
+    """
+    Read `data.location` from a taskrc file, if it sets one.
+
+    `mtime_ns` is only part of the cache key, so an edited taskrc is read again.
+    """
+    try:
+        with open(taskrc, encoding="utf-8") as f:
+            for line in f:
+                key, sep, value = line.partition("=")
+                if sep and key.strip() == "data.location":
+                    return value.split("#", 1)[0].strip() or None
+    except (OSError, UnicodeDecodeError):
+        return None
+    return None
+
+
+def _task_data_dir() -> str:
+    """Directory Taskwarrior keeps its data in, resolved the way `task` does."""
+    if taskdata := os.environ.get("TASKDATA"):
+        return os.path.expanduser(taskdata)
+    taskrc = os.path.expanduser(os.environ.get("TASKRC", "~/.taskrc"))
+    try:
+        mtime_ns: int | None = os.stat(taskrc).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return os.path.expanduser(_taskrc_data_location(taskrc, mtime_ns) or "~/.task")
+
+
+def _data_signature() -> _DataSignature | None:
+    """
+    Stat Taskwarrior's data files to detect changes made outside this server.
+
+    Returns:
+        The files' (mtime_ns, size) pairs, or None if no data file was found
+    """
+    data_dir = _task_data_dir()
+    signature: list[tuple[int, int] | None] = []
+    for name in _DATA_FILES:
+        try:
+            st = os.stat(os.path.join(data_dir, name))
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature) if any(signature) else None
+
+
+@dataclass
+class _CacheEntry:
+    """Parsed export for one (filter, status, fields) combination."""
+
+    loaded_at: float
+    tasks: list[TaskModel]
+    # Data file signature taken before the export, None if unavailable
+    signature: _DataSignature | None = None
+    # Dependency index, built on first use
+    index: _TaskIndex | None = None
+    # Priority/project/tag counts, built on first use
+    aggregates: _TaskAggregates | None = None
+
+
+@dataclass
+class _RecordEntry:
+    """Decoded export records for one exact `task ... export` command."""
+
+    loaded_at: float
+    records: list[dict[str, Any]]
+    signature: _DataSignature | None = None
+
+
+_task_cache: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+_record_cache: OrderedDict[tuple[str, ...], _RecordEntry] = OrderedDict()
+# Bumped on every invalidation so loads that started before a write are not stored.
+_cache_epoch = 0
+
+
+def _invalidate_task_cache() -> None:
+    """Drop all cached exports. Called by every tool that modifies tasks."""
+    global _cache_epoch
+    _cache_epoch += 1
+    _task_cache.clear()
+    _record_cache.clear()
+
+
+def _is_fresh(loaded_at: float, cached: _DataSignature | None, current: _DataSignature | None) -> bool:
+    """Whether an entry loaded at `loaded_at` with data signature `cached` can be reused."""
+    age = time.monotonic() - loaded_at
+    if current is None:
+        return age < _CACHE_TTL
+    return current == cached and age < _CACHE_MAX_AGE
+
+
+async def _load_entry(key: _CacheKey) -> tuple[bool, _CacheEntry | str]:
+    """
+    Return the cache entry for `key`, exporting and parsing on a miss.
+
+    An entry is reused for up to `_CACHE_MAX_AGE` seconds while Taskwarrior's
+    data files are unchanged, so edits made with the `task` CLI are picked up
+    on the next call. When the files cannot be checked, it is reused for
+    `_CACHE_TTL` seconds.
+    """
+    signature = _data_signature()
+    entry = _task_cache.get(key)
+    if entry is not None and _is_fresh(entry.loaded_at, entry.signature, signature):
+        _task_cache.move_to_end(key)
+        return True, entry
+
+    filter_expr, status, fields = key
+    epoch = _cache_epoch
+    started = time.monotonic()
+    success, result = await _get_tasks_json_async(filter_expr, status)
+    if not success:
+        return False, str(result)
+
+    raw_tasks = result if isinstance(result, list) else []
+    entry = _CacheEntry(loaded_at=started, tasks=await _parse_tasks_async(raw_tasks, fields), signature=signature)
+    if epoch == _cache_epoch:
+        _task_cache[key] = entry
+        _task_cache.move_to_end(key)
+        while len(_task_cache) > _CACHE_SIZE:
+            _task_cache.popitem(last=False)
+    return True, entry
+
+
+async def _get_tasks_cached(
+    filter_expr: str | None = None,
+    status: TaskStatus = TaskStatus.PENDING,
+    fields: frozenset[str] | None = None,
+) -> tuple[bool, list[TaskModel] | str]:
+    """
+    Get parsed tasks, reusing a recent export for the same query.
+
+    Back-to-back read tools share one `task export` and one parse instead of
+    each spawning Taskwarrior. See `_load_entry` for when entries expire; all
+    are dropped by `_invalidate_task_cache`.
+
+    Args:
+        filter_expr: Optional filter expression
+        status: Task status to filter
+        fields: Optional set of attributes to keep (see `_parse_tasks`)
+
+    Returns:
+        Tuple of (success: bool, tasks: List[TaskModel] | error: str)
+    """
+    success, entry = await _load_entry((filter_expr, status, fields))
+    if not success or not isinstance(entry, _CacheEntry):
+        return False, str(entry)
+    return True, list(entry.tasks)
+
+
+async def _get_task_index(
+    filter_expr: str | None = None,
+    status: TaskStatus = TaskStatus.PENDING,
+) -> tuple[bool, _TaskIndex | str]:
+    """
+    Get the dependency index for a query, built once per cached export.
+
+    Args:
+        filter_expr: Optional filter expression
+        status: Task status to filter
+
+    Returns:
+        Tuple of (success: bool, index: _TaskIndex | error: str)
+    """
+    success, entry = await _load_entry((filter_expr, status, None))
+    if not success or not isinstance(entry, _CacheEntry):
+        return False, str(entry)
+    if entry.index is None:
+        loop = asyncio.get_running_loop()
+        entry.index = await loop.run_in_executor(_CPU_POOL, _build_task_index, entry.tasks)
+    return True, entry.index
+
+
+async def _get_task_aggregates(
+    filter_expr: str | None = None,
+    status: TaskStatus = TaskStatus.PENDING,
+    fields: frozenset[str] | None = None,
+) -> tuple[bool, _TaskAggregates | str]:
+    """
+    Get priority, project and tag counts for a query, computed once per cached export.
+
+    Args:
+        filter_expr: Optional filter expression
+        status: Task status to filter
+        fields: Optional set of attributes to keep (see `_parse_tasks`)
+
+    Returns:
+        Tuple of (success: bool, aggregates: _TaskAggregates | error: str)
+    """
+    success, entry = await _load_entry((filter_expr, status, fields))
+    if not success or not isinstance(entry, _CacheEntry):
+        return False, str(entry)
+    if entry.aggregates is None:
+        entry.aggregates = _compute_aggregates(entry.tasks)
+    return True, entry.aggregates
+
+
+async def _get_task_records_cached(args: list[str]) -> tuple[bool, list[dict[str, Any]] | str]:
+    """
+    Run `task <args>` (an export) and decode it, reusing a recent identical export.
+
+    For lookups of specific tasks by ID or UUID, which are repeated far more
+    often than the tasks change. Entries expire like `_load_entry`'s and are
+    dropped by `_invalidate_task_cache`. The records are shared between
+    calls, so callers must not modify them.
+
+    Args:
+        args: Arguments for `task`, ending in `export`
+
+    Returns:
+        Tuple of (success: bool, records: List[dict] | error: str)
+
+    Raises:
+        ValueError: If Taskwarrior's output is not valid JSON
+    """
+    key = tuple(args)
+    signature = _data_signature()
+    entry = _record_cache.get(key)
+    if entry is not None and _is_fresh(entry.loaded_at, entry.signature, signature):
+        _record_cache.move_to_end(key)
+        return True, entry.records
+
+    epoch = _cache_epoch
+    started = time.monotonic()
+    success, output = await _run_task_export_async(args)
+    if not success:
+        return False, str(output)
+
+    records = _decode_export(output)
+    if epoch == _cache_epoch:
+        _record_cache[key] = _RecordEntry(loaded_at=started, records=records, signature=signature)
+        _record_cache.move_to_end(key)
+        while len(_record_cache) > _RECORD_CACHE_SIZE:
+            _record_cache.popitem(last=False)
+    return True, records
+
+
+async def _get_tasks_by_uuid(uuids: list[str]) -> dict[str, TaskModel]:
+    """
+    Export the tasks with the given UUIDs, whatever their status, in one call.
+
+    Used to resolve dependencies that are absent from a filtered or
+    pending-only export. Tasks that cannot be exported are left out of the
+    result.
+    """
+    if not uuids:
+        return {}
+    # Bare UUID terms are ORed together by Taskwarrior; sorted so the same set
+    # hits the same cache entry
+    try:
+        success, records = await _get_task_records_cached([*sorted(set(uuids)), "export"])
+    except ValueError:
+        return {}
+    if not success or isinstance(records, str):
+        return {}
+    return {task.uuid: task for task in map(_parse_task_fast, records) if task.uuid}
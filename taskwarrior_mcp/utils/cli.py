@@ -1,36 +1,49 @@
 """CLI utilities for Taskwarrior interaction."""
 
-import json
+import asyncio
 import subprocess
 from typing import Any
 
+from pydantic_core import from_json
+
 from taskwarrior_mcp.enums import TaskStatus
 
+# Filter term for each status; ALL means no status filter
+_STATUS_ARG: dict[TaskStatus, str | None] = {
+    TaskStatus.PENDING: "status:pending",
+    TaskStatus.COMPLETED: "status:completed",
+    TaskStatus.DELETED: "status:deleted",
+    TaskStatus.ALL: None,
+}
 
-def _run_task_command(args: list[str], input_text: str | None = None) -> tuple[bool, str]:
+# Seconds to wait for Taskwarrior before giving up
+_TIMEOUT = 30
+
+
+def _run_task_process(
+    args: list[str], input_text: str | None = None, text: bool = True
+) -> tuple[bool, subprocess.CompletedProcess[Any] | str]:
     """
-    Execute a Taskwarrior command and return the result.
+    Spawn Taskwarrior and wait for it, mapping launch failures to error strings.
 
     Args:
         args: List of command arguments (without 'task' prefix)
         input_text: Optional input to send to stdin (for confirmations)
+        text: Decode stdout/stderr to str; pass False to read raw bytes
 
     Returns:
-        Tuple of (success: bool, output: str)
+        Tuple of (success: bool, result: CompletedProcess | error: str)
     """
     try:
-        cmd = ["task"] + args
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, input=input_text)
-
-        output = result.stdout.strip()
-        if result.returncode != 0:
-            error = result.stderr.strip() or output
-            return False, f"Error: {error}"
-
-        return True, output
-
+        return True, subprocess.run(
+            ["task", *args],
+            capture_output=True,
+            text=text,
+            timeout=_TIMEOUT,
+            input=input_text if text or input_text is None else input_text.encode(),
+        )
     except subprocess.TimeoutExpired:
-        return False, "Error: Command timed out after 30 seconds"
+        return False, f"Error: Command timed out after {_TIMEOUT} seconds"
     except FileNotFoundError:
         return False, (
             "Error: Taskwarrior is not installed or not in PATH. Install it with 'brew install task' or equivalent."
@@ -39,6 +52,75 @@ def _run_task_command(args: list[str], input_text: str | None = None) -> tuple[b
         return False, f"Error: Unexpected error - {type(e).__name__}: {str(e)}"
 
 
+def _run_task_command(args: list[str], input_text: str | None = None) -> tuple[bool, str]:
+    """
+    Execute a Taskwarrior command and return the result.
+
+    Args:
+        args: List of command arguments (without 'task' prefix)
+        input_text: Optional input to send to stdin (for confirmations)
+
+    Returns:
+        Tuple of (success: bool, output: str)
+    """
+    success, result = _run_task_process(args, input_text)
+    if not success or isinstance(result, str):
+        return False, str(result)
+
+    output = result.stdout.strip()
+    if result.returncode != 0:
+        error = result.stderr.strip() or output
+        return False, f"Error: {error}"
+
+    return True, output
+
+
+def _as_text(data: bytes | str) -> str:
+    """Decode output read in binary mode for use in a message."""
+    return data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+
+
+def _run_task_export(args: list[str]) -> tuple[bool, bytes | str]:
+    """
+    Execute a Taskwarrior `export` command and return its raw stdout.
+
+    Unlike `_run_task_command`, stdout is read as bytes and handed back
+    exactly as read: large exports are neither decoded to str nor copied
+    again by `strip()`, since the JSON decoder takes bytes and skips
+    surrounding whitespace itself. Use `_decode_export` to parse the result.
+    `rc.json.array=on` is added before 'export', so the output is a single
+    JSON array whatever the user's json.array setting.
+
+    Args:
+        args: List of command arguments (without 'task' prefix), ending in 'export'
+
+    Returns:
+        Tuple of (success: bool, output: bytes | error: str)
+    """
+    success, result = _run_task_process([*args[:-1], "rc.json.array=on", args[-1]], text=False)
+    if not success or isinstance(result, str):
+        return False, str(result)
+
+    if result.returncode != 0:
+        # Only the (short) error output is ever decoded
+        error = _as_text(result.stderr).strip() or _as_text(result.stdout).strip()
+        return False, f"Error: {error}"
+
+    return True, result.stdout
+
+
+def _decode_export(output: bytes | str) -> Any:
+    """
+    Decode `task export` output, treating blank output as no tasks.
+
+    Raises:
+        ValueError: If the output is not valid JSON
+    """
+    if not output or output.isspace():
+        return []
+    return from_json(output)
+
+
 def _get_tasks_json(
     filter_expr: str | None = None,
     status: TaskStatus = TaskStatus.PENDING,
@@ -56,13 +138,8 @@ def _get_tasks_json(
     args = []
 
     # Add status filter
-    if status == TaskStatus.PENDING:
-        args.append("status:pending")
-    elif status == TaskStatus.COMPLETED:
-        args.append("status:completed")
-    elif status == TaskStatus.DELETED:
-        args.append("status:deleted")
-    # ALL means no status filter
+    if status_arg := _STATUS_ARG[status]:
+        args.append(status_arg)
 
     # Add custom filter
     if filter_expr:
@@ -70,12 +147,43 @@ def _get_tasks_json(
 
     args.append("export")
 
-    success, output = _run_task_command(args)
+    success, output = _run_task_export(args)
     if not success:
-        return False, output
+        return False, str(output)
 
     try:
-        tasks = json.loads(output) if output else []
+        tasks = _decode_export(output)
         return True, tasks
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return False, f"Error: Failed to parse task output - {str(e)}"
+
+
+async def _run_task_command_async(args: list[str], input_text: str | None = None) -> tuple[bool, str]:
+    """
+    Execute a Taskwarrior command without blocking the event loop.
+
+    The subprocess wait is I/O-bound, so it is handed to a worker thread and
+    awaited; see `_run_task_command` for arguments and return value.
+    """
+    return await asyncio.to_thread(_run_task_command, args, input_text)
+
+
+async def _run_task_export_async(args: list[str]) -> tuple[bool, bytes | str]:
+    """
+    Execute a Taskwarrior `export` command without blocking the event loop.
+
+    See `_run_task_export` for arguments and return value.
+    """
+    return await asyncio.to_thread(_run_task_export, args)
+
+
+async def _get_tasks_json_async(
+    filter_expr: str | None = None,
+    status: TaskStatus = TaskStatus.PENDING,
+) -> tuple[bool, list[dict[str, Any]] | str]:
+    """
+    Get tasks as JSON from Taskwarrior without blocking the event loop.
+
+    See `_get_tasks_json` for arguments and return value.
+    """
+    return await asyncio.to_thread(_get_tasks_json, filter_expr, status)
@@ -1,7 +1,42 @@
 """Formatting utilities for task output."""
 
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
 from taskwarrior_mcp.models.task import TaskModel
 
+# Lookup tables for the task header and details line
+_STATUS_ICON = {"pending": "", "completed": "", "deleted": ""}
+_PRIORITY_LABEL = {"H": "High", "M": "Medium", "L": "Low"}
+
+
+def _dump_json(payload: Any, indent: int | None = 2) -> str:
+    """
+    Serialize a JSON response, encoding any Pydantic models it contains directly.
+
+    Models are written by pydantic_core's serializer without first being
+    converted to dicts with `model_dump()`. Pass `indent=None` for compact
+    output on responses that can be large.
+    """
+    return to_json(payload, indent=indent).decode()
+
+
+_TASK_LIST_ADAPTER = TypeAdapter(list[TaskModel])
+
+
+def _dump_tasks_json(tasks: list[TaskModel], indent: int | None = 2) -> str:
+    """
+    Serialize a list of tasks as a JSON array.
+
+    Goes through a `TypeAdapter` built once for `list[TaskModel]`, so the
+    serializer is fixed up front instead of inferred for each item as
+    `_dump_json` does.
+    """
+    return _TASK_LIST_ADAPTER.dump_json(tasks, indent=indent).decode()
+
 
 def _format_task_concise(task: TaskModel) -> str:
     """
@@ -10,19 +45,19 @@ def _format_task_concise(task: TaskModel) -> str:
     Output: "#5: Description (H, due:2024-12-31, project:work)"
     If blocked: "#5: Description (H, BLOCKED(2))"
     """
-    task_id = task.id if task.id else "?"
-    desc = task.description[:50] if task.description else "No description"
+    task_id = task.id or "?"
+    desc = task.description[:50] or "No description"
 
-    # Build compact metadata
+    # Build compact metadata, reading each field once
     meta = []
-    if task.priority:
-        meta.append(task.priority)
-    if task.due:
-        meta.append(f"due:{task.due[:10]}")
-    if task.project:
-        meta.append(f"proj:{task.project}")
-    if task.blocked_by_pending > 0:
-        meta.append(f"BLOCKED({task.blocked_by_pending})")
+    if priority := task.priority:
+        meta.append(priority)
+    if due := task.due:
+        meta.append(f"due:{due[:10]}")
+    if project := task.project:
+        meta.append(f"proj:{project}")
+    if (blocked := task.blocked_by_pending) > 0:
+        meta.append(f"BLOCKED({blocked})")
 
     if meta:
         return f"#{task_id}: {desc} ({', '.join(meta)})"
@@ -41,82 +76,102 @@ def _format_tasks_concise(tasks: list[TaskModel], title: str | None = None) -> s
     if not tasks:
         return "0 tasks"
 
-    lines = []
-
     # Header with count
     header = f"{len(tasks)} task(s)"
     if title:
         header = f"{len(tasks)} task(s) | {title}"
-    lines.append(header)
+    lines = [header]
 
     # Task lines
-    for task in tasks:
-        lines.append(_format_task_concise(task))
+    lines.extend(map(_format_task_concise, tasks))
 
     return "\n".join(lines)
 
 
-def _format_task_markdown(task: TaskModel) -> str:
-    """Format a single task as markdown."""
-    lines = []
-
+def _render_task_markdown(task: TaskModel) -> str:
+    """Render the markdown block for `task`; see `_format_task_markdown`."""
     # Header with ID and description
-    task_id = task.id if task.id else (task.uuid[:8] if task.uuid else "?")
+    task_id = task.id or (task.uuid[:8] if task.uuid else "?")
     desc = task.description or "No description"
-    status = task.status
-
-    status_icon = {"pending": "", "completed": "", "deleted": ""}
-    icon = status_icon.get(status, "")
-
-    lines.append(f"### {icon} [{task_id}] {desc}")
+    lines = [f"### {_STATUS_ICON.get(task.status, '')} [{task_id}] {desc}"]
 
     # Details
     details = []
-    if task.project:
-        details.append(f"**Project**: {task.project}")
-    if task.priority:
-        priority_map = {"H": "High", "M": "Medium", "L": "Low"}
-        details.append(f"**Priority**: {priority_map.get(task.priority, task.priority)}")
-    if task.due:
-        details.append(f"**Due**: {task.due}")
-    if task.tags:
-        details.append(f"**Tags**: {', '.join(task.tags)}")
-    if task.urgency:
-        details.append(f"**Urgency**: {task.urgency:.2f}")
+    if project := task.project:
+        details.append(f"**Project**: {project}")
+    if priority := task.priority:
+        details.append(f"**Priority**: {_PRIORITY_LABEL.get(priority, priority)}")
+    if due := task.due:
+        details.append(f"**Due**: {due}")
+    if tags := task.tags:
+        details.append(f"**Tags**: {', '.join(tags)}")
+    if urgency := task.urgency:
+        details.append(f"**Urgency**: {urgency:.2f}")
 
     if details:
         lines.append(" | ".join(details))
 
     # Annotations
-    if task.annotations:
+    if annotations := task.annotations:
         lines.append("**Notes:**")
-        for ann in task.annotations:
-            entry = ann.entry[:10] if ann.entry else ""
-            lines.append(f"  - [{entry}] {ann.description}")
+        lines.extend(f"  - [{ann.entry[:10] if ann.entry else ''}] {ann.description}" for ann in annotations)
 
     # Resolved dependencies
-    if task.depends_on:
-        lines.append("")
-        if task.blocked_by_pending > 0:
-            lines.append(f"**Blocked by** ({task.blocked_by_pending} pending):")
+    if depends_on := task.depends_on:
+        if (blocked_by_pending := task.blocked_by_pending) > 0:
+            lines.extend(("", f"**Blocked by** ({blocked_by_pending} pending):"))
         else:
-            lines.append("**Dependencies** (all resolved):")
-        for dep in task.depends_on:
-            status_indicator = "⏳" if dep.status == "pending" else "✓"
-            lines.append(f"  - {status_indicator} #{dep.id}: {dep.description}")
+            lines.extend(("", "**Dependencies** (all resolved):"))
+        lines.extend(
+            f"  - {'⏳' if dep.status == 'pending' else '✓'} #{dep.id}: {dep.description}" for dep in depends_on
+        )
 
     return "\n".join(lines)
 
 
+# Maximum number of rendered task blocks kept; the least recently used is evicted.
+_MARKDOWN_CACHE_SIZE = 2048
+_markdown_cache: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+
+
+def _format_task_markdown(task: TaskModel) -> str:
+    """
+    Format a single task as markdown.
+
+    Blocks are memoized on the task's UUID and modification time, which
+    change whenever a stored attribute does, plus what can change without
+    them: the working-set ID, urgency and the resolved dependencies. Tasks
+    without a UUID or modification time are rendered every time.
+    """
+    if not task.uuid or not task.modified:
+        return _render_task_markdown(task)
+    key = (
+        task.uuid,
+        task.modified,
+        task.id,
+        task.urgency,
+        task.blocked_by_pending,
+        tuple((dep.id, dep.description, dep.status) for dep in task.depends_on),
+    )
+    block = _markdown_cache.get(key)
+    if block is None:
+        block = _markdown_cache[key] = _render_task_markdown(task)
+        if len(_markdown_cache) > _MARKDOWN_CACHE_SIZE:
+            _markdown_cache.popitem(last=False)
+    else:
+        _markdown_cache.move_to_end(key)
+    return block
+
+
 def _format_tasks_markdown(tasks: list[TaskModel], title: str = "Tasks") -> str:
-    """Format a list of tasks as markdown."""
+    """
+    Format a list of tasks as markdown.
+
+    Each task's block comes from the memoized `_format_task_markdown`, so the
+    blocks are joined once here rather than re-split into lines.
+    """
     if not tasks:
         return f"# {title}\n\nNo tasks found."
 
-    lines = [f"# {title}", f"*{len(tasks)} task(s)*", ""]
-
-    for task in tasks:
-        lines.append(_format_task_markdown(task))
-        lines.append("")
-
-    return "\n".join(lines)
+    body = "\n\n".join(map(_format_task_markdown, tasks))
+    return f"# {title}\n*{len(tasks)} task(s)*\n\n{body}\n"
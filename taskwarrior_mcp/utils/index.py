@@ -0,0 +1,82 @@
+"""Dependency index over a list of Taskwarrior tasks."""
+
+from dataclasses import dataclass
+
+from taskwarrior_mcp.models.task import TaskModel
+
+
+@dataclass(frozen=True)
+class _TaskIndex:
+    """
+    Lookups derived from one task list.
+
+    Built once per cached export (see `_get_task_index`) and shared by every
+    tool reading that export, so treat all containers as read-only.
+    """
+
+    tasks: list[TaskModel]
+    # UUID → task, for every task in the list
+    uuid_to_task: dict[str, TaskModel]
+    # UUIDs of pending tasks
+    pending_uuids: frozenset[str]
+    # UUID → pending tasks that depend on it ("what this task blocks")
+    blocks_map: dict[str, list[TaskModel]]
+    # UUID → number of pending tasks it blocks (out-degree in the dependency graph)
+    out_degree: dict[str, int]
+    # UUID → number of distinct pending tasks it waits on (in-degree); tasks
+    # waiting on nothing pending are left out
+    indegree: dict[str, int]
+    # Pending tasks in export order, split by whether a dependency is still pending
+    pending_tasks: list[TaskModel]
+    ready_tasks: list[TaskModel]
+    blocked_tasks: list[TaskModel]
+
+
+def _build_task_index(tasks: list[TaskModel]) -> _TaskIndex:
+    """
+    Build a `_TaskIndex` in two passes over `tasks`.
+
+    The first pass maps UUIDs and collects pending tasks and their dependents.
+    The second computes each task's in-degree, which needs every pending UUID,
+    and splits pending tasks into ready (in-degree zero) and blocked. Only the
+    ready frontier is ever queried, so no full topological order is built.
+    """
+    uuid_to_task: dict[str, TaskModel] = {}
+    pending_uuids: set[str] = set()
+    blocks_map: dict[str, list[TaskModel]] = {}
+    pending_tasks: list[TaskModel] = []
+
+    for task in tasks:
+        if task.uuid:
+            uuid_to_task[task.uuid] = task
+        if task.status != "pending":
+            continue
+        if task.uuid:
+            pending_uuids.add(task.uuid)
+        pending_tasks.append(task)
+        for dep_uuid in dict.fromkeys(task.depends_uuids):
+            blocks_map.setdefault(dep_uuid, []).append(task)
+
+    indegree: dict[str, int] = {}
+    ready_tasks: list[TaskModel] = []
+    blocked_tasks: list[TaskModel] = []
+    for task in tasks:
+        waiting_on = 0
+        if task.depends_uuids:
+            waiting_on = sum(1 for d in dict.fromkeys(task.depends_uuids) if d in pending_uuids)
+            if waiting_on and task.uuid:
+                indegree[task.uuid] = waiting_on
+        if task.status == "pending":
+            (blocked_tasks if waiting_on else ready_tasks).append(task)
+
+    return _TaskIndex(
+        tasks=tasks,
+        uuid_to_task=uuid_to_task,
+        pending_uuids=frozenset(pending_uuids),
+        blocks_map=blocks_map,
+        out_degree={uuid: len(dependents) for uuid, dependents in blocks_map.items()},
+        indegree=indegree,
+        pending_tasks=pending_tasks,
+        ready_tasks=ready_tasks,
+        blocked_tasks=blocked_tasks,
+    )
@@ -1,8 +1,57 @@
 """Parser helpers for Taskwarrior data."""
 
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any
 
-from taskwarrior_mcp.models.task import ResolvedDependency, TaskModel
+from taskwarrior_mcp.models.task import ResolvedDependency, TaskAnnotation, TaskModel
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Parse a Taskwarrior timestamp such as ``20250130T100000Z`` into a UTC datetime.
+
+    Taskwarrior always exports fixed-width ``YYYYMMDDTHHMMSS`` timestamps, so the
+    fields are sliced out directly rather than interpreted by `strptime`.
+
+    Raises:
+        ValueError: If the value is not a valid Taskwarrior timestamp
+    """
+    if len(value) < 15 or value[8] != "T":
+        raise ValueError(f"Invalid Taskwarrior timestamp: {value!r}")
+    return datetime(
+        int(value[0:4]),
+        int(value[4:6]),
+        int(value[6:8]),
+        int(value[9:11]),
+        int(value[11:13]),
+        int(value[13:15]),
+        tzinfo=timezone.utc,
+    )
+
+
+# Export attributes that map to a TaskModel field; everything else is kept
+# under `extra`. A UDA that happens to be called "extra" goes there too.
+_TASK_FIELDS = frozenset(TaskModel.model_fields) - {"extra"}
+
+
+def _split_extra(task_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Move attributes TaskModel has no field for under its `extra` field.
+
+    Returns `task_dict` itself when every attribute has a field.
+    """
+    if task_dict.keys() <= _TASK_FIELDS:
+        return task_dict
+    data: dict[str, Any] = {}
+    extra: dict[str, Any] = {}
+    for key, value in task_dict.items():
+        (data if key in _TASK_FIELDS else extra)[key] = value
+    data["extra"] = extra
+    return data
 
 
 def _parse_task(task_dict: dict[str, Any]) -> TaskModel:
@@ -15,20 +64,109 @@ def _parse_task(task_dict: dict[str, Any]) -> TaskModel:
     Returns:
         TaskModel instance with validated data
     """
-    return TaskModel.model_validate(task_dict)
+    return TaskModel.model_validate(_split_extra(task_dict))
 
 
-def _parse_tasks(tasks: list[dict[str, Any]]) -> list[TaskModel]:
+def _parse_tasks(tasks: list[dict[str, Any]], fields: frozenset[str] | None = None) -> list[TaskModel]:
     """
     Parse a list of task dictionaries into TaskModel instances.
 
     Args:
         tasks: List of dictionaries from Taskwarrior JSON export
+        fields: Optional set of attributes to keep; others (annotations, UDAs,
+            etc.) are dropped before validation. Only for callers that never
+            emit the tasks themselves.
+
+    Returns:
+        List of TaskModel instances
+    """
+    if fields is None:
+        return [_parse_task(t) for t in tasks]
+    return [_parse_task({k: v for k, v in t.items() if k in fields}) for t in tasks]
+
+
+# String attributes interned on parse. The same project, status or priority is
+# one shared object across every parsed task, and a task's UUID is the same
+# object as the interned dependency UUIDs that point at it.
+_INTERNED_FIELDS = ("status", "project", "priority", "uuid")
+
+
+def _parse_task_fast(task_dict: dict[str, Any], fields: frozenset[str] | None = None) -> TaskModel:
+    """
+    Build a TaskModel from Taskwarrior export data without validation.
+
+    `task export` output is already typed by Taskwarrior, so read-only paths
+    skip Pydantic's validation and only normalize the few values the rest of
+    the code relies on. Use `_parse_task` for anything user-supplied.
+
+    Args:
+        task_dict: Dictionary from Taskwarrior JSON export
+        fields: Optional set of attributes to keep (see `_parse_tasks`)
+
+    Returns:
+        TaskModel instance
+    """
+    if fields is None:
+        data = dict(_split_extra(task_dict))
+    else:
+        data = _split_extra({k: v for k, v in task_dict.items() if k in fields})
+    if "urgency" in data:
+        data["urgency"] = float(data["urgency"])
+    depends_uuids = None
+    if isinstance(depends := data.get("depends"), list):
+        # Taskwarrior 2.6+ exports depends as an array of UUIDs; keep it split
+        # for `depends_uuids` instead of re-splitting the joined string later
+        depends_uuids = tuple(sys.intern(d) for d in depends if d)
+        data["depends"] = ",".join(depends)
+    for key in _INTERNED_FIELDS:
+        if value := data.get(key):
+            data[key] = sys.intern(value)
+    if tags := data.get("tags"):
+        data["tags"] = [sys.intern(tag) for tag in tags]
+    if annotations := data.get("annotations"):
+        data["annotations"] = [TaskAnnotation.model_construct(**a) for a in annotations]
+    task = TaskModel.model_construct(**data)
+    if depends_uuids is not None:
+        # Seed the cached property, which stores its value the same way
+        task.__dict__["depends_uuids"] = depends_uuids
+    return task
+
+
+def _parse_tasks_fast(tasks: list[dict[str, Any]], fields: frozenset[str] | None = None) -> list[TaskModel]:
+    """
+    Build TaskModel instances from Taskwarrior export data without validation.
+
+    Args:
+        tasks: List of dictionaries from Taskwarrior JSON export
+        fields: Optional set of attributes to keep (see `_parse_tasks`)
 
     Returns:
         List of TaskModel instances
     """
-    return [TaskModel.model_validate(t) for t in tasks]
+    return [_parse_task_fast(t, fields) for t in tasks]
+
+
+# Dedicated pool for CPU-bound parsing so it never competes with the threads
+# that wait on Taskwarrior subprocesses (asyncio's default executor).
+_CPU_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="taskwarrior-parse")
+
+
+async def _parse_tasks_async(tasks: list[dict[str, Any]], fields: frozenset[str] | None = None) -> list[TaskModel]:
+    """
+    Parse exported task dictionaries on the CPU pool, keeping the event loop free.
+
+    Export data comes straight from Taskwarrior, so this uses the
+    non-validating `_parse_tasks_fast`.
+
+    Args:
+        tasks: List of dictionaries from Taskwarrior JSON export
+        fields: Optional set of attributes to keep (see `_parse_tasks`)
+
+    Returns:
+        List of TaskModel instances
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_CPU_POOL, _parse_tasks_fast, tasks, fields)
 
 
 def _enrich_task_dependencies(
@@ -46,16 +184,16 @@ def _enrich_task_dependencies(
         uuid_to_task: Mapping of UUID to TaskModel for lookup
 
     Returns:
-        The same task with resolved dependency fields populated
+        A copy of the task with resolved dependency fields populated; the
+        input is left untouched since it may be shared through the task cache
     """
-    if not task.depends:
+    if not task.depends_uuids:
         return task
 
     resolved: list[ResolvedDependency] = []
     pending_count = 0
 
-    for uuid in task.depends.split(","):
-        uuid = uuid.strip()
+    for uuid in task.depends_uuids:
         if dep_task := uuid_to_task.get(uuid):
             resolved.append(
                 ResolvedDependency(
@@ -68,12 +206,12 @@ def _enrich_task_dependencies(
             if dep_task.status == "pending":
                 pending_count += 1
 
-    task.depends_on = resolved
-    task.blocked_by_pending = pending_count
-    return task
+    return task.model_copy(update={"depends_on": resolved, "blocked_by_pending": pending_count})
 
 
-def _enrich_tasks_dependencies(tasks: list[TaskModel]) -> list[TaskModel]:
+def _enrich_tasks_dependencies(
+    tasks: list[TaskModel], uuid_to_task: dict[str, TaskModel] | None = None
+) -> list[TaskModel]:
     """
     Batch enrich all tasks with resolved dependencies.
 
@@ -81,9 +219,12 @@ def _enrich_tasks_dependencies(tasks: list[TaskModel]) -> list[TaskModel]:
 
     Args:
         tasks: List of tasks to enrich
+        uuid_to_task: Optional mapping to resolve dependencies against, for
+            when `tasks` is only part of an export; defaults to `tasks` itself
 
     Returns:
         List of tasks with resolved dependency fields populated
     """
-    uuid_to_task = {t.uuid: t for t in tasks if t.uuid}
+    if uuid_to_task is None:
+        uuid_to_task = {t.uuid: t for t in tasks if t.uuid}
     return [_enrich_task_dependencies(t, uuid_to_task) for t in tasks]
@@ -1,4 +1,17 @@
 """Pytest configuration for taskwarrior-mcp tests."""
 
+import pytest
+
+from taskwarrior_mcp import _invalidate_task_cache
 
 # pytest-asyncio configuration is handled in pyproject.toml
+
+
+@pytest.fixture(autouse=True)
+def _clear_task_cache(tmp_path, monkeypatch):
+    """Start every test with an empty task cache so mocked exports are not shared."""
+    # Point the cache's data file check at an empty directory, not the real ~/.task
+    monkeypatch.setenv("TASKDATA", str(tmp_path))
+    _invalidate_task_cache()
+    yield
+    _invalidate_task_cache()
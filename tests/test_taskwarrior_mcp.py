@@ -1,6 +1,7 @@
 """Tests for the Taskwarrior MCP server."""
 
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -31,9 +32,20 @@ from taskwarrior_mcp import (
     TaskModel,
     TaskStatus,
     UndoInput,
+    _format_task_concise as format_task_concise,
+    _format_task_markdown as format_task_markdown,
+    _format_tasks_concise as format_tasks_concise,
+    _format_tasks_markdown as format_tasks_markdown,
+    _get_tasks_json as get_tasks_json,
+    _get_tasks_json_async as get_tasks_json_async,
     # Parser helpers
     _parse_task,
+    _parse_task_fast,
     _parse_tasks,
+    _parse_tasks_async as parse_tasks_async,
+    _parse_timestamp,
+    # Private functions (for testing)
+    _run_task_command as run_task_command,
     taskwarrior_add,
     taskwarrior_annotate,
     taskwarrior_bulk_get,
@@ -50,25 +62,6 @@ from taskwarrior_mcp import (
     taskwarrior_tags,
     taskwarrior_undo,
 )
-from taskwarrior_mcp import (
-    _format_task_concise as format_task_concise,
-)
-from taskwarrior_mcp import (
-    _format_task_markdown as format_task_markdown,
-)
-from taskwarrior_mcp import (
-    _format_tasks_concise as format_tasks_concise,
-)
-from taskwarrior_mcp import (
-    _format_tasks_markdown as format_tasks_markdown,
-)
-from taskwarrior_mcp import (
-    _get_tasks_json as get_tasks_json,
-)
-from taskwarrior_mcp import (
-    # Private functions (for testing)
-    _run_task_command as run_task_command,
-)
 
 # ============================================================================
 # Version Test
@@ -96,6 +89,69 @@ class TestVersion:
         assert parts[1].isdigit()
 
 
+class TestLazyExports:
+    """Tests for the package's lazily imported public names."""
+
+    def test_all_names_resolve(self):
+        """Test every name in __all__ can be imported from the package."""
+        import taskwarrior_mcp
+
+        for name in taskwarrior_mcp.__all__:
+            assert getattr(taskwarrior_mcp, name) is not None, name
+
+    def test_unknown_name_raises(self):
+        """Test unknown attributes still raise AttributeError."""
+        import taskwarrior_mcp
+
+        with pytest.raises(AttributeError):
+            taskwarrior_mcp.not_a_real_name  # noqa: B018
+
+    def test_type_checking_imports_match_lazy_names(self):
+        """Test the names type checkers see are exactly the lazily exported ones."""
+        import ast
+        import inspect
+
+        import taskwarrior_mcp
+
+        tree = ast.parse(inspect.getsource(taskwarrior_mcp))
+        block = next(n for n in tree.body if isinstance(n, ast.If) and ast.unparse(n.test) == "TYPE_CHECKING")
+        names = {alias.asname or alias.name for node in block.body for alias in getattr(node, "names", [])}
+        assert names == set(taskwarrior_mcp._LAZY)
+
+    def test_model_import_skips_tools(self):
+        """Test importing a model does not import the tool modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from taskwarrior_mcp import TaskModel; "
+            "print('taskwarrior_mcp.tools' in sys.modules, 'taskwarrior_mcp.server' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ["False", "False"]
+
+    @pytest.mark.asyncio
+    async def test_mcp_has_tools_registered(self):
+        """Test the server object exported for the entry point has every tool registered."""
+        from taskwarrior_mcp import mcp
+
+        names = {tool.name for tool in await mcp.list_tools()}
+        assert {"taskwarrior_list", "taskwarrior_suggest", "taskwarrior_context"} <= names
+
+    def test_server_run_registers_tools(self):
+        """Test running the server module directly still serves every tool."""
+        import subprocess
+        import sys
+
+        code = (
+            "import asyncio; from taskwarrior_mcp import server; "
+            "server.mcp.run = lambda: None; server.run(); "
+            "print(len(asyncio.run(server.mcp.list_tools())) > 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ["True"]
+
+
 # ============================================================================
 # Test Fixtures
 # ============================================================================
@@ -211,6 +267,19 @@ class TestInputModels:
         assert input_model.limit == 50
         assert input_model.response_format == ResponseFormat.MARKDOWN
 
+    def test_shared_fields_keep_per_model_descriptions(self):
+        """Test that the shared task_id and response_format fields keep their constraints and descriptions."""
+        from taskwarrior_mcp.models.inputs import _TASK_ID_PATTERN
+
+        task_id = CompleteTaskInput.model_json_schema()["properties"]["task_id"]
+        assert task_id["description"] == "Task ID or UUID to complete"
+        assert task_id["pattern"] == _TASK_ID_PATTERN
+        assert GetTaskInput.model_json_schema()["properties"]["task_id"]["description"] == "Task ID or UUID to retrieve"
+
+        for model in (ListTasksInput, ListProjectsInput, ListTagsInput):
+            assert model().response_format == ResponseFormat.MARKDOWN
+        assert GetTaskInput(task_id="1").response_format == ResponseFormat.MARKDOWN
+
     def test_list_tasks_input_custom(self):
         """Test ListTasksInput with custom values."""
         input_model = ListTasksInput(
@@ -331,6 +400,74 @@ class TestInputModels:
         undo = UndoInput()
         assert undo is not None
 
+    def test_task_id_accepts_ids_and_uuids(self):
+        """Test numeric IDs and full or short UUIDs are accepted."""
+        for task_id in ("5", "a1b2c3d4", "a1b2c3d4-e5f", "a1b2c3d4-e5f6-7890-abcd-ef1234567890"):
+            assert GetTaskInput(task_id=task_id).task_id == task_id
+
+    def test_task_id_rejects_filters(self):
+        """Test filter expressions and other text are rejected before reaching Taskwarrior."""
+        for task_id in (
+            "project:work",
+            "5 +urgent",
+            "rc.confirmation=off",
+            "x" * 5,
+            "1-100",
+            "-abc",
+            "---",
+            "²",
+            "a1b2c3d4e5f6",
+            "a1b2c3d4-",
+        ):
+            with pytest.raises(ValueError):
+                CompleteTaskInput(task_id=task_id)
+
+    def test_input_validators_built_at_import(self):
+        """Test input models are compiled when defined, not on the first tool call."""
+        from taskwarrior_mcp.models import inputs
+
+        input_models = [
+            obj for obj in vars(inputs).values() if isinstance(obj, type) and obj.__name__.endswith("Input")
+        ]
+        for model in input_models:
+            assert model.__pydantic_complete__, model.__name__
+            assert not model.model_config.get("defer_build"), model.__name__
+
+    def test_priority_and_direction_are_constrained(self):
+        """Test priority and direction only accept their documented values."""
+        from taskwarrior_mcp import DependenciesInput, Priority, ReadyInput
+
+        assert ModifyTaskInput(task_id="1", priority="").priority == Priority.NONE
+        assert ReadyInput(priority="H").priority == Priority.HIGH
+        assert DependenciesInput(direction="blocks").direction == "blocks"
+        with pytest.raises(ValueError):
+            ModifyTaskInput(task_id="1", priority="urgent")
+        with pytest.raises(ValueError):
+            ReadyInput(priority="X")
+        with pytest.raises(ValueError):
+            DependenciesInput(direction="upstream")
+
+    def test_inputs_reject_unknown_fields(self):
+        """Test a misspelled parameter is reported rather than silently dropped."""
+        with pytest.raises(ValueError):
+            ListTasksInput(fliter="project:work")
+
+    def test_inputs_are_frozen(self):
+        """Test validated inputs cannot be modified."""
+        input_model = GetTaskInput(task_id="5")
+        with pytest.raises(ValueError):
+            input_model.task_id = "6"
+
+    def test_inputs_strip_whitespace(self):
+        """Test every input model strips surrounding whitespace from strings."""
+        from taskwarrior_mcp.models import inputs
+
+        input_models = [
+            obj for obj in vars(inputs).values() if isinstance(obj, type) and obj.__name__.endswith("Input")
+        ]
+        assert all(issubclass(model, inputs._StrippedInput) for model in input_models)
+        assert AddTaskInput(description="  Buy milk  ").description == "Buy milk"
+
 
 # ============================================================================
 # Enum Tests
@@ -346,6 +483,15 @@ class TestEnums:
         assert ResponseFormat.MARKDOWN.value == "markdown"
         assert ResponseFormat.JSON.value == "json"
 
+    def test_enums_have_one_definition(self):
+        """Test input models and the package share the enum classes from taskwarrior_mcp.enums."""
+        from taskwarrior_mcp import enums
+
+        assert ResponseFormat is enums.ResponseFormat
+        assert TaskStatus is enums.TaskStatus
+        assert ListTasksInput.model_fields["response_format"].annotation is enums.ResponseFormat
+        assert ListTasksInput.model_fields["status"].annotation is enums.TaskStatus
+
     def test_task_status_values(self):
         """Test TaskStatus enum values."""
         assert TaskStatus.PENDING.value == "pending"
@@ -396,6 +542,17 @@ class TestRunTaskCommand:
             assert success is False
             assert "timed out" in output.lower()
 
+    def test_run_task_command_spawn_options(self):
+        """Test every invocation uses the shared timeout and capture options."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+            run_task_command(["1", "done"])
+            kwargs = mock_run.call_args.kwargs
+            assert mock_run.call_args[0][0] == ["task", "1", "done"]
+            assert kwargs["timeout"] == 30
+            assert kwargs["capture_output"] is True
+            assert kwargs["text"] is True
+
     def test_run_task_command_not_found(self):
         """Test when Taskwarrior is not installed."""
         with patch("subprocess.run") as mock_run:
@@ -459,6 +616,52 @@ class TestGetTasksJson:
             get_tasks_json(status=TaskStatus.DELETED)
             assert "status:deleted" in mock_run.call_args[0][0]
 
+    def test_get_tasks_json_all_status_has_no_filter(self, sample_tasks):
+        """Test status ALL exports without any status term."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            get_tasks_json(status=TaskStatus.ALL)
+            assert not any(arg.startswith("status:") for arg in mock_run.call_args[0][0])
+
+    def test_get_tasks_json_forces_json_array(self, sample_tasks):
+        """Test export always requests a JSON array regardless of user config."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            get_tasks_json()
+            call_args = mock_run.call_args[0][0]
+            assert "rc.json.array=on" in call_args
+            assert call_args[-1] == "export"
+
+    def test_get_tasks_json_unstripped_output(self, sample_tasks):
+        """Test raw export output with surrounding whitespace still decodes."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=f"\n{json.dumps(sample_tasks)}\n", stderr="")
+            success, tasks = get_tasks_json()
+            assert success is True
+            assert len(tasks) == 3
+
+            mock_run.return_value = MagicMock(returncode=0, stdout="\n", stderr="")
+            success, tasks = get_tasks_json()
+            assert success is True
+            assert tasks == []
+
+    def test_get_tasks_json_reads_bytes(self, sample_tasks):
+        """Test the export is read in binary mode and decoded straight from bytes."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks).encode(), stderr=b"")
+            success, tasks = get_tasks_json()
+            assert success is True
+            assert len(tasks) == 3
+            assert mock_run.call_args.kwargs["text"] is False
+
+    def test_get_tasks_json_bytes_error(self):
+        """Test binary stderr is decoded into the error message."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout=b"", stderr="Filtre invalide é\n".encode())
+            success, result = get_tasks_json()
+            assert success is False
+            assert result == "Error: Filtre invalide é"
+
     def test_get_tasks_json_parse_error(self):
         """Test handling of invalid JSON."""
         with patch("subprocess.run") as mock_run:
@@ -467,6 +670,360 @@ class TestGetTasksJson:
             assert success is False
             assert "Failed to parse" in result
 
+    @pytest.mark.asyncio
+    async def test_get_tasks_json_async(self, sample_tasks):
+        """Test the async variant runs the export off the event loop."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            success, tasks = await get_tasks_json_async(filter_expr="project:work")
+            assert success is True
+            assert len(tasks) == 3
+            assert "project:work" in mock_run.call_args[0][0]
+
+
+class TestTaskCache:
+    """Tests for the shared cache of parsed task exports."""
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_reads_share_one_export(self, sample_tasks):
+        """Test repeated queries reuse the parsed export."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            success, first = await _get_tasks_cached()
+            success, second = await _get_tasks_cached()
+            assert success is True
+            assert mock_run.call_count == 1
+            assert second == first
+            assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_on_query(self, sample_tasks):
+        """Test different filters and statuses are cached separately."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await _get_tasks_cached()
+            await _get_tasks_cached("project:work")
+            await _get_tasks_cached(status=TaskStatus.ALL)
+            assert mock_run.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_write_tool_invalidates_cache(self, sample_tasks):
+        """Test a modifying tool forces the next read to export again."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await _get_tasks_cached()
+            await taskwarrior_complete(CompleteTaskInput(task_id="1"))
+            await _get_tasks_cached()
+            assert mock_run.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_reuses_export(self, sample_task):
+        """Test getting the same task twice runs one export until a write invalidates it."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([sample_task]), stderr="")
+            first = await taskwarrior_get(GetTaskInput(task_id="1"))
+            second = await taskwarrior_get(GetTaskInput(task_id="1"))
+            assert second == first
+            assert mock_run.call_count == 1
+
+            # bulk_get of the same ID runs the same export, so it is served from the cache
+            await taskwarrior_bulk_get(BulkGetTasksInput(task_ids=["1"]))
+            assert mock_run.call_count == 1
+
+            await taskwarrior_complete(CompleteTaskInput(task_id="1"))
+            await taskwarrior_get(GetTaskInput(task_id="1"))
+            assert mock_run.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_list_shares_index_with_intelligence_tools(self, sample_tasks):
+        """Test taskwarrior_list and taskwarrior_blocked reuse one pending export and index."""
+        from taskwarrior_mcp import BlockedInput, taskwarrior_blocked
+        from taskwarrior_mcp.utils.cache import _get_task_index
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await taskwarrior_list(ListTasksInput(limit=1))
+            await taskwarrior_blocked(BlockedInput())
+            _, first = await _get_task_index()
+            await taskwarrior_list(ListTasksInput(limit=1))
+            _, second = await _get_task_index()
+            assert mock_run.call_count == 1
+            assert second is first
+
+    @pytest.mark.asyncio
+    async def test_cache_expires(self, sample_tasks):
+        """Test entries older than the TTL are reloaded."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        with patch("subprocess.run") as mock_run, patch("taskwarrior_mcp.utils.cache._CACHE_TTL", 0):
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await _get_tasks_cached()
+            await _get_tasks_cached()
+            assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, sample_tasks):
+        """Test a failed export is retried on the next call."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="Database locked")
+            success, error = await _get_tasks_cached()
+            assert success is False
+            assert "Database locked" in error
+
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            success, tasks = await _get_tasks_cached()
+            assert success is True
+            assert len(tasks) == 3
+
+    @pytest.mark.asyncio
+    async def test_unchanged_data_files_extend_cache(self, sample_tasks, tmp_path):
+        """Test entries outlive the TTL while Taskwarrior's data files are unchanged."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        (tmp_path / "pending.data").write_text("[]")
+        with patch("subprocess.run") as mock_run, patch("taskwarrior_mcp.utils.cache._CACHE_TTL", 0):
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await _get_tasks_cached()
+            await _get_tasks_cached()
+            assert mock_run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_data_files_reload(self, sample_tasks, tmp_path):
+        """Test a change made outside the server is picked up on the next read."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        data_file = tmp_path / "pending.data"
+        data_file.write_text("[]")
+        with patch("subprocess.run") as mock_run, patch("taskwarrior_mcp.utils.cache._CACHE_TTL", 0):
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await _get_tasks_cached()
+            data_file.write_text("[1]")
+            await _get_tasks_cached()
+            assert mock_run.call_count == 2
+
+    def test_data_dir_follows_taskrc_edits(self, tmp_path, monkeypatch):
+        """Test an edited data.location in the taskrc is picked up while the server runs."""
+        import os
+
+        from taskwarrior_mcp.utils.cache import _task_data_dir
+
+        taskrc = tmp_path / "taskrc"
+        taskrc.write_text(f"data.location={tmp_path / 'first'}\n")
+        os.utime(taskrc, ns=(1_000_000_000, 1_000_000_000))
+        monkeypatch.delenv("TASKDATA")
+        monkeypatch.setenv("TASKRC", str(taskrc))
+        assert _task_data_dir() == str(tmp_path / "first")
+
+        taskrc.write_text(f"data.location={tmp_path / 'second'}\n")
+        os.utime(taskrc, ns=(2_000_000_000, 2_000_000_000))
+        assert _task_data_dir() == str(tmp_path / "second")
+
+    @pytest.mark.asyncio
+    async def test_changed_data_files_reload_within_ttl(self, sample_tasks, tmp_path):
+        """Test a changed data file invalidates an entry even before the TTL runs out."""
+        from taskwarrior_mcp import _get_tasks_cached
+
+        data_file = tmp_path / "pending.data"
+        data_file.write_text("[]")
+        with patch("subprocess.run") as mock_run, patch("taskwarrior_mcp.utils.cache._CACHE_TTL", 60):
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await _get_tasks_cached()
+            data_file.write_text("[1]")
+            await _get_tasks_cached()
+            assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_data_files_reload_task_records(self, sample_tasks, tmp_path):
+        """Test taskwarrior_get sees a task changed outside the server within the TTL."""
+        data_file = tmp_path / "pending.data"
+        data_file.write_text("[]")
+        with patch("subprocess.run") as mock_run, patch("taskwarrior_mcp.utils.cache._CACHE_TTL", 60):
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks[:1]), stderr="")
+            await taskwarrior_get(GetTaskInput(task_id="1"))
+            data_file.write_text("[1]")
+            await taskwarrior_get(GetTaskInput(task_id="1"))
+            assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_evicted(self, sample_tasks):
+        """Test the cache holds at most `_CACHE_SIZE` queries."""
+        from taskwarrior_mcp import _get_tasks_cached
+        from taskwarrior_mcp.utils import cache
+
+        with patch("subprocess.run") as mock_run, patch.object(cache, "_CACHE_SIZE", 2):
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await _get_tasks_cached("project:a")
+            await _get_tasks_cached("project:b")
+            await _get_tasks_cached("project:a")
+            await _get_tasks_cached("project:c")
+            assert [key[0] for key in cache._task_cache] == ["project:a", "project:c"]
+            assert mock_run.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_core_read_tools_share_one_export(self, sample_tasks):
+        """Test projects, tags and summary reuse one pending export."""
+        from taskwarrior_mcp import (
+            ListProjectsInput,
+            ListTagsInput,
+            taskwarrior_projects,
+            taskwarrior_summary,
+            taskwarrior_tags,
+        )
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await taskwarrior_projects(ListProjectsInput())
+            await taskwarrior_tags(ListTagsInput())
+            await taskwarrior_summary()
+            assert mock_run.call_count == 1
+
+
+class TestTaskIndex:
+    """Tests for the dependency index shared by intelligence tools."""
+
+    def test_build_task_index(self):
+        """Test lookups built from a task list."""
+        from taskwarrior_mcp.utils.index import _build_task_index
+
+        tasks = [
+            TaskModel(id=1, uuid="uuid-1", description="Blocker", status="pending"),
+            TaskModel(id=2, uuid="uuid-2", description="Waiting", depends="uuid-1, uuid-3"),
+            TaskModel(id=0, uuid="uuid-3", description="Done", status="completed"),
+        ]
+        index = _build_task_index(tasks)
+        assert set(index.uuid_to_task) == {"uuid-1", "uuid-2", "uuid-3"}
+        assert index.pending_uuids == frozenset({"uuid-1", "uuid-2"})
+        assert [t.id for t in index.blocks_map["uuid-1"]] == [2]
+
+    def test_build_task_index_classifies_pending(self):
+        """Test pending tasks are split into ready and blocked in export order."""
+        from taskwarrior_mcp.utils.index import _build_task_index
+
+        tasks = [
+            TaskModel(id=1, uuid="uuid-1", description="Waiting on later task", depends="uuid-3"),
+            TaskModel(id=2, uuid="uuid-2", description="Waiting on done task", depends="uuid-4"),
+            TaskModel(id=3, uuid="uuid-3", description="Free"),
+            TaskModel(id=0, uuid="uuid-4", description="Done", status="completed"),
+        ]
+        index = _build_task_index(tasks)
+        assert [t.id for t in index.pending_tasks] == [1, 2, 3]
+        assert [t.id for t in index.ready_tasks] == [2, 3]
+        assert [t.id for t in index.blocked_tasks] == [1]
+        assert index.indegree == {"uuid-1": 1}
+        assert index.out_degree == {"uuid-3": 1, "uuid-4": 1}
+
+    @pytest.mark.asyncio
+    async def test_index_shared_between_tools(self):
+        """Test consecutive dependency tools reuse one export and one index."""
+        from taskwarrior_mcp import BlockedInput, ReadyInput, taskwarrior_blocked, taskwarrior_ready
+
+        tasks = [
+            {"id": 1, "uuid": "uuid-1", "description": "Blocker", "status": "pending", "urgency": 5.0},
+            {"id": 2, "uuid": "uuid-2", "description": "Waiting", "status": "pending", "depends": "uuid-1"},
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            ready = await taskwarrior_ready(ReadyInput())
+            blocked = await taskwarrior_blocked(BlockedInput())
+            assert mock_run.call_count == 1
+            assert "Blocker" in ready
+            assert "Waiting" in blocked
+
+    @pytest.mark.asyncio
+    async def test_planning_tools_share_one_export(self):
+        """Test a turn of suggest, ready, blocked, dependencies and triage spawns Taskwarrior once."""
+        from taskwarrior_mcp import (
+            BlockedInput,
+            DependenciesInput,
+            ReadyInput,
+            SuggestInput,
+            TriageInput,
+            taskwarrior_blocked,
+            taskwarrior_dependencies,
+            taskwarrior_ready,
+            taskwarrior_suggest,
+            taskwarrior_triage,
+        )
+
+        tasks = [
+            {"id": 1, "uuid": "uuid-1", "description": "Blocker", "status": "pending", "urgency": 5.0},
+            {"id": 2, "uuid": "uuid-2", "description": "Waiting", "status": "pending", "depends": "uuid-1"},
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            await taskwarrior_suggest(SuggestInput())
+            await taskwarrior_ready(ReadyInput())
+            await taskwarrior_blocked(BlockedInput())
+            await taskwarrior_dependencies(DependenciesInput())
+            await taskwarrior_triage(TriageInput())
+            assert mock_run.call_count == 1
+
+
+class TestTaskAggregates:
+    """Tests for the counts shared by projects, tags, summary and overview."""
+
+    def test_compute_aggregates(self):
+        """Test priority, project and tag counts."""
+        from taskwarrior_mcp.utils.aggregates import _compute_aggregates
+
+        tasks = [
+            TaskModel(id=1, description="A", project="work", priority="H", tags=["x", "y"], start="20250101T000000Z"),
+            TaskModel(id=2, description="B", project="work", tags=["x"]),
+            TaskModel(id=3, description="C", priority="L"),
+        ]
+        aggregates = _compute_aggregates(tasks)
+        assert aggregates.total == 3
+        assert aggregates.active == 1
+        assert aggregates.by_priority == {"H": 1, "M": 0, "L": 1, "": 1}
+        assert aggregates.project_counts == {"work": 2, "(none)": 1}
+        assert aggregates.tag_counts == {"x": 2, "y": 1}
+
+    def test_priority_bins_kept_when_empty(self):
+        """Test all priority bins are reported, in order, even with no tasks in them."""
+        from taskwarrior_mcp.utils.aggregates import _compute_aggregates
+
+        aggregates = _compute_aggregates([TaskModel(id=1, description="A", priority="M")])
+        assert list(aggregates.by_priority.items()) == [("H", 0), ("M", 1), ("L", 0), ("", 0)]
+
+    def test_project_and_tag_counts_keep_first_seen_order(self):
+        """Test projects and tags are counted in the order they first appear."""
+        from taskwarrior_mcp.utils.aggregates import _compute_aggregates
+
+        tasks = [
+            TaskModel(id=1, project="zeta", tags=["b"]),
+            TaskModel(id=2, project="alpha", tags=["a", "b"]),
+            TaskModel(id=3, project="zeta"),
+        ]
+        aggregates = _compute_aggregates(tasks)
+        assert list(aggregates.project_counts.items()) == [("zeta", 2), ("alpha", 1)]
+        assert list(aggregates.tag_counts.items()) == [("b", 2), ("a", 1)]
+
+    @pytest.mark.asyncio
+    async def test_aggregates_computed_once_per_export(self, sample_tasks):
+        """Test consecutive summary tools reuse one set of counts."""
+        from taskwarrior_mcp import ListProjectsInput, OverviewInput, taskwarrior_overview, taskwarrior_projects
+        from taskwarrior_mcp.utils import aggregates
+
+        with (
+            patch("subprocess.run") as mock_run,
+            patch(
+                "taskwarrior_mcp.utils.cache._compute_aggregates", wraps=aggregates._compute_aggregates
+            ) as mock_compute,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            await taskwarrior_projects(ListProjectsInput())
+            await taskwarrior_overview(OverviewInput())
+            assert mock_compute.call_count == 1
+            assert mock_run.call_count == 1
+
 
 class TestFormatTaskMarkdown:
     """Tests for the format_task_markdown function."""
@@ -478,6 +1035,40 @@ class TestFormatTaskMarkdown:
         assert "[1]" in result
         assert "Test task" in result
 
+    def test_format_full_task_layout(self):
+        """Test the exact layout of header, details, notes and dependencies."""
+        from taskwarrior_mcp import ResolvedDependency
+
+        task = TaskModel(
+            id=3,
+            uuid="uuid-3",
+            description="Write report",
+            project="work",
+            priority="M",
+            tags=["docs"],
+            urgency=4.5,
+            annotations=[TaskAnnotation(entry="20250130T100000Z", description="Outline done")],
+            depends_on=[ResolvedDependency(id=1, uuid="uuid-1", description="Gather data", status="pending")],
+            blocked_by_pending=1,
+        )
+        assert format_task_markdown(task).splitlines() == [
+            "###  [3] Write report",
+            "**Project**: work | **Priority**: Medium | **Tags**: docs | **Urgency**: 4.50",
+            "**Notes:**",
+            "  - [20250130T1] Outline done",
+            "",
+            "**Blocked by** (1 pending):",
+            "  - ⏳ #1: Gather data",
+        ]
+
+    def test_format_task_memo_tracks_id_and_urgency(self):
+        """Test a memoized block is not reused when the ID or urgency changes without a modification."""
+        base = {"uuid": "uuid-7", "modified": "20250101T000000Z", "description": "Memo"}
+        first = format_task_markdown(TaskModel(id=7, urgency=1.0, **base))
+        assert format_task_markdown(TaskModel(id=7, urgency=1.0, **base)) is first
+        assert "[8]" in format_task_markdown(TaskModel(id=8, urgency=1.0, **base))
+        assert "**Urgency**: 2.00" in format_task_markdown(TaskModel(id=7, urgency=2.0, **base))
+
     def test_format_task_with_project(self):
         """Test formatting a task with project."""
         task = _parse_task(
@@ -589,6 +1180,25 @@ class TestFormatTasksMarkdown:
         result = format_tasks_markdown(_parse_tasks(sample_tasks), title="Work Tasks")
         assert "Work Tasks" in result
 
+    def test_format_layout(self, sample_tasks):
+        """Test the header, then each task block separated by a blank line."""
+        tasks = _parse_tasks(sample_tasks[:2])
+        result = format_tasks_markdown(tasks, title="Tasks")
+        first, second = (format_task_markdown(t) for t in tasks)
+        assert result == f"# Tasks\n*2 task(s)*\n\n{first}\n\n{second}\n"
+
+
+class TestDumpJson:
+    """Tests for the _dump_json response serializer."""
+
+    def test_dump_json_matches_model_dump(self, sample_tasks):
+        """Test models serialize the same as their model_dump() output."""
+        from taskwarrior_mcp.utils.formatters import _dump_json
+
+        tasks = _parse_tasks(sample_tasks)
+        result = _dump_json({"tasks": tasks, "count": len(tasks)})
+        assert json.loads(result) == {"tasks": [t.model_dump() for t in tasks], "count": 3}
+
 
 class TestFormatTaskConcise:
     """Tests for the concise task formatter."""
@@ -606,6 +1216,18 @@ class TestFormatTaskConcise:
         result = format_task_concise(task)
         assert "H" in result
 
+    def test_format_task_concise_full_line(self):
+        """Test the exact metadata order: priority, due date, project, blocked count."""
+        task = TaskModel(
+            id=7,
+            description="Ship release",
+            priority="H",
+            due="20250201T120000Z",
+            project="work",
+            blocked_by_pending=2,
+        )
+        assert format_task_concise(task) == "#7: Ship release (H, due:20250201T1, proj:work, BLOCKED(2))"
+
     def test_format_tasks_concise_empty(self):
         """Test concise formatting of empty list."""
         result = format_tasks_concise([])
@@ -695,6 +1317,20 @@ class TestFormatTaskMarkdownDependencies:
         assert "Blocked by" not in result
         assert "Dependencies" not in result
 
+    def test_format_task_markdown_rerenders_when_blocker_completes(self):
+        """Test memoized rendering reflects dependency changes of an unmodified task."""
+        from taskwarrior_mcp import ResolvedDependency
+
+        fields = {"id": 2, "uuid": "uuid-2", "modified": "20250130T100000Z", "description": "Waiting"}
+        pending = ResolvedDependency(id=1, uuid="uuid-1", description="Blocker", status="pending")
+        done = ResolvedDependency(id=1, uuid="uuid-1", description="Blocker", status="completed")
+
+        first = format_task_markdown(TaskModel(**fields, depends_on=[pending], blocked_by_pending=1))
+        assert format_task_markdown(TaskModel(**fields, depends_on=[pending], blocked_by_pending=1)) == first
+        second = format_task_markdown(TaskModel(**fields, depends_on=[done], blocked_by_pending=0))
+        assert "**Blocked by**" in first
+        assert "**Dependencies** (all resolved)" in second
+
 
 # ============================================================================
 # Tool Function Tests
@@ -714,6 +1350,16 @@ class TestTaskwarriorList:
             assert "Task one" in result
             assert "Task two" in result
 
+    @pytest.mark.asyncio
+    async def test_list_tasks_markdown_title(self, sample_tasks):
+        """Test the markdown title names the filter and any non-pending status."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            result = await taskwarrior_list(ListTasksInput())
+            assert result.startswith("# Tasks\n")
+            result = await taskwarrior_list(ListTasksInput(filter="project:work", status=TaskStatus.COMPLETED))
+            assert result.startswith("# Tasks matching 'project:work' (completed)\n")
+
     @pytest.mark.asyncio
     async def test_list_tasks_json(self, sample_tasks):
         """Test listing tasks in JSON format."""
@@ -726,6 +1372,41 @@ class TestTaskwarriorList:
             assert data["count"] == 3
             assert len(data["tasks"]) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_tasks_json_is_compact(self, sample_tasks):
+        """Test list JSON is written without indentation, keeping total and count."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            result = await taskwarrior_list(ListTasksInput(response_format=ResponseFormat.JSON))
+            assert "\n" not in result
+            assert result.startswith('{"total":3,"count":3,"tasks":[')
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_json_keeps_unicode(self):
+        """Test JSON output writes non-ASCII descriptions as-is rather than escaped."""
+        tasks = [{"id": 1, "uuid": "uuid-1", "description": "Café résumé ✓", "status": "pending"}]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            result = await taskwarrior_list(ListTasksInput(response_format=ResponseFormat.JSON))
+            assert "Café résumé ✓" in result
+            assert json.loads(result)["tasks"][0]["description"] == "Café résumé ✓"
+
+    @pytest.mark.asyncio
+    async def test_list_limit_resolves_dependencies_beyond_page(self):
+        """Test a limited page still resolves dependencies on tasks outside it."""
+        tasks = [
+            {"id": 1, "uuid": "uuid-1", "description": "Waiting", "status": "pending", "depends": "uuid-2"},
+            {"id": 2, "uuid": "uuid-2", "description": "Blocker", "status": "pending"},
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            params = ListTasksInput(limit=1, response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_list(params))
+            assert data["total"] == 2
+            assert data["count"] == 1
+            assert data["tasks"][0]["depends_on"][0]["description"] == "Blocker"
+            assert data["tasks"][0]["blocked_by_pending"] == 1
+
     @pytest.mark.asyncio
     async def test_list_tasks_concise(self, sample_tasks):
         """Test listing tasks in concise format."""
@@ -783,6 +1464,17 @@ class TestTaskwarriorAdd:
             assert "Task created successfully" in result
             assert "Created task 1" in result
 
+    @pytest.mark.asyncio
+    async def test_add_passes_arguments_verbatim(self):
+        """Test values reach Taskwarrior as argv elements without shell quoting."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="Created task 1.", stderr="")
+            params = AddTaskInput(description="Call Bob's office", project="home repairs", tags=["diy"])
+            await taskwarrior_add(params)
+            call_args = mock_run.call_args[0][0]
+            assert call_args[1:4] == ["add", "Call Bob's office", "project:home repairs"]
+            assert "+diy" in call_args
+
     @pytest.mark.asyncio
     async def test_add_task_with_project(self):
         """Test adding a task with project."""
@@ -857,6 +1549,19 @@ class TestTaskwarriorComplete:
             assert "marked as complete" in result
             assert "5" in result
 
+    @pytest.mark.asyncio
+    async def test_complete_runs_off_the_event_loop(self):
+        """Test the Taskwarrior subprocess for a write runs in a worker thread."""
+        threads = []
+
+        def fake_run(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return MagicMock(returncode=0, stdout="Completed task 5.", stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run):
+            await taskwarrior_complete(CompleteTaskInput(task_id="5"))
+        assert threads and threads[0] is not threading.main_thread()
+
     @pytest.mark.asyncio
     async def test_complete_task_not_found(self):
         """Test completing non-existent task."""
@@ -879,6 +1584,24 @@ class TestTaskwarriorModify:
             result = await taskwarrior_modify(params)
             assert "modified successfully" in result
 
+    @pytest.mark.asyncio
+    async def test_modify_passes_description_verbatim(self):
+        """Test the new description is not shell-quoted."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="Modified 1 task.", stderr="")
+            await taskwarrior_modify(ModifyTaskInput(task_id="5", description="Don't forget"))
+            assert "Don't forget" in mock_run.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_modify_priority_set_and_clear(self):
+        """Test priority is passed as its letter, and empty clears it."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="Modified 1 task.", stderr="")
+            await taskwarrior_modify(ModifyTaskInput(task_id="5", priority="M"))
+            assert "priority:M" in mock_run.call_args[0][0]
+            await taskwarrior_modify(ModifyTaskInput(task_id="5", priority=""))
+            assert "priority:" in mock_run.call_args[0][0]
+
     @pytest.mark.asyncio
     async def test_modify_project(self):
         """Test modifying task project."""
@@ -966,6 +1689,63 @@ class TestTaskwarriorGet:
             data = json.loads(result)
             assert data["description"] == "Test task"
 
+    @pytest.mark.asyncio
+    async def test_get_task_runs_off_event_loop(self, sample_task):
+        """Test the export runs in a worker thread so concurrent tools are not serialized."""
+        import threading
+
+        threads = []
+
+        def fake_run(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return MagicMock(returncode=0, stdout=json.dumps([sample_task]), stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run):
+            result = await taskwarrior_get(GetTaskInput(task_id="1"))
+            assert "Test task" in result
+            assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_get_task_forces_json_array(self, sample_task):
+        """Test the export requests an array so json.array=off configs still parse."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([sample_task]), stderr="")
+            await taskwarrior_get(GetTaskInput(task_id="1", response_format=ResponseFormat.JSON))
+            assert mock_run.call_args[0][0] == ["task", "1", "rc.json.array=on", "export"]
+
+    @pytest.mark.asyncio
+    async def test_get_task_json_resolves_dependencies(self, sample_task):
+        """Test JSON output is the parsed task with its dependencies resolved, as bulk_get returns it."""
+        blocker = {
+            "id": 2,
+            "uuid": "b1b2c3d4-0000-4000-8000-000000000002",
+            "description": "Blocker",
+            "status": "pending",
+        }
+        record = {**sample_task, "depends": [blocker["uuid"]]}
+
+        def fake_run(args, **kwargs):
+            stdout = [blocker] if blocker["uuid"] in args else [record]
+            return MagicMock(returncode=0, stdout=json.dumps(stdout), stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run):
+            params = GetTaskInput(task_id="1", response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_get(params))
+        assert data["description"] == "Test task"
+        assert data["blocked_by_pending"] == 1
+        assert data["depends_on"][0]["uuid"] == blocker["uuid"]
+
+    @pytest.mark.asyncio
+    async def test_get_task_json_keeps_udas_top_level(self, sample_task):
+        """Test attributes without a model field, such as UDAs, stay top-level keys in JSON output."""
+        record = {**sample_task, "recur": "weekly", "estimate": "PT2H"}
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([record]), stderr="")
+            data = json.loads(await taskwarrior_get(GetTaskInput(task_id="1", response_format=ResponseFormat.JSON)))
+        assert data["recur"] == "weekly"
+        assert data["estimate"] == "PT2H"
+        assert "extra" not in data
+
     @pytest.mark.asyncio
     async def test_get_task_not_found(self):
         """Test getting non-existent task."""
@@ -1014,6 +1794,12 @@ class TestBulkGetTasksInput:
         with pytest.raises(ValueError):
             BulkGetTasksInput(task_ids=["   ", "  "])
 
+    def test_task_ids_reject_filters(self):
+        """Test that filter terms and rc overrides are rejected as bulk task IDs."""
+        for task_ids in (["rc.data.location=/tmp/x", "2"], ["+work"], ["-work"], ["1-100"], ["²"]):
+            with pytest.raises(ValueError):
+                BulkGetTasksInput(task_ids=task_ids)
+
 
 class TestTaskwarriorBulkGet:
     """Tests for the taskwarrior_bulk_get tool."""
@@ -1040,6 +1826,71 @@ class TestTaskwarriorBulkGet:
             assert len(parsed) == 2
             assert parsed[0]["description"] == "Task one"
 
+    @pytest.mark.asyncio
+    async def test_bulk_get_json_matches_model_dump(self, sample_tasks):
+        """Test that bulk get JSON carries the same fields as TaskModel.model_dump()."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks[:1]), stderr="")
+            params = BulkGetTasksInput(task_ids=["1"], response_format=ResponseFormat.JSON)
+            parsed = json.loads(await taskwarrior_bulk_get(params))
+            assert parsed == [TaskModel.model_validate(sample_tasks[0]).model_dump()]
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_resolves_unrequested_dependencies(self):
+        """Test blockers outside the requested IDs are fetched in one extra export."""
+        blocked = {"id": 1, "uuid": "aaaa-1", "description": "Blocked", "status": "pending", "depends": ["bbbb-2"]}
+        blocker = {"id": 2, "uuid": "bbbb-2", "description": "Blocker", "status": "pending"}
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                MagicMock(returncode=0, stdout=json.dumps([blocked]), stderr=""),
+                MagicMock(returncode=0, stdout=json.dumps([blocker]), stderr=""),
+            ]
+            params = BulkGetTasksInput(task_ids=["1"], response_format=ResponseFormat.JSON)
+            parsed = json.loads(await taskwarrior_bulk_get(params))
+            assert mock_run.call_count == 2
+            assert mock_run.call_args[0][0] == ["task", "bbbb-2", "rc.json.array=on", "export"]
+            assert parsed[0]["depends_on"][0]["description"] == "Blocker"
+            assert parsed[0]["blocked_by_pending"] == 1
+
+    def test_dump_tasks_json_matches_dump_json(self, sample_tasks):
+        """Test the list adapter produces the same JSON as the generic serializer."""
+        from taskwarrior_mcp.utils.formatters import _dump_json, _dump_tasks_json
+
+        tasks = [_parse_task(t) for t in sample_tasks]
+        assert _dump_tasks_json(tasks) == _dump_json(tasks)
+        assert _dump_tasks_json([], indent=None) == "[]"
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_non_ascii_digits_not_parsed_as_ids(self):
+        """Test digits that int() cannot parse are not treated as numeric IDs."""
+        params = BulkGetTasksInput.model_construct(task_ids=["²"], response_format=ResponseFormat.MARKDOWN)
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+            result = await taskwarrior_bulk_get(params)
+        assert mock_run.call_args[0][0] == ["task", "²", "rc.json.array=on", "export"]
+        assert "No tasks found" in result
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_uuid_prefix_not_reported_missing(self):
+        """Test a task requested by a 12-character UUID prefix is not listed as not found."""
+        task = {"id": 0, "uuid": "a1b2c3d4-e5f6-4000-8000-000000000001", "description": "Done", "status": "completed"}
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([task]), stderr="")
+            result = await taskwarrior_bulk_get(BulkGetTasksInput(task_ids=["A1B2C3D4-E5F", "42"]))
+            assert "Tasks not found: 42" in result
+            assert "A1B2C3D4-E5F" not in result.split("Tasks not found:")[1]
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_full_uuid_not_reported_missing(self):
+        """Test a task requested by its full UUID is not listed as not found."""
+        uuid = "a1b2c3d4-0000-4000-8000-000000000001"
+        task = {"id": 0, "uuid": uuid, "description": "Completed one", "status": "completed"}
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([task]), stderr="")
+            result = await taskwarrior_bulk_get(BulkGetTasksInput(task_ids=[uuid, "42"]))
+            assert "Tasks not found: 42" in result
+            assert uuid not in result.split("Tasks not found:")[1]
+
     @pytest.mark.asyncio
     async def test_bulk_get_single_task(self, sample_task):
         """Test getting a single task using bulk get."""
@@ -1080,15 +1931,32 @@ class TestTaskwarriorBulkGet:
             assert "Error" in result
 
     @pytest.mark.asyncio
-    async def test_bulk_get_uses_or_filter(self, sample_tasks):
-        """Test that bulk get uses OR filter syntax."""
+    async def test_bulk_get_uses_id_list_filter(self, sample_tasks):
+        """Test that bulk get passes numeric IDs as a single native ID list."""
         with patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
             params = BulkGetTasksInput(task_ids=["1", "2", "3"])
             await taskwarrior_bulk_get(params)
             call_args = mock_run.call_args[0][0]
-            # Verify OR filter is used
-            assert any("or" in arg.lower() for arg in call_args)
+            assert call_args == ["task", "1-3", "rc.json.array=on", "export"]
+
+    def test_id_list_collapses_consecutive_ids(self):
+        """Test consecutive IDs become ranges, in ascending order and without duplicates."""
+        from taskwarrior_mcp.tools.core import _id_list
+
+        assert _id_list([3, 1, 2, 7]) == "1-3,7"
+        assert _id_list([5]) == "5"
+        assert _id_list([9, 4, 4, 10, 12]) == "4,9-10,12"
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_passes_uuids_as_terms(self, sample_tasks):
+        """Test that UUIDs are passed alongside the ID list as separate filter terms."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sample_tasks), stderr="")
+            params = BulkGetTasksInput(task_ids=["1", "a1b2c3d4", "3"])
+            await taskwarrior_bulk_get(params)
+            call_args = mock_run.call_args[0][0]
+            assert call_args == ["task", "1,3", "a1b2c3d4", "rc.json.array=on", "export"]
 
 
 class TestTaskwarriorAnnotate:
@@ -1104,6 +1972,14 @@ class TestTaskwarriorAnnotate:
             assert "Annotation added" in result
             assert "5" in result
 
+    @pytest.mark.asyncio
+    async def test_annotate_passes_text_verbatim(self):
+        """Test the annotation is not shell-quoted."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="Annotating task 5.", stderr="")
+            await taskwarrior_annotate(AnnotateTaskInput(task_id="5", annotation="See Ann's notes"))
+            assert mock_run.call_args[0][0] == ["task", "5", "annotate", "See Ann's notes", "rc.confirmation=off"]
+
     @pytest.mark.asyncio
     async def test_annotate_task_not_found(self):
         """Test annotating non-existent task."""
@@ -1279,6 +2155,20 @@ class TestTaskwarriorSummary:
             assert "Active" in result
             assert "1" in result  # One active task
 
+    @pytest.mark.asyncio
+    async def test_summary_top_five_projects(self):
+        """Test only the five largest projects are listed, ties in first-seen order."""
+        counts = {"a": 1, "b": 3, "c": 2, "d": 2, "e": 1, "f": 4}
+        tasks = [
+            {"id": i, "description": f"Task {i}", "project": name, "status": "pending"}
+            for i, name in enumerate((name for name, n in counts.items() for _ in range(n)), start=1)
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            result = await taskwarrior_summary()
+            top = result.split("## Top Projects\n", 1)[1].splitlines()
+            assert top == ["- f: 4", "- b: 3", "- c: 2", "- d: 2", "- a: 1"]
+
     @pytest.mark.asyncio
     async def test_summary_priority_breakdown(self):
         """Test summary shows priority breakdown."""
@@ -1483,6 +2373,24 @@ class TestTaskwarriorProjectSummary:
             result = await taskwarrior_project_summary(params)
             assert "overdue" in result.lower() or "Overdue" in result
 
+    @pytest.mark.asyncio
+    async def test_project_summary_skips_malformed_due(self):
+        """Test a due value that is not a Taskwarrior timestamp is left out of the due buckets."""
+        from taskwarrior_mcp import ProjectSummaryInput, taskwarrior_project_summary
+
+        tasks = [
+            {"id": 1, "description": "Bad due", "status": "pending", "project": "work", "due": "someday"},
+            {"id": 2, "description": "Overdue", "status": "pending", "project": "work", "due": "20200101T000000Z"},
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            params = ProjectSummaryInput(response_format=ResponseFormat.JSON)
+            work = json.loads(await taskwarrior_project_summary(params))["projects"][0]
+            assert work["pending"] == 2
+            assert work["overdue"] == 1
+            assert work["due_today"] == 0
+            assert work["due_this_week"] == 0
+
     @pytest.mark.asyncio
     async def test_project_summary_with_active_tasks(self):
         """Test project summary shows active tasks."""
@@ -1523,6 +2431,60 @@ class TestTaskwarriorProjectSummary:
             result = await taskwarrior_project_summary(params)
             assert "not found" in result.lower() or "no tasks" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_project_summary_json_missing_project(self):
+        """Test the JSON not-found project summary response is valid JSON."""
+        from taskwarrior_mcp import ProjectSummaryInput, taskwarrior_project_summary
+
+        tasks = [{"id": 1, "description": "Task", "status": "pending", "project": "work"}]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            params = ProjectSummaryInput(project="nonexistent", response_format=ResponseFormat.JSON)
+            result = json.loads(await taskwarrior_project_summary(params))
+            assert result == {"error": "Project 'nonexistent' not found or has no tasks"}
+
+    @pytest.mark.asyncio
+    async def test_project_summary_json_empty(self):
+        """Test the JSON project summary for no tasks is valid JSON."""
+        from taskwarrior_mcp import ProjectSummaryInput, taskwarrior_project_summary
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+            params = ProjectSummaryInput(response_format=ResponseFormat.JSON)
+            result = json.loads(await taskwarrior_project_summary(params))
+            assert result == {"projects": [], "message": "No projects found"}
+
+    @pytest.mark.asyncio
+    async def test_project_summary_completed_only_project(self):
+        """Test a project with only completed tasks counts them without priority or due buckets."""
+        from taskwarrior_mcp import ProjectSummaryInput, taskwarrior_project_summary
+
+        pending = [{"id": 1, "description": "Open", "status": "pending", "project": "work", "priority": "H"}]
+        completed = [{"uuid": "c1", "description": "Done", "status": "completed", "project": "old", "priority": "H"}]
+
+        def fake_run(args, **kwargs):
+            tasks = completed if "status:completed" in args else pending
+            return MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            params = ProjectSummaryInput(include_completed=True, response_format=ResponseFormat.JSON)
+            projects = {p["name"]: p for p in json.loads(await taskwarrior_project_summary(params))["projects"]}
+            assert projects["old"]["pending"] == 0
+            assert projects["old"]["completed"] == 1
+            assert projects["old"]["priority"] == {"high": 0, "medium": 0, "low": 0, "none": 0}
+            assert projects["work"]["priority"]["high"] == 1
+            assert mock_run.call_count == 2
+
+    def test_project_block_layout(self):
+        """Test a project's markdown block lists its counts and ends with a blank line."""
+        from taskwarrior_mcp.tools.core import _EMPTY_PROJECT_DATA, _format_project_block
+
+        data = {**_EMPTY_PROJECT_DATA, "pending": 2, "overdue": 1, "priority_h": 2}
+        block = _format_project_block("work", data, include_completed=False)
+        assert block.startswith("## work\n\n**Pending Tasks**: 2\n\n**Due Dates**:\n- ⚠️ Overdue: 1\n")
+        assert "Completed Tasks" not in block
+        assert block.endswith("- High: 2\n- Medium: 0\n- Low: 0\n- None: 0\n")
+
     @pytest.mark.asyncio
     async def test_project_summary_include_completed(self):
         """Test project summary with completed tasks included."""
@@ -1687,6 +2649,30 @@ class TestTaskwarriorSuggest:
             data = json.loads(result)
             assert len(data["suggestions"]) <= 2
 
+    @pytest.mark.asyncio
+    async def test_suggest_context_filter_then_top_scores(self, tasks_for_suggestions):
+        """Test the context filter applies before the limit, highest scores first."""
+        from taskwarrior_mcp import SuggestInput, taskwarrior_suggest
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks_for_suggestions), stderr="")
+            params = SuggestInput(context="quick_wins", limit=2, response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_suggest(params))
+            # Urgency < 5 qualifies: #5 scores 29 (tagged +next), #4 scores 2
+            assert [s["task"]["id"] for s in data["suggestions"]] == [5, 4]
+            assert "flags" not in data["suggestions"][0]
+
+    @pytest.mark.asyncio
+    async def test_suggest_markdown_indicators(self, tasks_for_suggestions):
+        """Test each suggestion shows its highest-precedence indicator."""
+        from taskwarrior_mcp import SuggestInput, taskwarrior_suggest
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks_for_suggestions), stderr="")
+            result = await taskwarrior_suggest(SuggestInput(limit=6))
+            assert "**[#1] Overdue task** ⚠️ OVERDUE" in result
+            assert "**[#3] Active task** 🔄 ACTIVE" in result
+
     @pytest.mark.asyncio
     async def test_suggest_filters_by_project(self, tasks_for_suggestions):
         """Test that suggest can filter by project."""
@@ -1754,6 +2740,31 @@ class TestTaskwarriorSuggest:
                 assert "score" in suggestion
                 assert "reasons" in suggestion
 
+    @pytest.mark.asyncio
+    async def test_suggest_blockers_counts_exact_uuid_matches(self):
+        """Test that only tasks whose UUID appears in depends are credited as blockers."""
+        from taskwarrior_mcp import SuggestInput, taskwarrior_suggest
+
+        tasks = [
+            {"id": 1, "uuid": "aaaa-1111", "description": "Blocker", "status": "pending", "urgency": 2.0},
+            {"id": 2, "description": "No UUID", "status": "pending", "urgency": 2.0},
+            {
+                "id": 3,
+                "uuid": "cccc-3333",
+                "description": "Waiting",
+                "status": "pending",
+                "urgency": 1.0,
+                "depends": "aaaa-1111",
+            },
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            params = SuggestInput(context="blockers", response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_suggest(params))
+            assert [s["task"]["id"] for s in data["suggestions"]] == [1]
+            assert data["suggestions"][0]["reasons"] == ["Blocks 1 task(s)"]
+            assert data["suggestions"][0]["score"] == 22.0
+
 
 class TestReadyInput:
     """Tests for ReadyInput model."""
@@ -1866,6 +2877,13 @@ class TestBlockedInput:
 class TestTaskwarriorBlocked:
     """Tests for the taskwarrior_blocked tool."""
 
+    def test_every_response_format_has_a_renderer(self):
+        """Test that suggest and blocked dispatch every ResponseFormat through their renderer tables."""
+        from taskwarrior_mcp.tools.intelligence import _BLOCKED_RENDERERS, _SUGGEST_RENDERERS
+
+        assert set(_SUGGEST_RENDERERS) == set(ResponseFormat)
+        assert set(_BLOCKED_RENDERERS) == set(ResponseFormat)
+
     @pytest.mark.asyncio
     async def test_blocked_returns_blocked_tasks(self):
         """Test that blocked returns tasks with dependencies."""
@@ -1937,6 +2955,14 @@ class TestDependenciesInput:
         assert input_model.direction == "both"
         assert input_model.depth == 3
 
+    def test_dependencies_task_id_uses_task_id_pattern(self):
+        """Test task_id is stripped and checked like every other task ID input."""
+        from taskwarrior_mcp import DependenciesInput
+
+        assert DependenciesInput(task_id=" 5 ").task_id == "5"
+        with pytest.raises(ValueError):
+            DependenciesInput(task_id="1-100")
+
 
 class TestTaskwarriorDependencies:
     """Tests for the taskwarrior_dependencies tool."""
@@ -1962,6 +2988,25 @@ class TestTaskwarriorDependencies:
             result = await taskwarrior_dependencies(params)
             assert "Dependency" in result or "dependency" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_dependencies_overview_ranks_bottlenecks(self):
+        """Test bottlenecks are ordered by how many pending tasks they block."""
+        from taskwarrior_mcp import DependenciesInput, taskwarrior_dependencies
+
+        tasks = [
+            {"id": 1, "uuid": "uuid1", "description": "Blocks one", "status": "pending"},
+            {"id": 2, "uuid": "uuid2", "description": "Blocks two", "status": "pending"},
+            {"id": 3, "uuid": "uuid3", "description": "A", "status": "pending", "depends": "uuid1,uuid2"},
+            {"id": 4, "uuid": "uuid4", "description": "B", "status": "pending", "depends": "uuid2"},
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            params = DependenciesInput(response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_dependencies(params))
+            assert [(b["task"]["id"], b["blocks_count"]) for b in data["bottlenecks"]] == [(2, 2), (1, 1)]
+            assert data["blocked"] == [3, 4]
+            assert data["ready"] == [1, 2]
+
     @pytest.mark.asyncio
     async def test_dependencies_specific_task(self):
         """Test dependencies for a specific task."""
@@ -1990,6 +3035,40 @@ class TestTaskwarriorDependencies:
             result = await taskwarrior_dependencies(params)
             assert "Blocker" in result or "#1" in result
 
+    @pytest.mark.asyncio
+    async def test_dependencies_specific_task_fetches_completed_blockers(self):
+        """Test dependencies reads pending tasks and exports only missing blockers by UUID."""
+        from taskwarrior_mcp import DependenciesInput, taskwarrior_dependencies
+
+        target = {
+            "id": 2,
+            "uuid": "uuid2",
+            "description": "Waiting",
+            "status": "pending",
+            "depends": "uuid1,uuid9",
+        }
+        pending = [{"id": 1, "uuid": "uuid1", "description": "Blocker", "status": "pending"}, target]
+        done = [{"id": 0, "uuid": "uuid9", "description": "Finished", "status": "completed"}]
+
+        def run(cmd, **kwargs):
+            if "status:pending" in cmd:
+                stdout = pending
+            elif cmd[1] == "2":
+                stdout = [target]
+            else:
+                stdout = done
+            return MagicMock(returncode=0, stdout=json.dumps(stdout), stderr="")
+
+        with patch("subprocess.run", side_effect=run) as mock_run:
+            params = DependenciesInput(task_id="2", response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_dependencies(params))
+            assert [b["uuid"] for b in data["blocked_by"]] == ["uuid1", "uuid9"]
+            assert data["ready"] is False
+            exports = [c.args[0] for c in mock_run.call_args_list]
+            assert ["task", "uuid9", "rc.json.array=on", "export"] in exports
+            # The whole task history is never exported
+            assert all(cmd[1] != "rc.json.array=on" for cmd in exports)
+
     @pytest.mark.asyncio
     async def test_dependencies_json_format(self):
         """Test dependencies returns valid JSON."""
@@ -2105,6 +3184,34 @@ class TestTaskwarriorTriage:
             data = json.loads(result)
             assert "stale" in data or "no_project" in data or "untagged" in data
 
+    def test_stale_threshold_boundary(self):
+        """Test a task modified exactly `stale_days` ago is stale and one a second later is not."""
+        from datetime import datetime, timezone
+
+        from taskwarrior_mcp.tools.intelligence import _is_task_stale, _stale_threshold
+
+        threshold = _stale_threshold(14, datetime(2025, 2, 14, 12, 0, 0, tzinfo=timezone.utc))
+        assert threshold == "20250131T120000Z"
+        assert _is_task_stale(TaskModel(modified="20250131T120000Z"), threshold)
+        assert not _is_task_stale(TaskModel(modified="20250131T120001Z"), threshold)
+        assert _is_task_stale(TaskModel(entry="20250101T000000Z"), threshold)
+        assert _is_task_stale(TaskModel(), threshold)
+
+    @pytest.mark.asyncio
+    async def test_triage_caps_each_category(self, tasks_for_triage):
+        """Test each category holds at most `limit` tasks, in export order."""
+        from taskwarrior_mcp import TriageInput, taskwarrior_triage
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks_for_triage), stderr="")
+            params = TriageInput(limit=1, response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_triage(params))
+            assert [t["id"] for t in data["stale"]] == [1]
+            assert [t["id"] for t in data["no_project"]] == [1]
+            assert [t["id"] for t in data["untagged"]] == [1]
+            assert [t["id"] for t in data["no_due"]] == [1]
+            assert data["total_pending"] == 4
+
     @pytest.mark.asyncio
     async def test_triage_empty_when_all_good(self):
         """Test triage when all tasks are well-organized."""
@@ -2196,6 +3303,22 @@ class TestTaskwarriorContext:
             result = await taskwarrior_context(params)
             assert "not found" in result.lower() or "error" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_context_counts_blocked_tasks_by_exact_uuid(self):
+        """Test the blocks count only includes tasks depending on this task's full UUID."""
+        from taskwarrior_mcp import ContextInput, taskwarrior_context
+
+        tasks = [
+            {"id": 1, "uuid": "aaaa-1111", "description": "Blocker", "status": "pending"},
+            {"id": 2, "uuid": "bbbb-2222", "description": "Waits", "status": "pending", "depends": "aaaa-1111"},
+            {"id": 3, "uuid": "cccc-3333", "description": "Other", "status": "pending", "depends": "aaaa-11112"},
+        ]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(tasks), stderr="")
+            params = ContextInput(task_id="1", response_format=ResponseFormat.JSON)
+            data = json.loads(await taskwarrior_context(params))
+            assert data["computed"]["dependency_status"] == "Blocks 1 task(s)"
+
 
 # ============================================================================
 # Internal Pydantic Model Tests
@@ -2272,6 +3395,23 @@ class TestTaskModel:
         assert task.depends == "uuid1,uuid2"
         assert len(task.annotations) == 1
 
+    def test_task_model_depends_uuids(self):
+        """Test depends is parsed into a tuple of UUIDs that stays out of serialized output."""
+        task = TaskModel(id=1, depends="uuid-1, uuid-2,")
+        assert task.depends_uuids == ("uuid-1", "uuid-2")
+        assert "depends_uuids" not in task.model_dump()
+        assert TaskModel(id=2).depends_uuids == ()
+
+    def test_task_model_depends_uuids_parsed_once(self):
+        """Test depends is split once per task and survives the copy made by dependency enrichment."""
+        from taskwarrior_mcp import _enrich_task_dependencies
+
+        task = TaskModel(id=1, uuid="aaaa", depends="uuid-1")
+        first = task.depends_uuids
+        assert task.depends_uuids is first
+        enriched = _enrich_task_dependencies(task, {})
+        assert enriched.depends_uuids is first
+
     def test_task_model_from_dict(self):
         """Test creating TaskModel from dict (like Taskwarrior JSON output)."""
         data = {
@@ -2307,20 +3447,27 @@ class TestTaskModel:
         assert task.annotations[0].description == "First note"
         assert task.annotations[1].description == "Second note"
 
-    def test_task_model_allows_extra_fields(self):
-        """Test that TaskModel allows extra fields from Taskwarrior."""
+    def test_task_model_keeps_extra_fields_under_extra(self):
+        """Test that parsed Taskwarrior attributes without a field are kept in `extra`."""
         data = {
             "id": 1,
             "description": "Test",
             "custom_field": "custom_value",
             "another_field": 123,
         }
-        task = TaskModel.model_validate(data)
+        task = _parse_task(data)
         assert task.id == 1
         assert task.description == "Test"
         # Extra fields should be preserved
-        assert task.model_extra.get("custom_field") == "custom_value"
-        assert task.model_extra.get("another_field") == 123
+        assert task.extra == {"custom_field": "custom_value", "another_field": 123}
+        # and serialized back at the top level, as Taskwarrior exports them
+        dumped = task.model_dump()
+        assert "extra" not in dumped
+        assert dumped["custom_field"] == "custom_value"
+        assert json.loads(task.model_dump_json())["another_field"] == 123
+        assert "extra" not in TaskModel(id=2).model_dump()
+        # Validating the raw dict directly ignores them
+        assert TaskModel.model_validate(data).extra == {}
 
     def test_task_model_to_dict(self):
         """Test converting TaskModel back to dict."""
@@ -2470,6 +3617,18 @@ class TestDependencyEnrichment:
         assert len(enriched.depends_on) == 0  # Missing UUID is skipped
         assert enriched.blocked_by_pending == 0
 
+    def test_enrich_task_dependencies_leaves_input_untouched(self):
+        """Test enrichment returns a copy so shared (cached) tasks are not mutated."""
+        from taskwarrior_mcp import _enrich_task_dependencies
+
+        blocker = TaskModel(id=1, uuid="blocker-uuid", description="Blocker", status="pending")
+        task = TaskModel(id=2, uuid="task-uuid", description="Blocked", depends="blocker-uuid")
+
+        enriched = _enrich_task_dependencies(task, {"blocker-uuid": blocker})
+        assert enriched.blocked_by_pending == 1
+        assert task.depends_on == []
+        assert task.blocked_by_pending == 0
+
     def test_enrich_tasks_dependencies_batch(self):
         """Test batch enrichment of multiple tasks."""
         from taskwarrior_mcp import _enrich_tasks_dependencies
@@ -2520,6 +3679,17 @@ class TestScoredTask:
         assert scored.score == 50.0
         assert scored.reasons == ["Overdue"]
 
+    def test_score_tasks_matches_validated_model(self):
+        """Test unvalidated scoring results serialize like validated ScoredTasks."""
+        from taskwarrior_mcp.tools.intelligence import _score_tasks
+        from taskwarrior_mcp.utils.index import _build_task_index
+
+        tasks = [TaskModel(id=1, uuid="uuid-1", description="Urgent", priority="H", urgency=9.0)]
+        (scored,) = _score_tasks(_build_task_index(tasks))
+        validated = ScoredTask(task=scored.task, score=scored.score, reasons=scored.reasons, flags=scored.flags)
+        assert scored.model_dump() == validated.model_dump()
+        assert "flags" not in scored.model_dump()
+
 
 class TestBlockedTaskInfo:
     """Tests for the BlockedTaskInfo model."""
@@ -2615,7 +3785,74 @@ class TestParseTask:
             "imask": 1,
         }
         task = _parse_task(data)
-        assert task.model_extra.get("recur") == "weekly"
+        assert task.extra == {"recur": "weekly", "imask": 1}
+
+
+class TestParseTaskFast:
+    """Tests for the non-validating _parse_task_fast helper."""
+
+    def test_parse_task_fast_interns_repeated_values(self):
+        """Test repeated project, status and tag values share one string object."""
+        first = _parse_task_fast(json.loads('{"id": 1, "status": "pending", "project": "work", "tags": ["next"]}'))
+        second = _parse_task_fast(json.loads('{"id": 2, "status": "pending", "project": "work", "tags": ["next"]}'))
+        assert first.project is second.project
+        assert first.status is second.status
+        assert first.tags[0] is second.tags[0]
+
+    def test_parse_task_fast_interns_dependency_uuids(self):
+        """Test a task's UUID is the same object as the dependency UUID that refers to it."""
+        blocker = _parse_task_fast(json.loads('{"id": 1, "uuid": "abc-123"}'))
+        blocked = _parse_task_fast(json.loads('{"id": 2, "uuid": "def-456", "depends": ["abc-123"]}'))
+        assert blocked.depends_uuids[0] is blocker.uuid
+
+    def test_parse_task_fast_keeps_depends_array_split(self):
+        """Test an exported depends array fills depends_uuids without re-splitting the joined string."""
+        task = _parse_task_fast({"id": 1, "depends": ["abc-123", "def-456"]})
+        assert task.__dict__["depends_uuids"] == ("abc-123", "def-456")
+        assert task.depends == "abc-123,def-456"
+        assert task == _parse_task({"id": 1, "depends": ["abc-123", "def-456"]})
+
+    def test_parse_task_fast_matches_validated_parse(self, sample_task):
+        """Test fast parsing yields the same model as validated parsing."""
+        assert _parse_task_fast(sample_task) == _parse_task(sample_task)
+
+    def test_parse_task_fast_builds_annotations(self):
+        """Test annotations become TaskAnnotation instances."""
+        task = _parse_task_fast(
+            {"id": 1, "annotations": [{"entry": "20250130T100000Z", "description": "Note 1"}]},
+        )
+        assert isinstance(task.annotations[0], TaskAnnotation)
+        assert task.annotations[0].description == "Note 1"
+
+    def test_parse_task_fast_normalizes_values(self):
+        """Test integer urgency and array-form depends are normalized."""
+        task = _parse_task_fast({"id": 1, "urgency": 3, "depends": ["uuid-1", "uuid-2"], "recur": "weekly"})
+        assert task.urgency == 3.0
+        assert isinstance(task.urgency, float)
+        assert task.depends == "uuid-1,uuid-2"
+        assert task.extra == {"recur": "weekly"}
+        assert task.tags == []
+
+    def test_parse_task_accepts_array_depends(self):
+        """Test validated parsing accepts the Taskwarrior 2.6+ depends array."""
+        task = _parse_task({"id": 1, "depends": ["uuid-1", "uuid-2"]})
+        assert task.depends == "uuid-1,uuid-2"
+
+
+class TestParseTimestamp:
+    """Tests for the _parse_timestamp helper."""
+
+    def test_parse_timestamp(self):
+        """Test a Taskwarrior timestamp becomes an aware UTC datetime."""
+        from datetime import datetime, timezone
+
+        assert _parse_timestamp("20250130T103045Z") == datetime(2025, 1, 30, 10, 30, 45, tzinfo=timezone.utc)
+
+    def test_parse_timestamp_invalid(self):
+        """Test malformed timestamps raise ValueError."""
+        for value in ("", "2025-01-30", "20250130X103045Z", "20251330T103045Z"):
+            with pytest.raises(ValueError):
+                _parse_timestamp(value)
 
 
 class TestParseTasks:
@@ -2639,6 +3876,34 @@ class TestParseTasks:
         assert tasks[0].id == 1
         assert tasks[2].urgency == 8.0
 
+    @pytest.mark.asyncio
+    async def test_parse_tasks_async(self):
+        """Test parsing on the CPU pool matches synchronous parsing."""
+        data = [
+            {"id": 1, "description": "Task 1", "urgency": 5.0},
+            {"id": 2, "description": "Task 2", "urgency": 3.0},
+        ]
+        tasks = await parse_tasks_async(data)
+        assert tasks == _parse_tasks(data)
+
+    def test_parse_tasks_with_fields(self):
+        """Test that only the requested attributes are kept."""
+        data = [
+            {
+                "id": 1,
+                "description": "Task 1",
+                "project": "work",
+                "annotations": [{"entry": "20250130T100000Z", "description": "Note"}],
+                "recur": "weekly",
+            },
+        ]
+        tasks = _parse_tasks(data, frozenset({"id", "project"}))
+        assert tasks[0].id == 1
+        assert tasks[0].project == "work"
+        assert tasks[0].description == ""
+        assert tasks[0].annotations == []
+        assert tasks[0].extra == {}
+
 
 # ============================================================================
 # Tests verifying TaskModel compatibility with existing functions